@@ -48,3 +48,25 @@ class AssetRole(Enum):
 
 
 DEFAULT_PRESIGNED_URL_EXPIRY = 3600
+DEFAULT_PRESIGNED_GET_URL_EXPIRY = 900
+
+# S3 DeleteObjects accepts at most this many keys per request
+S3_DELETE_OBJECTS_MAX_KEYS = 1000
+
+# Presigned upload sessions older than this are garbage collected
+UPLOAD_SESSION_GC_AGE_HOURS = 24
+
+# Cached presigned URLs are only reused while they stay valid this much longer
+PRESIGNED_URL_SAFETY_MARGIN = 60
+
+# Only the leading bytes of an image are fetched to read EXIF. A JPEG APP1
+# segment is capped at 64 KiB and PNG writers place eXIf before the image data.
+# WebP and HEIC store EXIF after the image data, so they are not supported.
+EXIF_HEADER_BYTES = 64 * 1024
+
+EXIF_SUPPORTED_MIMES = frozenset(
+    [
+        'image/jpeg',
+        'image/png',
+    ],
+)
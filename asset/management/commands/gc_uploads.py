@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from asset.constants import (
+    DEFAULT_PRESIGNED_URL_EXPIRY,
+    UPLOAD_SESSION_GC_AGE_HOURS,
+)
+from asset.services.garbage_collection import (
+    DEFAULT_GC_BATCH_SIZE,
+    collect_expired_uploads,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete upload sessions that were presigned but never completed, '
+        'together with their inactive assets and stored objects.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-hours',
+            type=float,
+            default=UPLOAD_SESSION_GC_AGE_HOURS,
+            help='Minimum session age in hours.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_GC_BATCH_SIZE,
+            help='Sessions deleted per batch.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be deleted without deleting anything.',
+        )
+
+    def handle(self, *args, **options):
+        older_than = timedelta(hours=options['older_than_hours'])
+        if older_than.total_seconds() <= DEFAULT_PRESIGNED_URL_EXPIRY:
+            raise CommandError(
+                '--older-than-hours must exceed the presigned upload expiry '
+                f'({DEFAULT_PRESIGNED_URL_EXPIRY // 3600}h)',
+            )
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+
+        report = collect_expired_uploads(
+            older_than=older_than,
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+        )
+
+        if report.dry_run:
+            self.stdout.write(
+                f'Would delete {report.sessions} upload sessions, '
+                f'{report.assets} assets and up to {report.objects} objects',
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Deleted {report.sessions} upload sessions, '
+                    f'{report.assets} assets and {report.objects} objects '
+                    f'in {report.batches} batches',
+                ),
+            )
@@ -0,0 +1,37 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("asset", "0002_alter_uploadsession_status_and_more"),
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="asset",
+            name="client",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="assets",
+                to="user.client",
+            ),
+        ),
+        # Indexed in the next migration: updating rows here leaves deferred
+        # foreign key checks pending, which block further DDL on the table
+        migrations.RunSQL(
+            sql="""
+                UPDATE asset_asset asset
+                SET client_id = session.client_id
+                FROM asset_uploadsession session
+                WHERE asset.upload_session_id = session.id
+                    AND asset.client_id IS NULL;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
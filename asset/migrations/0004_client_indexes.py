@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("asset", "0003_asset_client"),
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(
+                fields=["client", "created_at"], name="asset_asset_client__375986_idx"
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ import uuid
 from django.db import models
 from core.models import TimeStampedModel
 from asset.constants import StorageProvider
+from user.models import Client
 
 
 class Asset(TimeStampedModel):
@@ -15,6 +16,16 @@ class Asset(TimeStampedModel):
         related_name='assets',
     )
 
+    # Denormalized from upload_session.client for join-free ownership filters
+    client = models.ForeignKey(
+        Client,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='assets',
+        db_index=False,
+    )
+
     is_active = models.BooleanField(default=True)
 
     storage_provider = models.CharField(max_length=32)
@@ -34,6 +45,7 @@ class Asset(TimeStampedModel):
             models.Index(fields=['storage_provider', 'storage_key']),
             models.Index(fields=['checksum']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['client', 'created_at']),
             models.Index(fields=['exif_captured_at']),
             models.Index(fields=['is_active']),
         ]
@@ -45,3 +57,8 @@ class Asset(TimeStampedModel):
                 name='asset_asset_storage_provider_valid',
             ),
         ]
+
+    def save(self, *args, **kwargs):
+        if self.client_id is None and self.upload_session_id is not None:
+            self.client_id = self.upload_session.client_id
+        return super().save(*args, **kwargs)
@@ -0,0 +1,224 @@
+import logging
+import math
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from PIL import ExifTags, Image, TiffImagePlugin
+
+from asset.constants import EXIF_HEADER_BYTES, EXIF_SUPPORTED_MIMES
+from asset.exceptions import S3Error
+from asset.services.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+JPEG_SOI = b'\xff\xd8'
+JPEG_EXIF_PREFIX = b'Exif\x00\x00'
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+EXIF_DATETIME_FORMAT = '%Y:%m:%d %H:%M:%S'
+
+# (datetime tag, matching UTC offset tag), in order of preference
+CAPTURE_TIME_TAGS = [
+    (ExifTags.Base.DateTimeOriginal, ExifTags.Base.OffsetTimeOriginal),
+    (ExifTags.Base.DateTimeDigitized, ExifTags.Base.OffsetTimeDigitized),
+    (ExifTags.Base.DateTime, ExifTags.Base.OffsetTime),
+]
+
+# IFD pointers and opaque blobs are not useful once decoded
+EXCLUDED_TAGS = frozenset(
+    [
+        ExifTags.Base.ExifOffset,
+        ExifTags.Base.GPSInfo,
+        ExifTags.Base.ExifInteroperabilityOffset,
+        ExifTags.Base.MakerNote,
+    ],
+)
+
+
+@dataclass(frozen=True)
+class ExifMetadata:
+    data: dict
+    captured_at: datetime | None = None
+
+    @property
+    def orientation(self) -> int | None:
+        return self.data.get('Orientation')
+
+
+def _find_jpeg_exif(header: bytes) -> bytes | None:
+    """Return the APP1 Exif payload of a JPEG, scanning markers up to SOS."""
+    offset = len(JPEG_SOI)
+    while offset + 4 <= len(header):
+        if header[offset] != 0xFF:
+            return None
+
+        marker = header[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            offset += 1
+            continue
+        if marker in (0xD9, 0xDA):
+            # EOI / SOS: no metadata segments follow
+            return None
+        if 0xD0 <= marker <= 0xD7 or marker == 0x01:
+            # Standalone markers carry no length
+            offset += 2
+            continue
+
+        (length,) = struct.unpack('>H', header[offset + 2 : offset + 4])
+        segment = header[offset + 4 : offset + 2 + length]
+        if marker == 0xE1 and segment.startswith(JPEG_EXIF_PREFIX):
+            return segment
+        offset += 2 + length
+
+    return None
+
+
+def _find_png_exif(header: bytes) -> bytes | None:
+    """Return the eXIf chunk of a PNG, scanning chunks up to the image data."""
+    offset = len(PNG_SIGNATURE)
+    while offset + 8 <= len(header):
+        length, chunk_type = struct.unpack(
+            '>I4s',
+            header[offset : offset + 8],
+        )
+        if chunk_type == b'eXIf':
+            return header[offset + 8 : offset + 8 + length]
+        if chunk_type in (b'IDAT', b'IEND'):
+            return None
+        # length + type + data + crc
+        offset += 12 + length
+
+    return None
+
+
+def find_exif_payload(header: bytes) -> bytes | None:
+    """Locate the raw EXIF payload within the leading bytes of an image."""
+    if header.startswith(JPEG_SOI):
+        return _find_jpeg_exif(header)
+    if header.startswith(PNG_SIGNATURE):
+        return _find_png_exif(header)
+    return None
+
+
+def _to_json_value(value):
+    """Convert a decoded EXIF value to a JSON-safe value, or None to skip."""
+    if isinstance(value, str):
+        # Postgres jsonb rejects NUL characters, which EXIF pads strings with
+        value = value.replace('\x00', '').strip()
+        return value or None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, (float, TiffImagePlugin.IFDRational)):
+        try:
+            value = float(value)
+        except ZeroDivisionError:
+            return None
+        return value if math.isfinite(value) else None
+    if isinstance(value, tuple):
+        items = [_to_json_value(item) for item in value]
+        return items if None not in items else None
+    return None
+
+
+def _parse_captured_at(tags: dict) -> datetime | None:
+    """
+    Parse the capture time from EXIF tags.
+
+    EXIF timestamps are local wall-clock time. The matching OffsetTime* tag
+    is applied when present, otherwise the timestamp is assumed to be UTC.
+    """
+    for datetime_tag, offset_tag in CAPTURE_TIME_TAGS:
+        raw = tags.get(datetime_tag)
+        if not isinstance(raw, str):
+            continue
+
+        try:
+            captured_at = datetime.strptime(
+                raw.replace('\x00', '').strip(),
+                EXIF_DATETIME_FORMAT,
+            )
+        except ValueError:
+            continue
+
+        tzinfo = timezone.utc
+        raw_offset = tags.get(offset_tag)
+        if isinstance(raw_offset, str):
+            try:
+                parsed = datetime.strptime(raw_offset.strip(), '%z')
+                tzinfo = parsed.tzinfo or timezone.utc
+            except ValueError:
+                pass
+
+        return captured_at.replace(tzinfo=tzinfo)
+
+    return None
+
+
+def parse_exif(header: bytes) -> ExifMetadata | None:
+    """
+    Parse EXIF metadata from the leading bytes of a JPEG or PNG image.
+
+    Only IFD0 and the Exif sub-IFD are kept; GPS data is deliberately
+    dropped. Returns None if the bytes contain no readable EXIF.
+    """
+    payload = find_exif_payload(header)
+    if not payload:
+        return None
+
+    exif = Image.Exif()
+    try:
+        exif.load(payload)
+        tags = {**dict(exif), **exif.get_ifd(ExifTags.IFD.Exif)}
+    except (SyntaxError, ValueError, OSError, struct.error) as e:
+        logger.info('Failed to parse EXIF payload: %s', e)
+        return None
+
+    data = {}
+    for tag_id, value in tags.items():
+        name = ExifTags.TAGS.get(tag_id)
+        if name is None or tag_id in EXCLUDED_TAGS:
+            continue
+        json_value = _to_json_value(value)
+        if json_value is not None:
+            data[name] = json_value
+
+    if not data:
+        return None
+
+    return ExifMetadata(data=data, captured_at=_parse_captured_at(tags))
+
+
+def extract_exif(
+    *,
+    storage: StorageBackend,
+    bucket_name: str,
+    object_name: str,
+    mime_type: str,
+) -> ExifMetadata | None:
+    """
+    Read EXIF metadata for a stored image without downloading all of it.
+
+    Fetches only the first EXIF_HEADER_BYTES with a ranged GET. Extraction is
+    best-effort: unsupported types, missing EXIF and storage errors all
+    return None so that they never block completing an upload.
+    """
+    if mime_type not in EXIF_SUPPORTED_MIMES:
+        return None
+
+    try:
+        header = storage.get_object_range(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            start=0,
+            end=EXIF_HEADER_BYTES - 1,
+        )
+    except S3Error as e:
+        logger.warning('Failed to read EXIF header for %s: %s', object_name, e)
+        return None
+
+    if not header:
+        return None
+
+    return parse_exif(header)
@@ -0,0 +1,144 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from asset.constants import S3_DELETE_OBJECTS_MAX_KEYS, UploadStatus
+from asset.models import Asset, UploadSession
+from asset.services.storage import delete_stored_objects
+
+logger = logging.getLogger(__name__)
+
+# One DeleteObjects call per batch
+DEFAULT_GC_BATCH_SIZE = S3_DELETE_OBJECTS_MAX_KEYS
+
+# Sessions in these states never completed. FAILED sessions are ones a
+# previous run claimed but did not finish deleting.
+COLLECTABLE_STATUSES = [
+    UploadStatus.PRESIGNED.value,
+    UploadStatus.FAILED.value,
+]
+
+
+@dataclass
+class UploadGCReport:
+    sessions: int = 0
+    assets: int = 0
+    objects: int = 0
+    batches: int = 0
+    dry_run: bool = False
+
+
+def _expired_sessions(cutoff: datetime):
+    # Served by the upload session status and created_at indexes
+    return UploadSession.objects.filter(
+        status__in=COLLECTABLE_STATUSES,
+        created_at__lt=cutoff,
+    ).order_by('created_at')
+
+
+def _orphaned_assets(session_ids):
+    return Asset.objects.filter(
+        upload_session_id__in=session_ids,
+        is_active=False,
+        refs__isnull=True,
+    )
+
+
+def _claim_batch(cutoff: datetime, batch_size: int) -> list:
+    """
+    Mark a batch of expired sessions FAILED and return their ids.
+
+    Locked rows are skipped, so concurrent collectors never share a batch,
+    and complete_upload rejects claimed sessions from then on.
+    """
+    with transaction.atomic():
+        session_ids = list(
+            _expired_sessions(cutoff)
+            .select_for_update(skip_locked=True)
+            .values_list('id', flat=True)[:batch_size],
+        )
+        if session_ids:
+            UploadSession.objects.filter(id__in=session_ids).update(
+                status=UploadStatus.FAILED.value,
+                updated_at=timezone.now(),
+            )
+    return session_ids
+
+
+def collect_expired_uploads(
+    *,
+    older_than: timedelta,
+    batch_size: int = DEFAULT_GC_BATCH_SIZE,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> UploadGCReport:
+    """
+    Delete upload sessions that never completed, with their inactive assets
+    and any objects uploaded for them.
+
+    Work is done in batches of `batch_size` sessions. Each batch is claimed
+    in one short transaction, its objects are removed from storage with
+    batched deletes, and its rows are removed in a second short transaction,
+    so no lock is held while talking to storage.
+
+    Objects are deleted before rows: if storage fails, the claimed sessions
+    stay FAILED and are retried on the next run.
+
+    Args:
+        older_than: Minimum session age. Must exceed the presigned PUT
+            expiry so that no upload can still be in flight.
+        batch_size: Sessions per batch.
+        dry_run: Only count what would be collected.
+        now: Reference time (defaults to the current time).
+
+    Returns:
+        UploadGCReport with counts of collected (or collectable) rows.
+    """
+    cutoff = (now or timezone.now()) - older_than
+    report = UploadGCReport(dry_run=dry_run)
+
+    if dry_run:
+        sessions = _expired_sessions(cutoff).order_by()
+        report.sessions = sessions.count()
+        report.assets = _orphaned_assets(sessions.values('id')).count()
+        report.objects = report.assets
+        return report
+
+    while True:
+        session_ids = _claim_batch(cutoff, batch_size)
+        if not session_ids:
+            break
+
+        assets = list(
+            _orphaned_assets(session_ids).values_list(
+                'id',
+                'storage_provider',
+                'storage_key',
+            ),
+        )
+        report.objects += delete_stored_objects(
+            [(provider, key) for _, provider, key in assets],
+        )
+
+        with transaction.atomic():
+            report.assets += Asset.objects.filter(
+                id__in=[asset_id for asset_id, _, _ in assets],
+            ).delete()[0]
+            report.sessions += UploadSession.objects.filter(
+                id__in=session_ids,
+            ).delete()[0]
+
+        report.batches += 1
+        logger.info(
+            'Collected %d upload sessions and %d assets',
+            len(session_ids),
+            len(assets),
+        )
+
+        if len(session_ids) < batch_size:
+            break
+
+    return report
@@ -0,0 +1,205 @@
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+
+from asset.constants import (
+    DEFAULT_PRESIGNED_GET_URL_EXPIRY,
+    PRESIGNED_URL_SAFETY_MARGIN,
+)
+from asset.services.s3 import generate_presigned_get_url
+
+# (bucket, object, operation, expiration)
+CacheKey = tuple[str, str, str, int]
+
+
+@dataclass(frozen=True)
+class CachedUrl:
+    url: str
+    # Wall-clock epoch seconds, so entries are comparable across processes
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class PresignedUrlCacheStats:
+    hits: int
+    shared_hits: int
+    misses: int
+    size: int
+
+
+class PresignedUrlCache:
+    """
+    Cache of presigned URLs keyed by (bucket, key, operation, expiration).
+
+    Lookups go to a per-process LRU first, then to an optional shared Django
+    cache. A URL is only handed back while it stays valid for at least
+    `safety_margin` more seconds, so callers always get time to use it.
+    Callers asking for different lifetimes never share a URL, so a long
+    lifetime is not answered with a URL signed for a short one.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        safety_margin: int = PRESIGNED_URL_SAFETY_MARGIN,
+        shared_cache_alias: str | None = None,
+    ):
+        self.max_entries = max_entries
+        self.safety_margin = safety_margin
+        self.shared_cache_alias = shared_cache_alias
+
+        self._entries: OrderedDict[CacheKey, CachedUrl] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @property
+    def shared_cache(self):
+        if self.shared_cache_alias is None:
+            return None
+        return caches[self.shared_cache_alias]
+
+    @staticmethod
+    def shared_key(key: CacheKey) -> str:
+        # Object keys can exceed backend key limits or contain spaces
+        digest = hashlib.sha256(
+            '\0'.join(map(str, key)).encode(),
+        ).hexdigest()
+        return f'presigned-url:{digest}'
+
+    def _is_fresh(self, entry: CachedUrl, now: float) -> bool:
+        return entry.expires_at - self.safety_margin > now
+
+    def _get_local(
+        self,
+        key: CacheKey,
+        now: float,
+    ) -> CachedUrl | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not self._is_fresh(entry, now):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set_local(self, key: CacheKey, entry: CachedUrl) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_sign(
+        self,
+        *,
+        bucket_name: str,
+        object_name: str,
+        operation: str,
+        expiration: int,
+        sign: Callable[[], str],
+    ) -> str:
+        """
+        Return a cached URL for the object, or sign and cache a new one.
+
+        `sign` must produce a URL valid for `expiration` seconds. URLs whose
+        lifetime does not exceed the safety margin are never cached.
+        """
+        key = (bucket_name, object_name, operation, expiration)
+        now = time.time()
+
+        entry = self._get_local(key, now)
+        if entry is not None:
+            self.hits += 1
+            return entry.url
+
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            entry = shared_cache.get(self.shared_key(key))
+            if entry is not None and self._is_fresh(entry, now):
+                self.shared_hits += 1
+                self._set_local(key, entry)
+                return entry.url
+
+        self.misses += 1
+        url = sign()
+
+        ttl = expiration - self.safety_margin
+        if ttl > 0:
+            entry = CachedUrl(url=url, expires_at=now + expiration)
+            self._set_local(key, entry)
+            if shared_cache is not None:
+                shared_cache.set(self.shared_key(key), entry, timeout=ttl)
+
+        return url
+
+    def invalidate(
+        self,
+        *,
+        bucket_name: str,
+        object_name: str,
+        operation: str,
+        expiration: int,
+    ) -> None:
+        key = (bucket_name, object_name, operation, expiration)
+        with self._lock:
+            self._entries.pop(key, None)
+
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            shared_cache.delete(self.shared_key(key))
+
+    def clear(self) -> None:
+        """Drop local entries and reset counters (shared cache untouched)."""
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def stats(self) -> PresignedUrlCacheStats:
+        return PresignedUrlCacheStats(
+            hits=self.hits,
+            shared_hits=self.shared_hits,
+            misses=self.misses,
+            size=len(self._entries),
+        )
+
+
+@functools.cache
+def get_presigned_url_cache() -> PresignedUrlCache:
+    """Process-wide cache configured from settings."""
+    return PresignedUrlCache(
+        max_entries=settings.PRESIGNED_URL_CACHE_MAX_ENTRIES,
+        shared_cache_alias=settings.PRESIGNED_URL_CACHE_ALIAS,
+    )
+
+
+def get_cached_presigned_get_url(
+    bucket_name: str,
+    object_name: str,
+    expiration: int = DEFAULT_PRESIGNED_GET_URL_EXPIRY,
+) -> str:
+    """Presigned GET URL, signed at most once per validity window."""
+    return get_presigned_url_cache().get_or_sign(
+        bucket_name=bucket_name,
+        object_name=object_name,
+        operation='get_object',
+        expiration=expiration,
+        sign=lambda: generate_presigned_get_url(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            expiration=expiration,
+        ),
+    )
@@ -4,9 +4,14 @@ from dataclasses import dataclass
 import boto3
 from botocore.exceptions import ClientError
 
-from asset.constants import DEFAULT_PRESIGNED_URL_EXPIRY
+from asset.constants import (
+    DEFAULT_PRESIGNED_GET_URL_EXPIRY,
+    DEFAULT_PRESIGNED_URL_EXPIRY,
+    S3_DELETE_OBJECTS_MAX_KEYS,
+)
 from asset.exceptions import ModelDownloadError, S3Error
 from core.exceptions import catch_and_reraise
+from core.metrics import instrument_boto3_client
 from mahjong_api.settings import R2_ENDPOINT_URL
 
 
@@ -18,10 +23,12 @@ class S3ObjectMetadata:
 
 
 def get_s3_client():
-    return boto3.client(
-        's3',
-        endpoint_url=R2_ENDPOINT_URL,
-        region_name='auto',
+    return instrument_boto3_client(
+        boto3.client(
+            's3',
+            endpoint_url=R2_ENDPOINT_URL,
+            region_name='auto',
+        ),
     )
 
 
@@ -48,6 +55,107 @@ def head_object(
         ) from e
 
 
+def get_object_range(
+    bucket_name: str,
+    object_name: str,
+    start: int,
+    end: int,
+) -> bytes | None:
+    """
+    Read bytes [start, end] (inclusive) of an object with a ranged GET.
+
+    Returns None if the object does not exist. Objects shorter than the
+    requested range are returned whole.
+    """
+    s3_client = get_s3_client()
+    try:
+        response = s3_client.get_object(
+            Bucket=bucket_name,
+            Key=object_name,
+            Range=f'bytes={start}-{end}',
+        )
+        return response['Body'].read()
+    except ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code')
+        if error_code in ('404', 'NoSuchKey'):
+            return None
+        if error_code == 'InvalidRange':
+            return b''
+        raise S3Error(
+            message=f'Failed to read object range from S3: {e}',
+        ) from e
+
+
+def put_object(
+    bucket_name: str,
+    object_name: str,
+    body: bytes,
+    content_type: str,
+) -> None:
+    s3_client = get_s3_client()
+    with catch_and_reraise(
+        ClientError,
+        S3Error,
+        'Failed to put object to S3',
+    ):
+        s3_client.put_object(
+            Bucket=bucket_name,
+            Key=object_name,
+            Body=body,
+            ContentType=content_type,
+        )
+
+
+def delete_object(bucket_name: str, object_name: str) -> None:
+    s3_client = get_s3_client()
+    with catch_and_reraise(
+        ClientError,
+        S3Error,
+        'Failed to delete object from S3',
+    ):
+        s3_client.delete_object(Bucket=bucket_name, Key=object_name)
+
+
+def delete_objects(bucket_name: str, object_names: list[str]) -> int:
+    """
+    Delete objects with DeleteObjects, S3_DELETE_OBJECTS_MAX_KEYS per call.
+
+    Missing keys count as deleted. Returns the number of keys deleted.
+
+    Raises:
+        S3Error: If a request fails or any key could not be deleted.
+    """
+    s3_client = get_s3_client()
+    deleted = 0
+
+    for start in range(0, len(object_names), S3_DELETE_OBJECTS_MAX_KEYS):
+        batch = object_names[start : start + S3_DELETE_OBJECTS_MAX_KEYS]
+        with catch_and_reraise(
+            ClientError,
+            S3Error,
+            'Failed to delete objects from S3',
+        ):
+            response = s3_client.delete_objects(
+                Bucket=bucket_name,
+                Delete={
+                    'Objects': [{'Key': key} for key in batch],
+                    'Quiet': True,
+                },
+            )
+
+        errors = response.get('Errors', [])
+        if errors:
+            raise S3Error(
+                message=(
+                    f'Failed to delete {len(errors)} objects from S3, '
+                    f'first error: {errors[0]}'
+                ),
+            )
+        deleted += len(batch)
+
+    return deleted
+
+
 def generate_presigned_put_url(
     bucket_name: str,
     object_name: str,
@@ -74,7 +182,7 @@ def generate_presigned_put_url(
 def generate_presigned_get_url(
     bucket_name: str,
     object_name: str,
-    expiration: int = 900,
+    expiration: int = DEFAULT_PRESIGNED_GET_URL_EXPIRY,
 ) -> str:
     s3_client = get_s3_client()
     with catch_and_reraise(
@@ -0,0 +1,423 @@
+import functools
+import mimetypes
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from urllib.parse import quote, urlencode
+
+from django.conf import settings
+from django.core.signing import Signer
+from django.utils.crypto import constant_time_compare
+
+from asset.constants import (
+    DEFAULT_PRESIGNED_GET_URL_EXPIRY,
+    DEFAULT_PRESIGNED_URL_EXPIRY,
+    StorageProvider,
+)
+from asset.exceptions import S3Error
+from asset.services import s3
+from asset.services.presign_cache import get_cached_presigned_get_url
+from asset.services.s3 import S3ObjectMetadata
+
+
+class StorageBackend(ABC):
+    """
+    Object storage operations used by the upload and detection pipeline.
+
+    Keys are addressed as (bucket_name, object_name) for every backend, so
+    assets keep the same storage_key whichever backend stores them.
+    """
+
+    provider: StorageProvider
+
+    @abstractmethod
+    def generate_presigned_put_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        content_type: str,
+        expiration: int = DEFAULT_PRESIGNED_URL_EXPIRY,
+    ) -> str: ...
+
+    @abstractmethod
+    def generate_presigned_get_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expiration: int = DEFAULT_PRESIGNED_GET_URL_EXPIRY,
+        *,
+        cached: bool = True,
+    ) -> str:
+        """
+        URL to read the object. With `cached`, a URL signed earlier for the
+        same expiration may be returned, so it can have less than
+        `expiration` seconds left; pass False when the full lifetime
+        matters.
+        """
+
+    @abstractmethod
+    def head_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+    ) -> S3ObjectMetadata | None: ...
+
+    @abstractmethod
+    def get_object_range(
+        self,
+        bucket_name: str,
+        object_name: str,
+        start: int,
+        end: int,
+    ) -> bytes | None: ...
+
+    @abstractmethod
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        body: bytes,
+        content_type: str,
+    ) -> None: ...
+
+    @abstractmethod
+    def delete_object(self, bucket_name: str, object_name: str) -> None: ...
+
+    @abstractmethod
+    def delete_objects(
+        self,
+        bucket_name: str,
+        object_names: list[str],
+    ) -> int:
+        """Delete many objects, ignoring missing ones. Returns the count."""
+
+
+class S3StorageBackend(StorageBackend):
+    """S3-compatible storage (Cloudflare R2) via boto3."""
+
+    def __init__(self, provider: StorageProvider = StorageProvider.R2):
+        self.provider = provider
+
+    def generate_presigned_put_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        content_type: str,
+        expiration: int = DEFAULT_PRESIGNED_URL_EXPIRY,
+    ) -> str:
+        return s3.generate_presigned_put_url(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            content_type=content_type,
+            expiration=expiration,
+        )
+
+    def generate_presigned_get_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expiration: int = DEFAULT_PRESIGNED_GET_URL_EXPIRY,
+        *,
+        cached: bool = True,
+    ) -> str:
+        presign = (
+            get_cached_presigned_get_url
+            if cached
+            else s3.generate_presigned_get_url
+        )
+        return presign(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            expiration=expiration,
+        )
+
+    def head_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+    ) -> S3ObjectMetadata | None:
+        return s3.head_object(bucket_name=bucket_name, object_name=object_name)
+
+    def get_object_range(
+        self,
+        bucket_name: str,
+        object_name: str,
+        start: int,
+        end: int,
+    ) -> bytes | None:
+        return s3.get_object_range(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            start=start,
+            end=end,
+        )
+
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        body: bytes,
+        content_type: str,
+    ) -> None:
+        s3.put_object(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            body=body,
+            content_type=content_type,
+        )
+
+    def delete_object(self, bucket_name: str, object_name: str) -> None:
+        s3.delete_object(bucket_name=bucket_name, object_name=object_name)
+
+    def delete_objects(
+        self,
+        bucket_name: str,
+        object_names: list[str],
+    ) -> int:
+        return s3.delete_objects(
+            bucket_name=bucket_name,
+            object_names=object_names,
+        )
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Filesystem storage under LOCAL_STORAGE_ROOT for local development and
+    load testing.
+
+    Presigned URLs point at the local storage view and carry an HMAC
+    signature over (operation, bucket, key, expiry), mirroring the S3
+    presigned URL contract closely enough for clients and the detector.
+    """
+
+    provider = StorageProvider.LOCAL
+    signer_salt = 'asset.local-storage'
+
+    def __init__(
+        self,
+        root: str | os.PathLike | None = None,
+        base_url: str | None = None,
+    ):
+        self._root = root
+        self._base_url = base_url
+
+    @property
+    def root(self) -> Path:
+        return Path(self._root or settings.LOCAL_STORAGE_ROOT).resolve()
+
+    @property
+    def base_url(self) -> str:
+        return (self._base_url or settings.LOCAL_STORAGE_BASE_URL).rstrip('/')
+
+    def path(self, bucket_name: str, object_name: str) -> Path:
+        """Resolve an object path, refusing keys that escape the bucket."""
+        root = self.root
+        bucket_root = (root / bucket_name).resolve()
+        path = (bucket_root / object_name).resolve()
+        if (
+            bucket_root.parent != root
+            or path == bucket_root
+            or not path.is_relative_to(bucket_root)
+        ):
+            raise S3Error(message=f'Invalid object key: {object_name}')
+        return path
+
+    @classmethod
+    def _signature(
+        cls,
+        operation: str,
+        bucket_name: str,
+        object_name: str,
+        expires: int,
+    ) -> str:
+        value = f'{operation}:{bucket_name}:{object_name}:{expires}'
+        return Signer(salt=cls.signer_salt).signature(value)
+
+    @classmethod
+    def verify_signature(
+        cls,
+        *,
+        operation: str,
+        bucket_name: str,
+        object_name: str,
+        expires: str,
+        signature: str,
+    ) -> bool:
+        try:
+            expires_at = int(expires)
+        except (TypeError, ValueError):
+            return False
+        if expires_at < time.time():
+            return False
+
+        expected = cls._signature(
+            operation, bucket_name, object_name, expires_at
+        )
+        return constant_time_compare(expected, signature)
+
+    def _presign(
+        self,
+        operation: str,
+        bucket_name: str,
+        object_name: str,
+        expiration: int,
+    ) -> str:
+        expires = int(time.time()) + expiration
+        query = urlencode(
+            {
+                'op': operation,
+                'expires': expires,
+                'signature': self._signature(
+                    operation,
+                    bucket_name,
+                    object_name,
+                    expires,
+                ),
+            },
+        )
+        path = quote(f'{bucket_name}/{object_name}')
+        return f'{self.base_url}/asset/local/{path}?{query}'
+
+    def generate_presigned_put_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        content_type: str,
+        expiration: int = DEFAULT_PRESIGNED_URL_EXPIRY,
+    ) -> str:
+        return self._presign('put', bucket_name, object_name, expiration)
+
+    def generate_presigned_get_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expiration: int = DEFAULT_PRESIGNED_GET_URL_EXPIRY,
+        *,
+        cached: bool = True,
+    ) -> str:
+        # Signed without a cache, so every URL has its full lifetime
+        return self._presign('get', bucket_name, object_name, expiration)
+
+    def head_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+    ) -> S3ObjectMetadata | None:
+        path = self.path(bucket_name, object_name)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        content_type, _ = mimetypes.guess_type(path.name)
+        return S3ObjectMetadata(
+            content_type=content_type or 'application/octet-stream',
+            content_length=stat.st_size,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        )
+
+    def get_object_range(
+        self,
+        bucket_name: str,
+        object_name: str,
+        start: int,
+        end: int,
+    ) -> bytes | None:
+        path = self.path(bucket_name, object_name)
+        try:
+            with path.open('rb') as f:
+                f.seek(start)
+                return f.read(end - start + 1)
+        except FileNotFoundError:
+            return None
+
+    def write_chunks(
+        self,
+        bucket_name: str,
+        object_name: str,
+        chunks: Iterable[bytes],
+    ) -> int:
+        """
+        Stream chunks to the object path atomically.
+
+        Writes to a temporary file in the target directory and renames it into
+        place, so readers never observe a partially written object.
+        """
+        path = self.path(bucket_name, object_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return size
+
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        body: bytes,
+        content_type: str,
+    ) -> None:
+        self.write_chunks(bucket_name, object_name, [body])
+
+    def delete_object(self, bucket_name: str, object_name: str) -> None:
+        self.path(bucket_name, object_name).unlink(missing_ok=True)
+
+    def delete_objects(
+        self,
+        bucket_name: str,
+        object_names: list[str],
+    ) -> int:
+        for object_name in object_names:
+            self.delete_object(bucket_name, object_name)
+        return len(object_names)
+
+
+@functools.cache
+def _get_backend(provider: StorageProvider) -> StorageBackend:
+    if provider == StorageProvider.LOCAL:
+        return LocalStorageBackend()
+    return S3StorageBackend(provider)
+
+
+def get_storage_backend(provider: str | None = None) -> StorageBackend:
+    """
+    Storage backend for a provider value (defaults to STORAGE_PROVIDER).
+
+    Assets remember the provider they were uploaded to, so pass
+    asset.storage_provider when operating on an existing asset.
+    """
+    return _get_backend(StorageProvider(provider or settings.STORAGE_PROVIDER))
+
+
+def delete_stored_objects(objects: list[tuple[str, str]]) -> int:
+    """
+    Delete (storage_provider, storage_key) pairs from the images bucket,
+    with one batched delete per provider.
+
+    Returns the number of objects deleted.
+    """
+    keys_by_provider: dict[str, list[str]] = defaultdict(list)
+    for storage_provider, storage_key in objects:
+        keys_by_provider[storage_provider].append(storage_key)
+
+    deleted = 0
+    for storage_provider, storage_keys in keys_by_provider.items():
+        deleted += get_storage_backend(storage_provider).delete_objects(
+            bucket_name=settings.STORAGE_BUCKET_IMAGES,
+            object_names=storage_keys,
+        )
+    return deleted
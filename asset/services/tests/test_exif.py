@@ -0,0 +1,179 @@
+import io
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+from PIL import ExifTags, Image
+
+from asset.constants import EXIF_HEADER_BYTES
+from asset.exceptions import S3Error
+from asset.services.exif import extract_exif, find_exif_payload, parse_exif
+
+
+def make_image(image_format: str = 'JPEG', **tags) -> bytes:
+    exif = Image.Exif()
+    exif_ifd = {}
+    for name, value in tags.items():
+        tag_id = ExifTags.Base[name]
+        if tag_id in (
+            ExifTags.Base.DateTimeOriginal,
+            ExifTags.Base.OffsetTimeOriginal,
+        ):
+            exif_ifd[tag_id] = value
+        else:
+            exif[tag_id] = value
+    if exif_ifd:
+        exif.get_ifd(ExifTags.IFD.Exif).update(exif_ifd)
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (64, 48), 'white').save(
+        buffer,
+        image_format,
+        exif=exif.tobytes(),
+    )
+    return buffer.getvalue()
+
+
+class TestParseExif(TestCase):
+    def test_parses_jpeg_tags(self):
+        header = make_image(Make='Apple', Model='iPhone', Orientation=6)
+
+        result = parse_exif(header)
+
+        self.assertEqual(result.data['Make'], 'Apple')
+        self.assertEqual(result.data['Model'], 'iPhone')
+        self.assertEqual(result.orientation, 6)
+
+    def test_parses_png_tags(self):
+        header = make_image('PNG', Orientation=3)
+
+        result = parse_exif(header)
+
+        self.assertEqual(result.orientation, 3)
+
+    def test_parses_captured_at_with_offset(self):
+        header = make_image(
+            DateTimeOriginal='2025:01:02 03:04:05',
+            OffsetTimeOriginal='+08:00',
+        )
+
+        result = parse_exif(header)
+
+        self.assertEqual(
+            result.captured_at,
+            datetime(
+                2025,
+                1,
+                2,
+                3,
+                4,
+                5,
+                tzinfo=timezone(timedelta(hours=8)),
+            ),
+        )
+
+    def test_captured_at_defaults_to_utc(self):
+        header = make_image(DateTimeOriginal='2025:01:02 03:04:05')
+
+        result = parse_exif(header)
+
+        self.assertEqual(
+            result.captured_at,
+            datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        )
+
+    def test_falls_back_to_datetime_tag(self):
+        header = make_image(DateTime='2024:12:31 23:59:59')
+
+        result = parse_exif(header)
+
+        self.assertEqual(
+            result.captured_at,
+            datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+        )
+
+    def test_invalid_datetime_is_ignored(self):
+        header = make_image(Make='Apple', DateTime='0000:00:00 00:00:00')
+
+        result = parse_exif(header)
+
+        self.assertEqual(result.data['Make'], 'Apple')
+        self.assertIsNone(result.captured_at)
+
+    def test_works_on_truncated_header(self):
+        image = make_image(Orientation=8)
+        header = image[: len(image) // 2]
+
+        result = parse_exif(header)
+
+        self.assertEqual(result.orientation, 8)
+
+    def test_returns_none_without_exif(self):
+        buffer = io.BytesIO()
+        Image.new('RGB', (8, 8)).save(buffer, 'JPEG')
+
+        self.assertIsNone(parse_exif(buffer.getvalue()))
+
+    def test_returns_none_for_unknown_format(self):
+        self.assertIsNone(parse_exif(b'not an image'))
+
+    def test_find_payload_returns_none_for_garbage_jpeg(self):
+        self.assertIsNone(find_exif_payload(b'\xff\xd8\x00\x00\x00\x00'))
+
+
+class TestExtractExif(TestCase):
+    def setUp(self):
+        self.storage = MagicMock()
+
+    def test_reads_only_header_bytes(self):
+        self.storage.get_object_range.return_value = make_image(Orientation=6)
+
+        result = extract_exif(
+            storage=self.storage,
+            bucket_name='bucket',
+            object_name='key',
+            mime_type='image/jpeg',
+        )
+
+        self.assertEqual(result.orientation, 6)
+        self.storage.get_object_range.assert_called_once_with(
+            bucket_name='bucket',
+            object_name='key',
+            start=0,
+            end=EXIF_HEADER_BYTES - 1,
+        )
+
+    def test_skips_unsupported_mime_type(self):
+        result = extract_exif(
+            storage=self.storage,
+            bucket_name='bucket',
+            object_name='key',
+            mime_type='image/heic',
+        )
+
+        self.assertIsNone(result)
+        self.storage.get_object_range.assert_not_called()
+
+    def test_returns_none_on_storage_error(self):
+        self.storage.get_object_range.side_effect = S3Error(message='boom')
+
+        result = extract_exif(
+            storage=self.storage,
+            bucket_name='bucket',
+            object_name='key',
+            mime_type='image/jpeg',
+        )
+
+        self.assertIsNone(result)
+
+    def test_returns_none_for_missing_object(self):
+        self.storage.get_object_range.return_value = None
+
+        result = extract_exif(
+            storage=self.storage,
+            bucket_name='bucket',
+            object_name='key',
+            mime_type='image/jpeg',
+        )
+
+        self.assertIsNone(result)
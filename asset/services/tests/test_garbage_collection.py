@@ -0,0 +1,144 @@
+import io
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from asset.constants import UploadStatus
+from asset.factories import AssetFactory, UploadSessionFactory
+from asset.models import Asset, AssetRef, UploadSession
+from asset.services.garbage_collection import collect_expired_uploads
+from hand.factories import HandFactory
+
+
+def make_upload(*, age: timedelta, status=UploadStatus.PRESIGNED, **kwargs):
+    session = UploadSessionFactory(status=status.value)
+    UploadSession.objects.filter(id=session.id).update(
+        created_at=timezone.now() - age,
+    )
+    return AssetFactory(upload_session=session, **kwargs)
+
+
+@patch('asset.services.storage.S3StorageBackend.delete_objects')
+class TestCollectExpiredUploads(TestCase):
+    def test_deletes_expired_sessions_assets_and_objects(self, mock_delete):
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+        expired = make_upload(age=timedelta(days=2))
+
+        report = collect_expired_uploads(older_than=timedelta(days=1))
+
+        self.assertEqual(report.sessions, 1)
+        self.assertEqual(report.assets, 1)
+        self.assertEqual(report.objects, 1)
+        self.assertFalse(Asset.objects.filter(id=expired.id).exists())
+        self.assertFalse(
+            UploadSession.objects.filter(
+                id=expired.upload_session_id
+            ).exists(),
+        )
+        mock_delete.assert_called_once()
+        self.assertEqual(
+            mock_delete.call_args.kwargs['object_names'],
+            [expired.storage_key],
+        )
+
+    def test_keeps_recent_and_completed_uploads(self, mock_delete):
+        recent = make_upload(age=timedelta(hours=1))
+        completed = make_upload(
+            age=timedelta(days=2),
+            status=UploadStatus.COMPLETED,
+            is_active=True,
+        )
+
+        report = collect_expired_uploads(older_than=timedelta(days=1))
+
+        self.assertEqual(report.sessions, 0)
+        self.assertTrue(Asset.objects.filter(id=recent.id).exists())
+        self.assertTrue(Asset.objects.filter(id=completed.id).exists())
+        mock_delete.assert_not_called()
+
+    def test_keeps_referenced_assets(self, mock_delete):
+        mock_delete.return_value = 0
+        asset = make_upload(age=timedelta(days=2))
+        AssetRef.attach(asset=asset, owner=HandFactory())
+
+        collect_expired_uploads(older_than=timedelta(days=1))
+
+        self.assertTrue(Asset.objects.filter(id=asset.id).exists())
+        mock_delete.assert_not_called()
+
+    def test_processes_in_batches(self, mock_delete):
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+        for _ in range(5):
+            make_upload(age=timedelta(days=2))
+
+        report = collect_expired_uploads(
+            older_than=timedelta(days=1),
+            batch_size=2,
+        )
+
+        self.assertEqual(report.sessions, 5)
+        self.assertEqual(report.batches, 3)
+        self.assertEqual(mock_delete.call_count, 3)
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_retries_claimed_batch_after_storage_failure(self, mock_delete):
+        asset = make_upload(age=timedelta(days=2))
+        mock_delete.side_effect = RuntimeError('storage down')
+
+        with self.assertRaises(RuntimeError):
+            collect_expired_uploads(older_than=timedelta(days=1))
+
+        asset.upload_session.refresh_from_db()
+        self.assertEqual(
+            asset.upload_session.status, UploadStatus.FAILED.value
+        )
+
+        mock_delete.side_effect = None
+        mock_delete.return_value = 1
+        report = collect_expired_uploads(older_than=timedelta(days=1))
+
+        self.assertEqual(report.assets, 1)
+        self.assertFalse(Asset.objects.filter(id=asset.id).exists())
+
+    def test_dry_run_deletes_nothing(self, mock_delete):
+        make_upload(age=timedelta(days=2))
+        make_upload(age=timedelta(days=3))
+
+        report = collect_expired_uploads(
+            older_than=timedelta(days=1),
+            dry_run=True,
+        )
+
+        self.assertTrue(report.dry_run)
+        self.assertEqual(report.sessions, 2)
+        self.assertEqual(report.assets, 2)
+        self.assertEqual(Asset.objects.count(), 2)
+        self.assertEqual(
+            UploadSession.objects.filter(
+                status=UploadStatus.PRESIGNED.value,
+            ).count(),
+            2,
+        )
+        mock_delete.assert_not_called()
+
+
+class TestGcUploadsCommand(TestCase):
+    def test_rejects_age_within_presign_expiry(self):
+        with self.assertRaises(CommandError):
+            call_command('gc_uploads', '--older-than-hours', '0.5')
+
+    def test_dry_run_reports_counts(self):
+        make_upload(age=timedelta(days=2))
+
+        stdout = io.StringIO()
+        call_command('gc_uploads', '--dry-run', stdout=stdout)
+
+        self.assertIn('Would delete 1 upload sessions', stdout.getvalue())
@@ -0,0 +1,214 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from asset.services.presign_cache import (
+    PresignedUrlCache,
+    get_cached_presigned_get_url,
+    get_presigned_url_cache,
+)
+
+
+def get_or_sign(cache, sign, key='key', expiration=900):
+    return cache.get_or_sign(
+        bucket_name='bucket',
+        object_name=key,
+        operation='get_object',
+        expiration=expiration,
+        sign=sign,
+    )
+
+
+class TestPresignedUrlCache(TestCase):
+    def test_signs_once_within_window(self):
+        cache = PresignedUrlCache(max_entries=10)
+        sign = MagicMock(return_value='https://signed.url')
+
+        first = get_or_sign(cache, sign)
+        second = get_or_sign(cache, sign)
+
+        self.assertEqual(first, 'https://signed.url')
+        self.assertEqual(second, 'https://signed.url')
+        sign.assert_called_once()
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.stats().misses, 1)
+
+    def test_resigns_inside_safety_margin(self):
+        cache = PresignedUrlCache(max_entries=10, safety_margin=60)
+        sign = MagicMock(side_effect=['https://first', 'https://second'])
+
+        with patch('asset.services.presign_cache.time.time') as mock_time:
+            mock_time.return_value = 1000.0
+            get_or_sign(cache, sign)
+
+            # 900s expiry, 60s margin: still fresh at +839s
+            mock_time.return_value = 1839.0
+            self.assertEqual(get_or_sign(cache, sign), 'https://first')
+
+            mock_time.return_value = 1840.0
+            self.assertEqual(get_or_sign(cache, sign), 'https://second')
+
+        self.assertEqual(sign.call_count, 2)
+
+    def test_does_not_cache_short_lived_urls(self):
+        cache = PresignedUrlCache(max_entries=10, safety_margin=60)
+        sign = MagicMock(return_value='https://signed.url')
+
+        get_or_sign(cache, sign, expiration=30)
+        get_or_sign(cache, sign, expiration=30)
+
+        self.assertEqual(sign.call_count, 2)
+        self.assertEqual(cache.stats().size, 0)
+
+    def test_keys_by_object_and_operation(self):
+        cache = PresignedUrlCache(max_entries=10)
+        sign = MagicMock(side_effect=['https://a', 'https://b', 'https://c'])
+
+        get_or_sign(cache, sign, key='a')
+        get_or_sign(cache, sign, key='b')
+        cache.get_or_sign(
+            bucket_name='bucket',
+            object_name='a',
+            operation='put_object',
+            expiration=900,
+            sign=sign,
+        )
+
+        self.assertEqual(sign.call_count, 3)
+
+    def test_longer_expiration_is_not_served_a_shorter_url(self):
+        cache = PresignedUrlCache(max_entries=10, safety_margin=60)
+        sign = MagicMock(side_effect=['https://short', 'https://long'])
+
+        with patch('asset.services.presign_cache.time.time') as mock_time:
+            mock_time.return_value = 1000.0
+            get_or_sign(cache, sign, expiration=900)
+
+            mock_time.return_value = 1800.0
+            url = get_or_sign(cache, sign, expiration=86400)
+            self.assertEqual(url, 'https://long')
+
+            # Each lifetime keeps its own URL
+            self.assertEqual(
+                get_or_sign(cache, sign, expiration=900),
+                'https://short',
+            )
+            self.assertEqual(
+                get_or_sign(cache, sign, expiration=86400),
+                'https://long',
+            )
+
+        self.assertEqual(sign.call_count, 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = PresignedUrlCache(max_entries=2)
+        sign = MagicMock(side_effect=lambda: 'https://signed.url')
+
+        get_or_sign(cache, sign, key='a')
+        get_or_sign(cache, sign, key='b')
+        get_or_sign(cache, sign, key='a')  # a is now most recent
+        get_or_sign(cache, sign, key='c')  # evicts b
+
+        get_or_sign(cache, sign, key='a')
+        self.assertEqual(sign.call_count, 3)
+        get_or_sign(cache, sign, key='b')
+        self.assertEqual(sign.call_count, 4)
+
+    def test_invalidate(self):
+        cache = PresignedUrlCache(max_entries=10)
+        sign = MagicMock(return_value='https://signed.url')
+
+        get_or_sign(cache, sign)
+        cache.invalidate(
+            bucket_name='bucket',
+            object_name='key',
+            operation='get_object',
+            expiration=900,
+        )
+        get_or_sign(cache, sign)
+
+        self.assertEqual(sign.call_count, 2)
+
+    @override_settings(
+        CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            },
+        },
+    )
+    def test_shared_cache_is_used_across_instances(self):
+        caches['default'].clear()
+        first = PresignedUrlCache(
+            max_entries=10,
+            shared_cache_alias='default',
+        )
+        second = PresignedUrlCache(
+            max_entries=10,
+            shared_cache_alias='default',
+        )
+        sign = MagicMock(return_value='https://signed.url')
+
+        get_or_sign(first, sign)
+        url = get_or_sign(second, sign)
+
+        self.assertEqual(url, 'https://signed.url')
+        sign.assert_called_once()
+        self.assertEqual(second.stats().shared_hits, 1)
+
+    @override_settings(
+        CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            },
+        },
+    )
+    def test_shared_cache_keys_by_expiration(self):
+        caches['default'].clear()
+        first = PresignedUrlCache(
+            max_entries=10,
+            shared_cache_alias='default',
+        )
+        second = PresignedUrlCache(
+            max_entries=10,
+            shared_cache_alias='default',
+        )
+        sign = MagicMock(side_effect=['https://short', 'https://long'])
+
+        get_or_sign(first, sign, expiration=900)
+        url = get_or_sign(second, sign, expiration=86400)
+
+        self.assertEqual(url, 'https://long')
+        self.assertEqual(second.stats().shared_hits, 0)
+
+
+class TestGetCachedPresignedGetUrl(TestCase):
+    def setUp(self):
+        get_presigned_url_cache().clear()
+
+    @patch('asset.services.presign_cache.generate_presigned_get_url')
+    def test_signs_get_url_once(self, mock_presign):
+        mock_presign.return_value = 'https://presigned-get.url'
+
+        first = get_cached_presigned_get_url('bucket', 'key')
+        second = get_cached_presigned_get_url('bucket', 'key')
+
+        self.assertEqual(first, 'https://presigned-get.url')
+        self.assertEqual(second, 'https://presigned-get.url')
+        mock_presign.assert_called_once_with(
+            bucket_name='bucket',
+            object_name='key',
+            expiration=900,
+        )
+
+    @patch('asset.services.presign_cache.generate_presigned_get_url')
+    def test_signs_each_expiration(self, mock_presign):
+        mock_presign.side_effect = lambda **kwargs: (
+            f'https://presigned-get.url?expires={kwargs["expiration"]}'
+        )
+
+        get_cached_presigned_get_url('bucket', 'key')
+        url = get_cached_presigned_get_url('bucket', 'key', expiration=86400)
+
+        self.assertEqual(url, 'https://presigned-get.url?expires=86400')
+        self.assertEqual(mock_presign.call_count, 2)
@@ -5,8 +5,10 @@ from django.test import TestCase
 
 from asset.exceptions import S3Error
 from asset.services.s3 import (
+    delete_objects,
     generate_presigned_get_url,
     generate_presigned_put_url,
+    get_object_range,
     head_object,
 )
 
@@ -55,6 +57,89 @@ class TestHeadObject(TestCase):
             head_object('bucket', 'key')
 
 
+class TestGetObjectRange(TestCase):
+    @patch('asset.services.s3.get_s3_client')
+    def test_returns_range_bytes(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {
+            'Body': MagicMock(read=MagicMock(return_value=b'header')),
+        }
+        mock_get_client.return_value = mock_client
+
+        result = get_object_range('bucket', 'key', 0, 1023)
+
+        self.assertEqual(result, b'header')
+        mock_client.get_object.assert_called_once_with(
+            Bucket='bucket',
+            Key='key',
+            Range='bytes=0-1023',
+        )
+
+    @patch('asset.services.s3.get_s3_client')
+    def test_returns_none_when_not_found(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchKey'}},
+            'GetObject',
+        )
+        mock_get_client.return_value = mock_client
+
+        self.assertIsNone(get_object_range('bucket', 'key', 0, 1023))
+
+    @patch('asset.services.s3.get_s3_client')
+    def test_returns_empty_for_empty_object(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidRange'}},
+            'GetObject',
+        )
+        mock_get_client.return_value = mock_client
+
+        self.assertEqual(get_object_range('bucket', 'key', 0, 1023), b'')
+
+    @patch('asset.services.s3.get_s3_client')
+    def test_raises_s3_error_on_other_error(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': '500'}},
+            'GetObject',
+        )
+        mock_get_client.return_value = mock_client
+
+        with self.assertRaises(S3Error):
+            get_object_range('bucket', 'key', 0, 1023)
+
+
+class TestDeleteObjects(TestCase):
+    @patch('asset.services.s3.get_s3_client')
+    def test_batches_keys_per_request(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {}
+        mock_get_client.return_value = mock_client
+        keys = [f'key-{i}' for i in range(2500)]
+
+        result = delete_objects('bucket', keys)
+
+        self.assertEqual(result, 2500)
+        self.assertEqual(mock_client.delete_objects.call_count, 3)
+        batch_sizes = [
+            len(call.kwargs['Delete']['Objects'])
+            for call in mock_client.delete_objects.call_args_list
+        ]
+        self.assertEqual(batch_sizes, [1000, 1000, 500])
+
+    @patch('asset.services.s3.get_s3_client')
+    def test_raises_s3_error_on_failed_keys(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {
+            'Errors': [{'Key': 'key', 'Code': 'AccessDenied'}],
+        }
+        mock_get_client.return_value = mock_client
+
+        with self.assertRaises(S3Error):
+            delete_objects('bucket', ['key'])
+
+
 class TestGeneratePresignedPutUrl(TestCase):
     @patch('asset.services.s3.get_s3_client')
     def test_returns_presigned_url(self, mock_get_client):
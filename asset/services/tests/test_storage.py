@@ -0,0 +1,175 @@
+import tempfile
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase, override_settings
+
+from asset.constants import StorageProvider
+from asset.exceptions import S3Error
+from asset.services.storage import (
+    LocalStorageBackend,
+    S3StorageBackend,
+    get_storage_backend,
+)
+
+
+class TestGetStorageBackend(TestCase):
+    def test_defaults_to_configured_provider(self):
+        with override_settings(STORAGE_PROVIDER='r2'):
+            backend = get_storage_backend()
+
+        self.assertIsInstance(backend, S3StorageBackend)
+        self.assertEqual(backend.provider, StorageProvider.R2)
+
+    def test_local_provider(self):
+        backend = get_storage_backend(StorageProvider.LOCAL.value)
+
+        self.assertIsInstance(backend, LocalStorageBackend)
+
+    def test_unknown_provider_raises(self):
+        with self.assertRaises(ValueError):
+            get_storage_backend('ftp')
+
+
+class TestS3StorageBackend(TestCase):
+    @patch('asset.services.storage.get_cached_presigned_get_url')
+    def test_presigned_get_url_uses_cache(self, mock_cached):
+        mock_cached.return_value = 'https://presigned-get.url'
+
+        url = S3StorageBackend().generate_presigned_get_url('bucket', 'key')
+
+        self.assertEqual(url, 'https://presigned-get.url')
+        mock_cached.assert_called_once_with(
+            bucket_name='bucket',
+            object_name='key',
+            expiration=900,
+        )
+
+    @patch('asset.services.storage.get_cached_presigned_get_url')
+    @patch('asset.services.storage.s3.generate_presigned_get_url')
+    def test_presigned_get_url_without_cache(self, mock_presign, mock_cached):
+        mock_presign.return_value = 'https://presigned-get.url'
+
+        url = S3StorageBackend().generate_presigned_get_url(
+            'bucket',
+            'key',
+            expiration=86400,
+            cached=False,
+        )
+
+        self.assertEqual(url, 'https://presigned-get.url')
+        mock_presign.assert_called_once_with(
+            bucket_name='bucket',
+            object_name='key',
+            expiration=86400,
+        )
+        mock_cached.assert_not_called()
+
+    @patch('asset.services.storage.s3.head_object')
+    def test_head_object_delegates_to_s3(self, mock_head):
+        S3StorageBackend().head_object('bucket', 'key')
+
+        mock_head.assert_called_once_with(
+            bucket_name='bucket',
+            object_name='key',
+        )
+
+
+class TestLocalStorageBackend(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.backend = LocalStorageBackend(
+            root=self.tmp_dir.name,
+            base_url='http://testserver/',
+        )
+
+    def test_put_head_and_range(self):
+        self.backend.put_object(
+            'bucket', 'a/b.jpg', b'0123456789', 'image/jpeg'
+        )
+
+        metadata = self.backend.head_object('bucket', 'a/b.jpg')
+        self.assertEqual(metadata.content_type, 'image/jpeg')
+        self.assertEqual(metadata.content_length, 10)
+        self.assertIsNotNone(metadata.etag)
+
+        self.assertEqual(
+            self.backend.get_object_range('bucket', 'a/b.jpg', 2, 4),
+            b'234',
+        )
+        self.assertEqual(
+            self.backend.get_object_range('bucket', 'a/b.jpg', 0, 99),
+            b'0123456789',
+        )
+
+    def test_missing_object(self):
+        self.assertIsNone(self.backend.head_object('bucket', 'missing.jpg'))
+        self.assertIsNone(
+            self.backend.get_object_range('bucket', 'missing.jpg', 0, 9),
+        )
+
+    def test_delete_object(self):
+        self.backend.put_object('bucket', 'key.jpg', b'data', 'image/jpeg')
+
+        self.backend.delete_object('bucket', 'key.jpg')
+        self.backend.delete_object('bucket', 'key.jpg')
+
+        self.assertIsNone(self.backend.head_object('bucket', 'key.jpg'))
+
+    def test_delete_objects_ignores_missing(self):
+        self.backend.put_object('bucket', 'a.jpg', b'data', 'image/jpeg')
+
+        deleted = self.backend.delete_objects('bucket', ['a.jpg', 'b.jpg'])
+
+        self.assertEqual(deleted, 2)
+        self.assertIsNone(self.backend.head_object('bucket', 'a.jpg'))
+
+    def test_rejects_keys_outside_bucket(self):
+        for key in ['../other/key.jpg', '/etc/passwd', '']:
+            with self.subTest(key=key), self.assertRaises(S3Error):
+                self.backend.path('bucket', key)
+
+    def test_presigned_url_signature_round_trip(self):
+        url = self.backend.generate_presigned_get_url('bucket', 'a/b.jpg')
+
+        parsed = urlparse(url)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        self.assertEqual(parsed.path, '/asset/local/bucket/a/b.jpg')
+        self.assertEqual(query['op'], 'get')
+        self.assertTrue(
+            LocalStorageBackend.verify_signature(
+                operation='get',
+                bucket_name='bucket',
+                object_name='a/b.jpg',
+                expires=query['expires'],
+                signature=query['signature'],
+            ),
+        )
+        self.assertFalse(
+            LocalStorageBackend.verify_signature(
+                operation='put',
+                bucket_name='bucket',
+                object_name='a/b.jpg',
+                expires=query['expires'],
+                signature=query['signature'],
+            ),
+        )
+
+    def test_expired_signature_is_rejected(self):
+        url = self.backend.generate_presigned_get_url(
+            'bucket',
+            'key.jpg',
+            expiration=-1,
+        )
+        query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+
+        self.assertFalse(
+            LocalStorageBackend.verify_signature(
+                operation='get',
+                bucket_name='bucket',
+                object_name='key.jpg',
+                expires=query['expires'],
+                signature=query['signature'],
+            ),
+        )
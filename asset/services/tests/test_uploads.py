@@ -1,5 +1,6 @@
 import uuid
-from unittest.mock import patch
+from datetime import datetime, timezone
+from unittest.mock import ANY, patch
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.test import TestCase
@@ -11,6 +12,7 @@ from asset.exceptions import (
     UploadNotCompleteError,
 )
 from asset.factories import AssetFactory, ClientFactory, UploadSessionFactory
+from asset.services.exif import ExifMetadata
 from asset.services.s3 import S3ObjectMetadata
 from asset.services.uploads import (
     complete_upload,
@@ -72,13 +74,15 @@ class TestGenerateStorageKey(TestCase):
 
 
 class TestCreatePresignedUpload(TestCase):
-    @patch('asset.services.uploads.generate_presigned_put_url')
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_put_url',
+    )
     def test_creates_session_and_asset(self, mock_presign):
         mock_presign.return_value = 'https://s3.example.com/presigned'
         client = ClientFactory()
 
         result = create_presigned_upload(
-            install_id=client.install_id,
+            client=client,
             content_type='image/jpeg',
             purpose='hand_photo',
         )
@@ -95,30 +99,25 @@ class TestCreatePresignedUpload(TestCase):
         self.assertEqual(session.client, client)
         self.assertFalse(asset.is_active)
 
-    @patch('asset.services.uploads.generate_presigned_put_url')
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_put_url',
+    )
     def test_invalid_content_type_raises_error(self, mock_presign):
         client = ClientFactory()
 
         with self.assertRaises(InvalidFileTypeError):
             create_presigned_upload(
-                install_id=client.install_id,
+                client=client,
                 content_type='application/pdf',
             )
 
         mock_presign.assert_not_called()
 
-    @patch('asset.services.uploads.generate_presigned_put_url')
-    def test_nonexistent_client_raises_error(self, mock_presign):
-        with self.assertRaises(ObjectDoesNotExist):
-            create_presigned_upload(
-                install_id='nonexistent',
-                content_type='image/jpeg',
-            )
-
 
 class TestCompleteUpload(TestCase):
-    @patch('asset.services.uploads.head_object')
-    def test_completes_successfully(self, mock_head):
+    @patch('asset.services.uploads.extract_exif', return_value=None)
+    @patch('asset.services.storage.S3StorageBackend.head_object')
+    def test_completes_successfully(self, mock_head, mock_exif):
         mock_head.return_value = S3ObjectMetadata(
             content_type='image/jpeg',
             content_length=12345,
@@ -140,7 +139,56 @@ class TestCompleteUpload(TestCase):
         session.refresh_from_db()
         self.assertEqual(session.status, UploadStatus.COMPLETED.value)
 
-    @patch('asset.services.uploads.head_object')
+    @patch('asset.services.uploads.extract_exif')
+    @patch('asset.services.storage.S3StorageBackend.head_object')
+    def test_populates_exif(self, mock_head, mock_exif):
+        captured_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        mock_head.return_value = S3ObjectMetadata(
+            content_type='image/jpeg',
+            content_length=12345,
+        )
+        mock_exif.return_value = ExifMetadata(
+            data={'Orientation': 6},
+            captured_at=captured_at,
+        )
+        session = UploadSessionFactory(status=UploadStatus.PRESIGNED.value)
+        asset = AssetFactory(upload_session=session)
+
+        complete_upload(
+            asset_id=asset.id,
+            install_id=session.client.install_id,
+        )
+
+        asset.refresh_from_db()
+        self.assertEqual(asset.exif_data, {'Orientation': 6})
+        self.assertEqual(asset.exif_captured_at, captured_at)
+        mock_exif.assert_called_once_with(
+            storage=ANY,
+            bucket_name=ANY,
+            object_name=asset.storage_key,
+            mime_type='image/jpeg',
+        )
+
+    @patch('asset.services.uploads.extract_exif', return_value=None)
+    @patch('asset.services.storage.S3StorageBackend.head_object')
+    def test_completes_without_exif(self, mock_head, mock_exif):
+        mock_head.return_value = S3ObjectMetadata(
+            content_type='image/jpeg',
+            content_length=12345,
+        )
+        session = UploadSessionFactory(status=UploadStatus.PRESIGNED.value)
+        asset = AssetFactory(upload_session=session)
+
+        result = complete_upload(
+            asset_id=asset.id,
+            install_id=session.client.install_id,
+        )
+
+        self.assertTrue(result.is_active)
+        self.assertIsNone(result.exif_data)
+        self.assertIsNone(result.exif_captured_at)
+
+    @patch('asset.services.storage.S3StorageBackend.head_object')
     def test_wrong_session_state_raises_error(self, mock_head):
         session = UploadSessionFactory(status=UploadStatus.CREATED.value)
         asset = AssetFactory(upload_session=session)
@@ -153,7 +201,7 @@ class TestCompleteUpload(TestCase):
 
         mock_head.assert_not_called()
 
-    @patch('asset.services.uploads.head_object')
+    @patch('asset.services.storage.S3StorageBackend.head_object')
     def test_file_not_in_s3_raises_error(self, mock_head):
         mock_head.return_value = None
         session = UploadSessionFactory(status=UploadStatus.PRESIGNED.value)
@@ -165,7 +213,7 @@ class TestCompleteUpload(TestCase):
                 install_id=session.client.install_id,
             )
 
-    @patch('asset.services.uploads.head_object')
+    @patch('asset.services.storage.S3StorageBackend.head_object')
     def test_nonexistent_asset_raises_error(self, mock_head):
         with self.assertRaises(ObjectDoesNotExist):
             complete_upload(
@@ -173,7 +221,7 @@ class TestCompleteUpload(TestCase):
                 install_id='nonexistent',
             )
 
-    @patch('asset.services.uploads.head_object')
+    @patch('asset.services.storage.S3StorageBackend.head_object')
     def test_ownership_validation_fails(self, mock_head):
         session = UploadSessionFactory(status=UploadStatus.PRESIGNED.value)
         asset = AssetFactory(upload_session=session)
@@ -6,7 +6,6 @@ from django.db import transaction
 
 from asset.constants import (
     ALLOWED_IMAGE_MIMES,
-    StorageProvider,
     UploadPurpose,
     UploadStatus,
 )
@@ -16,7 +15,8 @@ from asset.exceptions import (
     UploadNotCompleteError,
 )
 from asset.models import Asset, UploadSession
-from asset.services.s3 import generate_presigned_put_url, head_object
+from asset.services.exif import extract_exif
+from asset.services.storage import get_storage_backend
 from user.models import Client
 
 
@@ -49,7 +49,7 @@ def generate_storage_key(
 
 def create_presigned_upload(
     *,
-    install_id: str,
+    client: Client,
     content_type: str,
     purpose: str = UploadPurpose.HAND_PHOTO.value,
 ) -> PresignResult:
@@ -57,8 +57,10 @@ def create_presigned_upload(
     Generate a presigned PUT URL for uploading an asset and create the
     corresponding UploadSession and Asset in the PRESIGNED state.
 
+    The asset is stored with the configured STORAGE_PROVIDER backend.
+
     Args:
-        install_id: Install identifier for the owning client.
+        client: The owning client.
         content_type: MIME type of the file (must be in ALLOWED_IMAGE_MIMES).
         purpose: Purpose of the upload (defaults to HAND_PHOTO).
 
@@ -67,10 +69,8 @@ def create_presigned_upload(
 
     Raises:
         InvalidFileTypeError: If content_type is not allowed.
-        Client.DoesNotExist: If no client exists with the provided install_id.
     """
     validate_content_type(content_type)
-    client = Client.objects.get(install_id=install_id)
 
     asset_id = uuid.uuid4()
     storage_key = generate_storage_key(
@@ -80,8 +80,9 @@ def create_presigned_upload(
         purpose,
     )
     bucket_name = settings.STORAGE_BUCKET_IMAGES
+    storage = get_storage_backend()
 
-    presigned_url = generate_presigned_put_url(
+    presigned_url = storage.generate_presigned_put_url(
         bucket_name=bucket_name,
         object_name=storage_key,
         content_type=content_type,
@@ -97,7 +98,8 @@ def create_presigned_upload(
         asset = Asset.objects.create(
             id=asset_id,
             upload_session=upload_session,
-            storage_provider=StorageProvider.R2.value,
+            client=client,
+            storage_provider=storage.provider.value,
             storage_key=storage_key,
             mime_type=content_type,
             byte_size=0,
@@ -117,7 +119,7 @@ def complete_upload(
 ) -> Asset:
     """
     Complete an upload by validating the file exists in storage and updating
-    asset metadata.
+    asset metadata, including EXIF read from the image header.
 
     Does NOT create Hand or AssetRef - that happens when detection is triggered.
 
@@ -133,9 +135,9 @@ def complete_upload(
         InvalidUploadSessionStateError: If session not in PRESIGNED state.
         UploadNotCompleteError: If file not found in storage.
     """
-    asset = Asset.objects.select_related('upload_session__client').get(
+    asset = Asset.objects.select_related('upload_session').get(
         id=asset_id,
-        upload_session__client__install_id=install_id,
+        client_id=install_id,
     )
     upload_session = asset.upload_session
 
@@ -147,7 +149,8 @@ def complete_upload(
             ),
         )
 
-    metadata = head_object(
+    storage = get_storage_backend(asset.storage_provider)
+    metadata = storage.head_object(
         bucket_name=settings.STORAGE_BUCKET_IMAGES,
         object_name=asset.storage_key,
     )
@@ -157,12 +160,29 @@ def complete_upload(
             message=f'File not found in storage: {asset.storage_key}',
         )
 
+    exif = extract_exif(
+        storage=storage,
+        bucket_name=settings.STORAGE_BUCKET_IMAGES,
+        object_name=asset.storage_key,
+        mime_type=asset.mime_type,
+    )
+
     with transaction.atomic():
         asset.byte_size = metadata.content_length
         asset.checksum = metadata.etag
         asset.is_active = True
+        if exif is not None:
+            asset.exif_data = exif.data
+            asset.exif_captured_at = exif.captured_at
         asset.save(
-            update_fields=['byte_size', 'checksum', 'is_active', 'updated_at'],
+            update_fields=[
+                'byte_size',
+                'checksum',
+                'is_active',
+                'exif_data',
+                'exif_captured_at',
+                'updated_at',
+            ],
         )
 
         upload_session.status = UploadStatus.COMPLETED.value
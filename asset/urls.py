@@ -1,8 +1,15 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from asset.views import AssetViewSet
+from asset.views import AssetViewSet, local_storage_object
 
 router = DefaultRouter()
 router.register('', AssetViewSet, basename='asset')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path(
+        'local/<str:bucket_name>/<path:object_name>',
+        local_storage_object,
+        name='asset-local-storage',
+    ),
+] + router.urls
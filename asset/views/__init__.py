@@ -1,3 +1,4 @@
 from asset.views.asset_view import AssetViewSet
+from asset.views.local_storage_view import local_storage_object
 
-__all__ = ['AssetViewSet']
+__all__ = ['AssetViewSet', 'local_storage_object']
@@ -7,7 +7,7 @@ from asset.models import Asset
 from asset.serializers.asset_serializer import AssetSerializer
 from asset.serializers.uploads_serializer import PresignRequestSerializer
 from asset.services.uploads import complete_upload, create_presigned_upload
-from user.views import get_install_id
+from user.views import get_install_id, get_request_client
 
 
 class AssetViewSet(
@@ -29,19 +29,19 @@ class AssetViewSet(
         """Filter assets by client ownership."""
         install_id = get_install_id(self.request)
         return Asset.objects.filter(
-            upload_session__client__install_id=install_id,
+            client_id=install_id,
         ).select_related('upload_session')
 
     @action(detail=False, methods=['post'], url_path='presigned-url')
     def presigned_url(self, request: Request) -> Response:
         """Generate a presigned URL for uploading an asset."""
-        install_id = get_install_id(request)
+        client = get_request_client(request)
 
         serializer = PresignRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         result = create_presigned_upload(
-            install_id=install_id,
+            client=client,
             content_type=serializer.validated_data['content_type'],
             purpose=serializer.validated_data.get('purpose'),
         )
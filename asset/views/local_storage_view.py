@@ -0,0 +1,72 @@
+import mimetypes
+
+from django.conf import settings
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseForbidden,
+)
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from asset.constants import StorageProvider
+from asset.exceptions import S3Error
+from asset.services.storage import LocalStorageBackend, get_storage_backend
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@csrf_exempt
+@require_http_methods(['GET', 'HEAD', 'PUT'])
+def local_storage_object(
+    request: HttpRequest,
+    bucket_name: str,
+    object_name: str,
+) -> HttpResponse:
+    """
+    Serve presigned GET/PUT URLs issued by LocalStorageBackend.
+
+    Only active when STORAGE_PROVIDER is local. Downloads are returned as a
+    FileResponse so WSGI servers with a file wrapper (e.g. gunicorn) send
+    them with sendfile instead of copying through Python.
+    """
+    if settings.STORAGE_PROVIDER != StorageProvider.LOCAL.value:
+        raise Http404
+
+    operation = 'put' if request.method == 'PUT' else 'get'
+    if request.GET.get('op') != operation or not (
+        LocalStorageBackend.verify_signature(
+            operation=operation,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            expires=request.GET.get('expires'),
+            signature=request.GET.get('signature', ''),
+        )
+    ):
+        return HttpResponseForbidden('Invalid or expired signature.')
+
+    backend = get_storage_backend(StorageProvider.LOCAL.value)
+    try:
+        path = backend.path(bucket_name, object_name)
+    except S3Error:
+        raise Http404 from None
+
+    if request.method == 'PUT':
+        backend.write_chunks(
+            bucket_name,
+            object_name,
+            iter(lambda: request.read(UPLOAD_CHUNK_SIZE), b''),
+        )
+        metadata = backend.head_object(bucket_name, object_name)
+        return HttpResponse(status=200, headers={'ETag': metadata.etag})
+
+    if not path.is_file():
+        raise Http404
+
+    content_type, _ = mimetypes.guess_type(path.name)
+    return FileResponse(
+        path.open('rb'),
+        content_type=content_type or 'application/octet-stream',
+    )
@@ -56,8 +56,9 @@ class TestAssetViewSetRetrieve(APITestCase):
 
 
 class TestAssetViewSetComplete(APITestCase):
-    @patch('asset.services.uploads.head_object')
-    def test_success(self, mock_head):
+    @patch('asset.services.uploads.extract_exif', return_value=None)
+    @patch('asset.services.storage.S3StorageBackend.head_object')
+    def test_success(self, mock_head, mock_exif):
         mock_head.return_value = S3ObjectMetadata(
             content_type='image/jpeg',
             content_length=12345,
@@ -80,7 +81,7 @@ class TestAssetViewSetComplete(APITestCase):
         self.assertTrue(response.data['is_active'])
         self.assertEqual(response.data['byte_size'], 12345)
 
-    @patch('asset.services.uploads.head_object')
+    @patch('asset.services.storage.S3StorageBackend.head_object')
     def test_file_not_uploaded(self, mock_head):
         mock_head.return_value = None
         session = UploadSessionFactory(status=UploadStatus.PRESIGNED.value)
@@ -102,7 +103,7 @@ class TestAssetViewSetComplete(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    @patch('asset.services.uploads.head_object')
+    @patch('asset.services.storage.S3StorageBackend.head_object')
     def test_ownership_validation(self, mock_head):
         session = UploadSessionFactory(status=UploadStatus.PRESIGNED.value)
         asset = AssetFactory(upload_session=session)
@@ -117,7 +118,9 @@ class TestAssetViewSetComplete(APITestCase):
 
 
 class TestAssetViewSetPresignedUrl(APITestCase):
-    @patch('asset.services.uploads.generate_presigned_put_url')
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_put_url',
+    )
     def test_success(self, mock_presign):
         mock_presign.return_value = 'https://s3.example.com/presigned'
         client = ClientFactory()
@@ -153,6 +156,16 @@ class TestAssetViewSetPresignedUrl(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_unknown_client(self):
+        response = self.client.post(
+            '/asset/presigned-url/',
+            {'content_type': 'image/jpeg'},
+            HTTP_X_INSTALL_ID='nonexistent',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['code'], 'client_not_found')
+
     def test_missing_content_type(self):
         client = ClientFactory()
 
@@ -0,0 +1,84 @@
+import tempfile
+from urllib.parse import urlparse
+
+from django.test import TestCase, override_settings
+from rest_framework import status
+
+from asset.services.storage import LocalStorageBackend
+
+
+class TestLocalStorageView(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        settings_override = override_settings(
+            STORAGE_PROVIDER='local',
+            LOCAL_STORAGE_ROOT=tmp_dir.name,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.backend = LocalStorageBackend()
+
+    def relative_url(self, url: str) -> str:
+        parsed = urlparse(url)
+        return f'{parsed.path}?{parsed.query}'
+
+    def test_put_then_get(self):
+        put_url = self.backend.generate_presigned_put_url(
+            'bucket',
+            'uploads/a.jpg',
+            'image/jpeg',
+        )
+
+        response = self.client.put(
+            self.relative_url(put_url),
+            data=b'image-bytes',
+            content_type='image/jpeg',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+
+        get_url = self.backend.generate_presigned_get_url(
+            'bucket',
+            'uploads/a.jpg',
+        )
+        response = self.client.get(self.relative_url(get_url))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+        self.assertEqual(b''.join(response.streaming_content), b'image-bytes')
+
+    def test_invalid_signature_is_forbidden(self):
+        response = self.client.get(
+            '/asset/local/bucket/a.jpg?op=get&expires=9999999999&signature=x',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_url_cannot_be_used_for_put(self):
+        get_url = self.backend.generate_presigned_get_url('bucket', 'a.jpg')
+
+        response = self.client.put(
+            self.relative_url(get_url),
+            data=b'image-bytes',
+            content_type='image/jpeg',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_missing_object_returns_not_found(self):
+        get_url = self.backend.generate_presigned_get_url('bucket', 'a.jpg')
+
+        response = self.client.get(self.relative_url(get_url))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_disabled_for_other_providers(self):
+        get_url = self.backend.generate_presigned_get_url('bucket', 'a.jpg')
+
+        with override_settings(STORAGE_PROVIDER='r2'):
+            response = self.client.get(self.relative_url(get_url))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,40 @@
+import re
+
+from django.db import connection
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from asset.factories import AssetFactory
+from asset.views import AssetViewSet
+
+CLIENT_INDEX_SCAN = re.compile(
+    r'Index Scan (?:Backward )?(?:using|on) \S*client',
+)
+
+
+class TestAssetOwnershipQueryPlan(TestCase):
+    def test_ownership_uses_client_index(self):
+        asset = AssetFactory()
+        install_id = asset.upload_session.client_id
+        request = APIRequestFactory().get('/', HTTP_X_INSTALL_ID=install_id)
+        view = AssetViewSet(
+            request=Request(request),
+            action='retrieve',
+            kwargs={},
+            format_kwarg=None,
+        )
+        # Drop the select_related join: only the ownership filter is checked
+        queryset = (
+            view.get_queryset().select_related(None).order_by('-created_at')
+        )
+
+        with connection.cursor() as cursor:
+            # Tables this small would be seq scanned regardless of indexes
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset[:50].explain()
+
+        self.assertEqual(asset.client_id, install_id)
+        self.assertRegex(plan, CLIENT_INDEX_SCAN)
+        self.assertNotIn('asset_uploadsession', plan)
+        self.assertNotIn('user_client', plan)
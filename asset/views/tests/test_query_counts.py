@@ -0,0 +1,131 @@
+import tempfile
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from asset.constants import UploadStatus
+from asset.factories import AssetFactory, ClientFactory, UploadSessionFactory
+from asset.services.s3 import S3ObjectMetadata
+from asset.services.storage import LocalStorageBackend
+from core.testing import QueryCountTestMixin
+
+
+def make_assets(client, rows: int, **kwargs) -> list:
+    return [
+        AssetFactory(
+            upload_session=UploadSessionFactory(client=client, **kwargs),
+            is_active=kwargs.get('status') == UploadStatus.COMPLETED.value,
+        )
+        for _ in range(rows)
+    ]
+
+
+class TestAssetQueryCounts(QueryCountTestMixin, APITestCase):
+    def test_retrieve(self):
+        def make_request(rows):
+            client = ClientFactory()
+            asset = make_assets(
+                client,
+                rows,
+                status=UploadStatus.COMPLETED.value,
+            )[0]
+
+            def request():
+                response = self.client.get(
+                    f'/asset/{asset.id}/',
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            return request
+
+        # Client, asset with its upload session
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=2)
+
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_put_url',
+        return_value='https://s3.example.com/presigned',
+    )
+    def test_presigned_url(self, mock_presign):
+        def make_request(rows):
+            client = ClientFactory()
+            make_assets(client, rows)
+
+            def request():
+                response = self.client.post(
+                    '/asset/presigned-url/',
+                    {'content_type': 'image/jpeg'},
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+            return request
+
+        # Client, savepoint with upload session and asset inserts (4)
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=5)
+
+    @patch('asset.services.uploads.extract_exif', return_value=None)
+    @patch(
+        'asset.services.storage.S3StorageBackend.head_object',
+        return_value=S3ObjectMetadata(
+            content_type='image/jpeg',
+            content_length=12345,
+            etag='"abc123"',
+        ),
+    )
+    def test_complete(self, mock_head, mock_exif):
+        def make_request(rows):
+            client = ClientFactory()
+            asset = make_assets(
+                client,
+                rows,
+                status=UploadStatus.PRESIGNED.value,
+            )[0]
+
+            def request():
+                response = self.client.post(
+                    f'/asset/{asset.id}/complete/',
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            return request
+
+        # Client, asset with its upload session, savepoint with asset and
+        # upload session updates (4)
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=6)
+
+    def test_local_storage_object(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        backend = LocalStorageBackend()
+
+        def make_request(rows):
+            backend.put_object(
+                'bucket',
+                f'{rows}.jpg',
+                b'x' * rows,
+                'image/jpeg',
+            )
+            url = urlparse(
+                backend.generate_presigned_get_url('bucket', f'{rows}.jpg'),
+            )
+
+            def request():
+                response = self.client.get(f'{url.path}?{url.query}')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                b''.join(response.streaming_content)
+
+            return request
+
+        with override_settings(
+            STORAGE_PROVIDER='local',
+            LOCAL_STORAGE_ROOT=tmp_dir.name,
+        ):
+            self.assertQueryCountIndependentOfRows(
+                make_request,
+                max_queries=0,
+            )
@@ -0,0 +1,67 @@
+"""
+Benchmarks run against a throwaway Postgres, the same way the test suite
+does (see mahjong_api/settings/test.py).
+
+Run a benchmark as a module from the repository root, e.g.:
+
+    python -m benchmarks.detection_storage
+"""
+
+import os
+import statistics
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+
+def setup_django() -> None:
+    """Configure Django with the test settings (testcontainers Postgres)."""
+    os.environ['DJANGO_ENV'] = 'test'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mahjong_api.settings')
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database() -> Iterator[None]:
+    """Create and migrate a test database, destroying it afterwards."""
+    from django.db import connection
+    from django.test.utils import (
+        setup_test_environment,
+        teardown_test_environment,
+    )
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def summarize_timings(timings: list[float]) -> dict:
+    """p50/p95/p99 of latencies in ms."""
+    if len(timings) < 2:
+        value = timings[0] if timings else 0.0
+        return {'p50': value, 'p95': value, 'p99': value}
+
+    quantiles = statistics.quantiles(timings, n=100)
+    return {
+        'p50': statistics.median(timings),
+        'p95': quantiles[94],
+        'p99': quantiles[98],
+    }
+
+
+def time_calls(func: Callable[[], object], *, repeat: int) -> dict:
+    """Call func `repeat` times and summarise the latencies in ms."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return summarize_timings(timings)
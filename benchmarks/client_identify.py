@@ -0,0 +1,134 @@
+"""
+Compare the upsert identify path with the previous get_or_create path.
+
+Simulates an app-launch burst: `--concurrency` threads each send PUT
+/user/client/ calls, a `--new-ratio` share of them from installs that have
+never identified. Reports throughput and latency for identify_client
+(one INSERT ... ON CONFLICT) and for get_or_create + touch + label save.
+
+    python -m benchmarks.client_identify --calls 5000 --concurrency 16
+"""
+
+import argparse
+import random
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+from benchmarks import setup_django, summarize_timings, test_database
+
+
+def legacy_identify(*, install_id: str, label: str = ''):
+    from user.models import Client
+
+    client, created = Client.objects.get_or_create(
+        install_id=install_id,
+        defaults={'label': label},
+    )
+    if not created:
+        client.touch()
+        if label and label != client.label:
+            client.label = label
+            client.save(update_fields=['label'])
+    return client, created
+
+
+def make_install_ids(calls: int, new_ratio: float) -> list[str]:
+    from user.models import Client
+
+    returning = [str(uuid.uuid4()) for _ in range(max(calls // 10, 1))]
+    Client.objects.bulk_create(
+        [Client(install_id=install_id) for install_id in returning],
+    )
+
+    return [
+        str(uuid.uuid4())
+        if random.random() < new_ratio
+        else random.choice(returning)
+        for _ in range(calls)
+    ]
+
+
+def run_burst(install_ids: list[str], concurrency: int) -> dict:
+    from django.db import connection
+    from django.test import Client
+
+    timings: list[float] = []
+    lock = threading.Lock()
+
+    def worker(chunk: list[str]):
+        http = Client()
+        local = []
+        try:
+            for install_id in chunk:
+                start = time.perf_counter()
+                response = http.put(
+                    '/user/client/',
+                    {'install_id': install_id, 'label': 'Phone'},
+                    content_type='application/json',
+                )
+                local.append((time.perf_counter() - start) * 1000)
+                assert response.status_code in (200, 201), response.status_code
+        finally:
+            connection.close()
+        with lock:
+            timings.extend(local)
+
+    threads = [
+        threading.Thread(target=worker, args=(install_ids[i::concurrency],))
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'rate': len(timings) / elapsed,
+        **summarize_timings(timings),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--new-ratio', type=float, default=0.2)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        results = {
+            'upsert': run_burst(
+                make_install_ids(args.calls, args.new_ratio),
+                args.concurrency,
+            ),
+        }
+        with patch(
+            'user.serializers.client_serializer.identify_client',
+            legacy_identify,
+        ):
+            results['get_or_create'] = run_burst(
+                make_install_ids(args.calls, args.new_ratio),
+                args.concurrency,
+            )
+
+    print(
+        f'{args.calls} identify calls, {args.concurrency} threads, '
+        f'{args.new_ratio:.0%} new installs',
+    )
+    for name, timings in results.items():
+        print(
+            f'  PUT /user/client/ ({name}): '
+            f'{timings["rate"]:.0f} req/s, '
+            f'p50 {timings["p50"]:.2f} ms, '
+            f'p95 {timings["p95"]:.2f} ms, '
+            f'p99 {timings["p99"]:.2f} ms',
+        )
+
+
+if __name__ == '__main__':
+    main()
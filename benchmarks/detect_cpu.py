@@ -0,0 +1,112 @@
+"""
+CPU detection latency against photo size and ONNX Runtime thread count.
+
+Times OnnxTileDetector.detect end to end (JPEG decode, letterbox,
+inference, postprocessing) on JPEGs of each size, and reports the
+inference part separately. Runs outside Django, with the CPU image's
+packages:
+
+    pip install -r modal_app/src/requirements.txt onnxruntime numpy \
+        opencv-python-headless pillow
+    python -m benchmarks.detect_cpu --model v2/model.onnx --threads 1 2 4
+
+Without --model, an untrained yolo11n is exported to ONNX first (needs
+ultralytics and onnx as well); its latency is that of a real model of the
+same size, though it detects nothing. Run it on the hardware being sized:
+the Modal CPU backend reserves CPU_INFERENCE_CORES cores.
+"""
+
+import argparse
+import io
+import statistics
+import tempfile
+from pathlib import Path
+
+from benchmarks import time_calls
+
+# Phone photos (4:3) from small uploads to full 12 MP
+SIZES = [(640, 480), (1280, 960), (2016, 1512), (4032, 3024)]
+
+
+def export_untrained_model(directory: Path) -> Path:
+    from ultralytics import YOLO
+
+    weights = directory / 'yolo11n.pt'
+    YOLO('yolo11n.yaml').save(weights)
+    return Path(YOLO(weights).export(format='onnx', dynamic=True))
+
+
+def photo(source, size: tuple[int, int]) -> bytes:
+    """source resized to size, as JPEG bytes."""
+    buffer = io.BytesIO()
+    source.resize(size).save(buffer, format='JPEG', quality=90)
+    return buffer.getvalue()
+
+
+def time_detection(
+    detector,
+    data: bytes,
+    *,
+    top_k: int,
+    repeat: int,
+) -> tuple[dict, float]:
+    """End to end latencies of detecting data, and the median inference."""
+    from modal_app.src.onnx_detector import decode_image
+
+    inference = []
+
+    def detect():
+        result = detector.detect(decode_image(data), top_k=top_k)
+        inference.append(result['inference_time_ms'])
+
+    detect()  # warm up
+    inference.clear()
+    timings = time_calls(detect, repeat=repeat)
+    return timings, statistics.median(inference)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--model', help='ONNX export (default: untrained)')
+    parser.add_argument('--image', help='source photo (default: noise)')
+    parser.add_argument('--threads', type=int, nargs='+', default=[4])
+    parser.add_argument('--top-k', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    import numpy as np
+    from PIL import Image
+
+    from modal_app.src.onnx_detector import OnnxTileDetector
+
+    if args.image:
+        source = Image.open(args.image).convert('RGB')
+    else:
+        noise = np.random.default_rng(0).integers(0, 256, (3024, 4032, 3))
+        source = Image.fromarray(noise.astype(np.uint8))
+    photos = {size: photo(source, size) for size in SIZES}
+
+    with tempfile.TemporaryDirectory() as directory:
+        model_path = args.model or export_untrained_model(Path(directory))
+        print(
+            f'{"photo":>10} {"threads":>7} {"p50 ms":>8} {"p95 ms":>8} '
+            f'{"infer ms":>9}'
+        )
+        for threads in args.threads:
+            detector = OnnxTileDetector(model_path, threads=threads)
+            for size, data in photos.items():
+                timings, inference = time_detection(
+                    detector,
+                    data,
+                    top_k=args.top_k,
+                    repeat=args.repeat,
+                )
+                print(
+                    f'{size[0]:>4}x{size[1]:<5} {threads:>7} '
+                    f'{timings["p50"]:8.1f} {timings["p95"]:8.1f} '
+                    f'{inference:9.1f}',
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Detections of the CPU backend against detect_tiles' for the same model.
+
+Runs model.pt the way detect_tiles does (TopKDetectionPredictor) and its
+ONNX export the way detect_tiles_cpu does (OnnxTileDetector), on each
+image, and matches their boxes by class and IoU. Reports the boxes only
+one backend found and the largest coordinate and confidence differences
+of the matched ones. Runs outside Django, with ultralytics and onnx
+installed besides the CPU image's packages:
+
+    python -m benchmarks.detect_parity --model v2/model.pt photos/*.jpg
+
+Boxes are compared by class label, so models whose labels are not tile
+codes can be checked too.
+"""
+
+import argparse
+import functools
+import tempfile
+from pathlib import Path
+
+# Boxes of both backends overlapping this much are the same detection
+MATCH_IOU = 0.9
+
+
+def iou(a: dict, b: dict) -> float:
+    width = min(a['x2'], b['x2']) - max(a['x1'], b['x1'])
+    height = min(a['y2'], b['y2']) - max(a['y1'], b['y1'])
+    if width <= 0 or height <= 0:
+        return 0.0
+    intersection = width * height
+    area_a = (a['x2'] - a['x1']) * (a['y2'] - a['y1'])
+    area_b = (b['x2'] - b['x1']) * (b['y2'] - b['y1'])
+    return intersection / (area_a + area_b - intersection)
+
+
+def compare(expected: list[dict], actual: list[dict]) -> dict:
+    """Match actual boxes to expected ones of the same class, best first."""
+    unmatched = list(actual)
+    matched = same_candidates = 0
+    box_delta = confidence_delta = 0.0
+    for box in sorted(expected, key=lambda box: -box['confidence']):
+        candidates = [
+            (iou(box, other), i)
+            for i, other in enumerate(unmatched)
+            if other['tile_code'] == box['tile_code']
+        ]
+        overlap, index = max(candidates, default=(0.0, None))
+        if overlap < MATCH_IOU:
+            continue
+        other = unmatched.pop(index)
+        matched += 1
+        box_delta = max(
+            box_delta,
+            *(abs(box[key] - other[key]) for key in ('x1', 'y1', 'x2', 'y2')),
+        )
+        confidence_delta = max(
+            confidence_delta,
+            abs(box['confidence'] - other['confidence']),
+        )
+        same_candidates += [code for code, _ in box['candidates']] == [
+            code for code, _ in other['candidates']
+        ]
+    return {
+        'matched': matched,
+        'box_delta': box_delta,
+        'confidence_delta': confidence_delta,
+        'same_candidates': same_candidates,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('images', nargs='+', type=Path)
+    parser.add_argument('--model', required=True, help='model.pt')
+    parser.add_argument('--top-k', type=int, default=3)
+    args = parser.parse_args()
+
+    from ultralytics import YOLO
+
+    from modal_app.src.detect import CPU_INFERENCE_CORES
+    from modal_app.src.onnx_detector import OnnxTileDetector, decode_image
+    from modal_app.src.postprocess import result_detections
+    from modal_app.src.topk import TopKDetectionPredictor
+
+    model = YOLO(args.model)
+    labels = [model.names[class_id] for class_id in range(len(model.names))]
+    predictor = functools.partial(TopKDetectionPredictor, top_k=args.top_k)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Export a copy, as export.py does, without writing beside model.pt
+        weights = Path(directory) / 'model.pt'
+        weights.write_bytes(Path(args.model).read_bytes())
+        exported = YOLO(weights).export(
+            format='onnx',
+            simplify=True,
+            dynamic=True,
+            device='cpu',
+        )
+        detector = OnnxTileDetector(exported, threads=CPU_INFERENCE_CORES)
+        detector.tile_codes = labels
+
+        print(
+            f'{"image":<24} {"gpu":>4} {"cpu":>4} {"match":>5} '
+            f'{"box Δpx":>8} {"conf Δ":>7} {"same top-k":>10}'
+        )
+        for image in args.images:
+            (result,) = model.predict(
+                str(image),
+                predictor=predictor,
+                verbose=False,
+            )
+            expected = result_detections(result, labels)
+            actual = detector.detect(
+                decode_image(image.read_bytes()),
+                top_k=args.top_k,
+            )['detections']
+            stats = compare(expected, actual)
+            print(
+                f'{image.name[:24]:<24} {len(expected):>4} {len(actual):>4} '
+                f'{stats["matched"]:>5} {stats["box_delta"]:>8.1e} '
+                f'{stats["confidence_delta"]:>7.1e} '
+                f'{stats["same_candidates"]:>10}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Time the Modal detector's postprocessing on CPU: the former per-box loop
+against modal_app.src.postprocess.result_detections.
+
+Runs outside Django, but needs the Modal image's packages:
+
+    pip install -r modal_app/src/requirements.txt 'ultralytics>=8.4,<9'
+    python -m benchmarks.detect_postprocess --model v2/model.pt
+
+Without --model, a randomly initialised yolo11n is used with its class
+scores biased up so that max_det boxes survive NMS, and class ids are
+relabelled as tile codes; timings then only reflect postprocessing, not
+detection quality. On CPU, .cpu() does not sync, so this measures the
+per-box Python overhead alone; on GPU every per-box read was also a device
+sync.
+"""
+
+import argparse
+import functools
+
+from benchmarks import time_calls
+
+TILE_CODES = (
+    '1B 2B 3B 4B 5B 6B 7B 8B 9B 1C 2C 3C 4C 5C 6C 7C 8C 9C '
+    '1D 2D 3D 4D 5D 6D 7D 8D 9D EW SW WW NW RD GD WD '
+    '1F 2F 3F 4F 1S 2S 3S 4S'
+).split()
+
+
+def legacy_detections(result, names: dict[int, str]) -> list[dict]:
+    """The per-box loop detect_tiles used, with candidates read per box."""
+    detections = []
+    for i, box in enumerate(result.boxes):
+        cls_id = int(box.cls.cpu().numpy().item())
+        label = names[cls_id]
+        if label not in TILE_CODES:
+            continue
+
+        confidence = float(box.conf.cpu().numpy().item())
+        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy().tolist()
+        detections.append(
+            {
+                'tile_code': label,
+                'confidence': confidence,
+                'x1': x1,
+                'y1': y1,
+                'x2': x2,
+                'y2': y2,
+                'candidates': [
+                    [names[int(class_id)], round(float(score), 4)]
+                    for class_id, score in zip(
+                        result.topk_cls[i].cpu().numpy(),
+                        result.topk_conf[i].cpu().numpy(),
+                        strict=True,
+                    )
+                    if names[int(class_id)] in TILE_CODES
+                ],
+            },
+        )
+    return detections
+
+
+def load_model(model_path: str | None):
+    import torch
+    from ultralytics import YOLO
+
+    if model_path:
+        return YOLO(model_path)
+
+    torch.manual_seed(0)
+    model = YOLO('yolo11n.yaml')
+    for branch in model.model.model[-1].cv3:
+        branch[-1].bias.data = torch.randn_like(branch[-1].bias) * 2
+    return model
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--model', help='YOLO weights (default: untrained)')
+    parser.add_argument('--image', help='image (default: ultralytics bus)')
+    parser.add_argument('--max-det', type=int, default=18)
+    parser.add_argument('--top-k', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    from ultralytics.utils import ASSETS
+
+    from modal_app.src.postprocess import result_detections
+    from modal_app.src.topk import TopKDetectionPredictor
+    from modal_app.src.utils import tile_codes_by_class
+
+    model = load_model(args.model)
+    (result,) = model.predict(
+        args.image or ASSETS / 'bus.jpg',
+        device='cpu',
+        max_det=args.max_det,
+        verbose=False,
+        predictor=functools.partial(
+            TopKDetectionPredictor,
+            top_k=args.top_k,
+        ),
+    )
+    names = model.names
+    if args.model is None:
+        names = {
+            class_id: TILE_CODES[class_id % len(TILE_CODES)]
+            for class_id in names
+        }
+    tile_codes = tile_codes_by_class(names)
+
+    assert legacy_detections(result, names) == result_detections(
+        result,
+        tile_codes,
+    )
+
+    legacy = time_calls(
+        lambda: legacy_detections(result, names),
+        repeat=args.repeat,
+    )
+    one_pass = time_calls(
+        lambda: result_detections(result, tile_codes),
+        repeat=args.repeat,
+    )
+    print(f'{len(result.boxes)} boxes, top_k={args.top_k}')
+    print(f'{"per box":<10} {legacy["p50"]:8.3f} ms p50')
+    print(f'{"one pass":<10} {one_pass["p50"]:8.3f} ms p50')
+    print(f'speedup    {legacy["p50"] / one_pass["p50"]:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Compare DetectionTile rows with HandDetection.packed_tiles.
+
+Reports the on-disk size of both representations and the latency of
+GET /hand/detection/{id}/ when tiles are read from rows vs decoded from
+packed_tiles.
+
+    python -m benchmarks.detection_storage --detections 2000 --tiles 14
+"""
+
+import argparse
+import random
+
+from benchmarks import setup_django, test_database, time_calls
+
+
+def populate(detections: int, tiles: int) -> list:
+    from hand.constants import DetectionStatus
+    from hand.factories import HandDetectionFactory
+    from hand.models import DetectionTile
+    from hand.packing import PackedDetectionTile, pack_detection_tiles
+    from hand.tiles import TILE_CODES
+
+    detection = HandDetectionFactory(status=DetectionStatus.SUCCEEDED.value)
+    client = detection.hand.client
+    created = [detection]
+    for _ in range(detections - 1):
+        created.append(
+            HandDetectionFactory(
+                hand__client=client,
+                status=DetectionStatus.SUCCEEDED.value,
+            ),
+        )
+
+    rows = []
+    for detection in created:
+        packed = []
+        for i in range(tiles):
+            tile = PackedDetectionTile(
+                tile_code=random.choice(TILE_CODES),
+                x1=i * 80,
+                y1=random.randint(0, 40),
+                x2=i * 80 + 75,
+                y2=random.randint(100, 140),
+                confidence=round(random.uniform(0.5, 1), 4),
+            )
+            packed.append(tile)
+            rows.append(
+                DetectionTile.from_packed(
+                    detection,
+                    tile,
+                    created_at=detection.created_at,
+                ),
+            )
+        detection.packed_tiles = pack_detection_tiles(packed)
+        detection.save(update_fields=['packed_tiles'])
+
+    DetectionTile.objects.bulk_create(rows, batch_size=5000)
+    return created
+
+
+def table_sizes() -> dict:
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT coalesce(sum(pg_total_relation_size(inhrelid)), 0)
+            FROM pg_inherits
+            WHERE inhparent = 'hand_detectiontile'::regclass
+            """,
+        )
+        rows = cursor.fetchone()[0]
+        cursor.execute(
+            'SELECT coalesce(sum(pg_column_size(packed_tiles)), 0) '
+            'FROM hand_handdetection',
+        )
+        packed = cursor.fetchone()[0]
+    return {'rows': rows, 'packed': packed}
+
+
+def measure_latency(detections: list, repeat: int) -> dict:
+    from django.test import Client
+
+    from hand.models import HandDetection
+
+    http = Client()
+    install_id = detections[0].hand.client.install_id
+
+    def fetch():
+        detection = random.choice(detections)
+        response = http.get(
+            f'/hand/detection/{detection.id}/',
+            HTTP_X_INSTALL_ID=install_id,
+        )
+        assert response.status_code == 200, response.status_code
+
+    results = {'packed': time_calls(fetch, repeat=repeat)}
+
+    HandDetection.objects.update(packed_tiles=None)
+    results['rows'] = time_calls(fetch, repeat=repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--detections', type=int, default=1000)
+    parser.add_argument('--tiles', type=int, default=14)
+    parser.add_argument('--repeat', type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        detections = populate(args.detections, args.tiles)
+        sizes = table_sizes()
+        latency = measure_latency(detections, args.repeat)
+
+    print(
+        f'{args.detections} detections x {args.tiles} tiles\n'
+        f'  DetectionTile rows:  {sizes["rows"] / 1024:10.1f} KiB\n'
+        f'  packed_tiles column: {sizes["packed"] / 1024:10.1f} KiB',
+    )
+    for name, timings in latency.items():
+        print(
+            f'  GET detection ({name}): '
+            f'p50 {timings["p50"]:.2f} ms, '
+            f'p95 {timings["p95"]:.2f} ms, '
+            f'p99 {timings["p99"]:.2f} ms',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""
+Local stand-in for the Modal detection endpoint (modal_app/src/server.py).
+
+Serves POST /detect and GET /results/{call_id} with the same payloads and
+status codes as the real endpoint. Each detection becomes ready after an
+inference delay drawn from a LatencyDistribution, and every request is
+delayed by a separate response latency, so load tests see realistic
+polling behaviour without a GPU.
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+# Tiles per fake detection: a full hand
+DETECTED_TILES = 14
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """
+    Latency in milliseconds, parsed from a spec such as:
+
+        fixed:50          always 50 ms
+        uniform:20,80     uniformly between 20 and 80 ms
+        lognormal:800,0.5 median 800 ms, log-space sigma 0.5
+    """
+
+    kind: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def parse(cls, spec: str) -> 'LatencyDistribution':
+        kind, _, raw_params = spec.partition(':')
+        params = tuple(
+            float(value) for value in raw_params.split(',') if value
+        )
+        expected = {'fixed': 1, 'uniform': 2, 'lognormal': 2}
+        if expected.get(kind) != len(params):
+            raise ValueError(f'Invalid latency distribution: {spec!r}')
+        return cls(kind=kind, params=params)
+
+    def sample(self) -> float:
+        """A latency in seconds."""
+        if self.kind == 'fixed':
+            millis = self.params[0]
+        elif self.kind == 'uniform':
+            millis = random.uniform(*self.params)
+        else:
+            median, sigma = self.params
+            millis = median * random.lognormvariate(0, sigma)
+        return max(millis, 0) / 1000
+
+
+def fake_detections() -> list[dict]:
+    """A plausible hand: distinct tiles left to right, mostly confident."""
+    from hand.tiles import TILE_CODES
+
+    return [
+        {
+            'tile_code': tile_code,
+            'x1': i * 80,
+            'y1': random.randint(0, 40),
+            'x2': i * 80 + 75,
+            'y2': random.randint(100, 140),
+            'confidence': round(random.uniform(0.6, 1), 4),
+        }
+        for i, tile_code in enumerate(
+            random.sample(TILE_CODES, DETECTED_TILES),
+        )
+    ]
+
+
+class FakeModalServer:
+    """
+    Threaded HTTP server mimicking the Modal detection endpoint.
+
+    With `fetch_images`, POST /detect downloads the image URL before
+    accepting the job, like the real detector reading from storage.
+    """
+
+    def __init__(
+        self,
+        *,
+        inference_latency: LatencyDistribution,
+        response_latency: LatencyDistribution,
+        auth_token: str,
+        fetch_images: bool = False,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ):
+        self.inference_latency = inference_latency
+        self.response_latency = response_latency
+        self.auth_token = auth_token
+        self.fetch_images = fetch_images
+
+        # call_id -> (ready_at, result)
+        self._calls: dict[str, tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='fake-modal',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def submit(self, image_url: str) -> str:
+        if self.fetch_images:
+            httpx.get(image_url, timeout=30.0).raise_for_status()
+
+        call_id = f'fc-{uuid.uuid4().hex}'
+        ready_at = time.monotonic() + self.inference_latency.sample()
+        with self._lock:
+            self._calls[call_id] = (
+                ready_at,
+                {'detections': fake_detections()},
+            )
+        return call_id
+
+    def result(self, call_id: str) -> tuple[int, dict]:
+        with self._lock:
+            call = self._calls.get(call_id)
+        if call is None:
+            return 404, {'detail': 'Unknown call_id'}
+
+        ready_at, result = call
+        if time.monotonic() < ready_at:
+            return 202, {'status': 'pending'}
+        return 200, result
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _respond(self, status: int, body: dict) -> None:
+                time.sleep(server.response_latency.sample())
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _authorized(self) -> bool:
+                expected = f'Bearer {server.auth_token}'
+                if self.headers.get('Authorization') == expected:
+                    return True
+                self._respond(401, {'detail': 'Invalid bearer token'})
+                return False
+
+            def do_POST(self):
+                if not self._authorized():
+                    return
+                if self.path != '/detect':
+                    self._respond(404, {'detail': 'Not found'})
+                    return
+
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                call_id = server.submit(body['image_url'])
+                self._respond(200, {'call_id': call_id})
+
+            def do_GET(self):
+                if not self._authorized():
+                    return
+                prefix = '/results/'
+                if not self.path.startswith(prefix):
+                    self._respond(404, {'detail': 'Not found'})
+                    return
+
+                self._respond(*server.result(self.path.removeprefix(prefix)))
+
+        return Handler
@@ -0,0 +1,353 @@
+"""
+Micro-benchmarks of tile handling, serialization and detection processing.
+
+Each case is timed with timeit and reported as the median time per call.
+Results are compared with the baseline stored in
+benchmarks/baselines/hot_paths.json, and cases slower than the baseline by
+more than --threshold are reported as regressions (exit status 1):
+
+    python -m benchmarks.hot_paths
+    python -m benchmarks.hot_paths --case validate --save-baseline
+
+Baselines are only comparable on the machine they were recorded on; record
+one with --save-baseline before changing a hot path. New hot paths (e.g.
+hand decomposition or scoring) are added with the @case decorator.
+
+The "generic" serializer cases time the ModelSerializer field-by-field
+output that the serializers' to_representation overrides replace:
+
+    python -m benchmarks.hot_paths --case Serializer[18
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+
+from benchmarks import setup_django, test_database
+
+BASELINE_PATH = Path(__file__).parent / 'baselines' / 'hot_paths.json'
+
+# A winning hand, and one with four kongs
+HAND_14 = '1B 2B 3B 4C 5C 6C 7D 8D 9D EW EW EW RD RD'.split()
+HAND_18 = '1B 1B 1B 1B 5C 5C 5C 5C 9D 9D 9D 9D EW EW EW RD RD RD'.split()
+
+# Setup functions by case name; each returns the callable to time
+CASES: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def modal_payload(tile_codes: list[str]) -> dict:
+    """A Modal result for tile_codes plus two low-confidence boxes."""
+    detections = [
+        {
+            'tile_code': tile_code,
+            'x1': i * 80.4,
+            'y1': 12.7,
+            'x2': i * 80.4 + 75.2,
+            'y2': 118.3,
+            'confidence': 0.62 + (i % 5) * 0.07,
+        }
+        for i, tile_code in enumerate(tile_codes)
+    ]
+    detections += [
+        {
+            'tile_code': '5D',
+            'x1': 40.0,
+            'y1': 150.0,
+            'x2': 110.0,
+            'y2': 250.0,
+            'confidence': 0.21,
+        },
+        {
+            'tile_code': 'WD',
+            'x1': 900.0,
+            'y1': 5.0,
+            'x2': 970.0,
+            'y2': 95.0,
+            'confidence': 0.34,
+        },
+    ]
+    return {'detections': detections}
+
+
+def packed_tiles(tile_codes: list[str]) -> bytes:
+    from hand.packing import PackedDetectionTile, pack_detection_tiles
+
+    return pack_detection_tiles(
+        PackedDetectionTile(
+            tile_code=tile['tile_code'],
+            x1=int(tile['x1']),
+            y1=int(tile['y1']),
+            x2=int(tile['x2']),
+            y2=int(tile['y2']),
+            confidence=Decimal(str(round(tile['confidence'], 4))),
+        )
+        for tile in modal_payload(tile_codes)['detections'][:-2]
+    )
+
+
+@case('validate_tile_counts[14]')
+def validate_14():
+    from hand.tiles import validate_tile_counts
+
+    return lambda: validate_tile_counts(HAND_14)
+
+
+@case('validate_tile_counts[18]')
+def validate_18():
+    from hand.tiles import validate_tile_counts
+
+    return lambda: validate_tile_counts(HAND_18)
+
+
+@case('label_to_tile[all labels]')
+def label_to_tile_all():
+    from hand.tiles import MODEL_LABEL_TO_TILE, label_to_tile
+
+    labels = list(MODEL_LABEL_TO_TILE)
+    return lambda: [label_to_tile(label) for label in labels]
+
+
+def model_serializer_output(serializer_class, instance):
+    """The generic ModelSerializer output the fast read paths replace."""
+    from rest_framework import serializers
+
+    return serializers.ModelSerializer.to_representation(
+        serializer_class(instance=instance),
+        instance,
+    )
+
+
+def detection_serializer_case(tile_codes: list[str], *, generic=False):
+    from hand.constants import DetectionStatus
+    from hand.factories import HandDetectionFactory
+    from hand.models import HandDetection
+    from hand.serializers.hand_detection_serializer import (
+        HandDetectionSerializer,
+    )
+
+    created = HandDetectionFactory(
+        status=DetectionStatus.SUCCEEDED.value,
+        packed_tiles=packed_tiles(tile_codes),
+    )
+    detection = HandDetection.objects.select_related(
+        'hand',
+        'asset_ref',
+    ).get(id=created.id)
+    if generic:
+        return lambda: model_serializer_output(
+            HandDetectionSerializer,
+            detection,
+        )
+    return lambda: HandDetectionSerializer(instance=detection).data
+
+
+@case('HandDetectionSerializer[14]')
+def detection_serializer_14():
+    return detection_serializer_case(HAND_14)
+
+
+@case('HandDetectionSerializer[18]')
+def detection_serializer_18():
+    return detection_serializer_case(HAND_18)
+
+
+@case('HandDetectionSerializer[18, generic]')
+def detection_serializer_18_generic():
+    return detection_serializer_case(HAND_18, generic=True)
+
+
+def correction_serializer_case(tile_codes: list[str], *, generic=False):
+    from hand.factories import HandFactory
+    from hand.models import HandCorrection
+    from hand.packing import pack_tile_codes
+    from hand.serializers.hand_correction_serializer import (
+        HandCorrectionSerializer,
+    )
+
+    created = HandCorrection.objects.create(
+        hand=HandFactory(),
+        tile_indexes=pack_tile_codes(tile_codes),
+    )
+    correction = HandCorrection.objects.select_related('hand').get(
+        id=created.id,
+    )
+    if generic:
+        return lambda: model_serializer_output(
+            HandCorrectionSerializer,
+            correction,
+        )
+    return lambda: HandCorrectionSerializer(instance=correction).data
+
+
+@case('HandCorrectionSerializer[14]')
+def correction_serializer_14():
+    return correction_serializer_case(HAND_14)
+
+
+@case('HandCorrectionSerializer[18]')
+def correction_serializer_18():
+    return correction_serializer_case(HAND_18)
+
+
+@case('HandCorrectionSerializer[18, generic]')
+def correction_serializer_18_generic():
+    return correction_serializer_case(HAND_18, generic=True)
+
+
+def detection_page_case(renderer_class):
+    serialize = detection_serializer_case(HAND_18)
+    page = {'next': None, 'results': [serialize() for _ in range(50)]}
+    renderer = renderer_class()
+    return lambda: renderer.render(page)
+
+
+@case('JSONRenderer[50 detections]')
+def json_renderer_page():
+    from rest_framework.renderers import JSONRenderer
+
+    return detection_page_case(JSONRenderer)
+
+
+@case('ORJSONRenderer[50 detections]')
+def orjson_renderer_page():
+    from core.renderers import ORJSONRenderer
+
+    return detection_page_case(ORJSONRenderer)
+
+
+@case('json.loads[Modal result 18+2]')
+def json_loads_result():
+    content = json.dumps(modal_payload(HAND_18)).encode()
+    return lambda: json.loads(content)
+
+
+@case('orjson.loads[Modal result 18+2]')
+def orjson_loads_result():
+    import orjson
+
+    content = json.dumps(modal_payload(HAND_18)).encode()
+    return lambda: orjson.loads(content)
+
+
+@case('process_detection_result[18+2]')
+def process_result():
+    from hand.constants import DetectionStatus
+    from hand.factories import HandDetectionFactory
+    from hand.services.hand_inference import process_detection_result
+
+    detection = HandDetectionFactory(status=DetectionStatus.RUNNING.value)
+    result = modal_payload(HAND_18)
+    return lambda: process_detection_result(detection, result)
+
+
+def measure(func: Callable[[], object], *, repeat: int) -> float:
+    """Median seconds per call over `repeat` timeit samples."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = timer.repeat(repeat=repeat, number=number)
+    return statistics.median(samples) / number
+
+
+def load_baseline() -> dict[str, float]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def save_baseline(results: dict[str, float]) -> None:
+    baseline = {**load_baseline(), **results}
+    BASELINE_PATH.parent.mkdir(exist_ok=True)
+    BASELINE_PATH.write_text(
+        json.dumps(dict(sorted(baseline.items())), indent=2) + '\n',
+    )
+
+
+def report(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """Print results against the baseline; returns the regressed cases."""
+    regressions = []
+    print(f'  {"case":<38} {"median µs":>10} {"baseline":>10} {"ratio":>7}')
+    for name, seconds in results.items():
+        micros = seconds * 1e6
+        expected = baseline.get(name)
+        if expected is None:
+            print(f'  {name:<38} {micros:>10.2f} {"-":>10} {"-":>7}')
+            continue
+
+        ratio = micros / expected
+        flag = ''
+        if ratio > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(
+            f'  {name:<38} {micros:>10.2f} {expected:>10.2f} '
+            f'{ratio:>6.2f}x{flag}',
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--case',
+        action='append',
+        default=[],
+        help='Only run cases whose name contains this (repeatable).',
+    )
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=1.25,
+        help='Slowdown vs the baseline reported as a regression.',
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help=f'Store the results in {BASELINE_PATH.name}.',
+    )
+    args = parser.parse_args()
+
+    names = [
+        name
+        for name in CASES
+        if not args.case or any(part in name for part in args.case)
+    ]
+
+    setup_django()
+    with test_database():
+        results = {
+            name: measure(CASES[name](), repeat=args.repeat) for name in names
+        }
+
+    regressions = report(results, load_baseline(), args.threshold)
+    if args.save_baseline:
+        save_baseline(
+            {name: seconds * 1e6 for name, seconds in results.items()},
+        )
+        print(f'Saved baseline to {BASELINE_PATH}')
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
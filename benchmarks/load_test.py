@@ -0,0 +1,324 @@
+"""
+End-to-end load test of the API with local stand-ins for Modal and R2.
+
+Serves the API from a threaded WSGI server against a throwaway Postgres (as
+in the test suite), stores uploads with the local storage backend and
+answers detections from benchmarks.fake_modal. `--clients` virtual clients
+each run `--flows` app flows:
+
+    identify -> presign -> upload -> complete -> detect -> poll -> correct
+
+and the report gives throughput and p50/p95/p99 latency per endpoint.
+
+    python -m benchmarks.load_test --clients 20 --flows 10 \\
+        --inference-latency lognormal:1500,0.4
+"""
+
+import argparse
+import io
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+import httpx
+
+from benchmarks import setup_django, summarize_timings, test_database
+from benchmarks.fake_modal import FakeModalServer, LatencyDistribution
+
+FLOW = 'flow'
+
+
+class FlowError(Exception):
+    pass
+
+
+class Recorder:
+    """Latencies and errors per endpoint, shared by all virtual clients."""
+
+    def __init__(self):
+        self.timings: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, millis: float, *, ok: bool) -> None:
+        with self._lock:
+            self.timings[endpoint].append(millis)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def request(
+        self,
+        http: httpx.Client,
+        endpoint: str,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = http.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.record(endpoint, _since(start), ok=False)
+            raise FlowError(f'{endpoint}: {e}') from e
+
+        ok = response.is_success
+        self.record(endpoint, _since(start), ok=ok)
+        if not ok:
+            raise FlowError(f'{endpoint}: HTTP {response.status_code}')
+        return response
+
+
+def _since(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def make_image() -> bytes:
+    """A phone-photo sized JPEG to upload."""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (1280, 960), (30, 110, 60)).save(
+        buffer,
+        format='JPEG',
+        quality=85,
+    )
+    return buffer.getvalue()
+
+
+def run_flow(
+    http: httpx.Client,
+    recorder: Recorder,
+    *,
+    install_id: str,
+    image: bytes,
+    poll_interval: float,
+    max_polls: int,
+) -> None:
+    """One app flow, identify through correct; raises FlowError."""
+    recorder.request(
+        http,
+        'PUT /user/client/',
+        'PUT',
+        '/user/client/',
+        json={'install_id': install_id},
+    )
+
+    asset = recorder.request(
+        http,
+        'POST /asset/presigned-url/',
+        'POST',
+        '/asset/presigned-url/',
+        json={'content_type': 'image/jpeg'},
+    ).json()
+
+    recorder.request(
+        http,
+        'PUT (presigned upload)',
+        'PUT',
+        asset['presigned_url'],
+        content=image,
+        headers={'Content-Type': 'image/jpeg'},
+    )
+
+    recorder.request(
+        http,
+        'POST /asset/{id}/complete/',
+        'POST',
+        f'/asset/{asset["id"]}/complete/',
+    )
+
+    detection = recorder.request(
+        http,
+        'POST /hand/detection/',
+        'POST',
+        '/hand/detection/',
+        json={'asset_id': asset['id']},
+    ).json()
+
+    for _ in range(max_polls):
+        if detection['status'] in ('succeeded', 'failed'):
+            break
+        time.sleep(poll_interval)
+        detection = recorder.request(
+            http,
+            'GET /hand/detection/{id}/poll/',
+            'GET',
+            f'/hand/detection/{detection["id"]}/poll/',
+        ).json()
+    if detection['status'] != 'succeeded':
+        raise FlowError(f'Detection ended as {detection["status"]}')
+
+    recorder.request(
+        http,
+        'POST /hand/correction/',
+        'POST',
+        '/hand/correction/',
+        json={
+            'hand_id': detection['hand_id'],
+            'detection_id': detection['id'],
+            'tiles': [
+                {'tile_code': tile['tile_code'], 'sort_order': sort_order}
+                for sort_order, tile in enumerate(detection['tiles'])
+            ],
+        },
+    )
+
+
+def start_api_server():
+    """Serve the Django app on an ephemeral port from a background thread."""
+    from django.core.servers.basehttp import (
+        ThreadedWSGIServer,
+        WSGIRequestHandler,
+    )
+    from django.core.wsgi import get_wsgi_application
+
+    class QuietRequestHandler(WSGIRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadedWSGIServer(('127.0.0.1', 0), QuietRequestHandler)
+    server.set_app(get_wsgi_application())
+    threading.Thread(
+        target=server.serve_forever,
+        name='load-test-api',
+        daemon=True,
+    ).start()
+    host, port = server.server_address[:2]
+    return server, f'http://{host}:{port}'
+
+
+def run_clients(api_url: str, args, image: bytes) -> tuple[Recorder, float]:
+    recorder = Recorder()
+
+    def virtual_client():
+        install_id = f'load-{uuid.uuid4()}'
+        with httpx.Client(
+            base_url=api_url,
+            headers={'X-Install-Id': install_id},
+            timeout=60.0,
+        ) as http:
+            for _ in range(args.flows):
+                start = time.perf_counter()
+                try:
+                    run_flow(
+                        http,
+                        recorder,
+                        install_id=install_id,
+                        image=image,
+                        poll_interval=args.poll_interval,
+                        max_polls=args.max_polls,
+                    )
+                except FlowError:
+                    recorder.record(FLOW, _since(start), ok=False)
+                else:
+                    recorder.record(FLOW, _since(start), ok=True)
+
+    threads = [
+        threading.Thread(target=virtual_client, name=f'load-client-{i}')
+        for i in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return recorder, time.perf_counter() - start
+
+
+def print_report(recorder: Recorder, elapsed: float, args) -> None:
+    flows = len(recorder.timings[FLOW])
+    requests = sum(
+        len(timings)
+        for endpoint, timings in recorder.timings.items()
+        if endpoint != FLOW
+    )
+    print(
+        f'{args.clients} clients x {args.flows} flows in {elapsed:.1f} s: '
+        f'{flows - recorder.errors[FLOW]}/{flows} flows succeeded, '
+        f'{flows / elapsed:.2f} flows/s, {requests / elapsed:.1f} req/s',
+    )
+    print(
+        f'  {"endpoint":<32} {"count":>6} {"errors":>6} {"req/s":>7} '
+        f'{"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}',
+    )
+    for endpoint, timings in recorder.timings.items():
+        summary = summarize_timings(timings)
+        print(
+            f'  {endpoint:<32} {len(timings):>6} '
+            f'{recorder.errors[endpoint]:>6} '
+            f'{len(timings) / elapsed:>7.1f} '
+            f'{summary["p50"]:>8.1f} '
+            f'{summary["p95"]:>8.1f} '
+            f'{summary["p99"]:>8.1f}',
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--clients', type=int, default=10)
+    parser.add_argument('--flows', type=int, default=5)
+    parser.add_argument(
+        '--inference-latency',
+        type=LatencyDistribution.parse,
+        default='lognormal:1200,0.4',
+        help='Fake Modal time until a detection is ready (ms).',
+    )
+    parser.add_argument(
+        '--modal-latency',
+        type=LatencyDistribution.parse,
+        default='uniform:20,80',
+        help='Fake Modal response time per request (ms).',
+    )
+    parser.add_argument(
+        '--modal-fetch-images',
+        action='store_true',
+        help='Fake Modal downloads each image before accepting the job.',
+    )
+    parser.add_argument('--poll-interval', type=float, default=0.5)
+    parser.add_argument('--max-polls', type=int, default=120)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test.utils import override_settings
+
+    from mahjong_api.settings import base
+
+    image = make_image()
+    modal = FakeModalServer(
+        inference_latency=args.inference_latency,
+        response_latency=args.modal_latency,
+        auth_token='load-test-token',
+        fetch_images=args.modal_fetch_images,
+    )
+
+    with test_database(), tempfile.TemporaryDirectory() as storage_root:
+        server, api_url = start_api_server()
+        modal.start()
+        try:
+            with override_settings(
+                DEBUG=False,
+                STORAGE_PROVIDER='local',
+                STORAGE_BUCKET_IMAGES='load-test',
+                LOCAL_STORAGE_ROOT=storage_root,
+                LOCAL_STORAGE_BASE_URL=api_url,
+                MODAL_CV_ENDPOINT=modal.url,
+                MODAL_AUTH_TOKEN=modal.auth_token,
+                # The test settings disable the client cache
+                CLIENT_CACHE_TTL=base.CLIENT_CACHE_TTL,
+            ):
+                recorder, elapsed = run_clients(api_url, args, image)
+        finally:
+            modal.stop()
+            server.shutdown()
+            server.server_close()
+
+    print_report(recorder, elapsed, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.http import HttpResponseBase
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+# Responses depend on the client named by this header
+VARY_HEADERS = ['X-Install-Id']
+
+
+def weak_etag(*parts) -> str:
+    """A weak ETag identifying a representation by e.g. id and updated_at."""
+    digest = hashlib.sha1(
+        ':'.join(str(part) for part in parts).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    """
+    Validators and freshness of a per-client resource representation.
+
+    Without max_age, clients must revalidate before every reuse (no-cache);
+    use it only for representations that can no longer change.
+    """
+
+    etag: str
+    last_modified: datetime | None = None
+    max_age: int | None = None
+
+    def not_modified(self, request) -> HttpResponseBase | None:
+        """
+        The 304 (or 412) answering the request's conditional headers, or
+        None when the representation must be sent.
+        """
+        response = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=(
+                int(self.last_modified.timestamp())
+                if self.last_modified is not None
+                else None
+            ),
+        )
+        if response is not None:
+            self.apply(response)
+        return response
+
+    def apply(self, response: HttpResponseBase) -> HttpResponseBase:
+        """Set ETag, Last-Modified, Cache-Control and Vary on response."""
+        response['ETag'] = self.etag
+        if self.last_modified is not None:
+            response['Last-Modified'] = http_date(
+                self.last_modified.timestamp(),
+            )
+        if self.max_age is None:
+            patch_cache_control(response, private=True, no_cache=True)
+        else:
+            patch_cache_control(response, private=True, max_age=self.max_age)
+        patch_vary_headers(response, VARY_HEADERS)
+        return response
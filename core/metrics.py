@@ -0,0 +1,295 @@
+"""
+Per-request instrumentation: SQL queries, outbound calls and latency.
+
+RequestMetricsMiddleware collects a RequestMetrics for every request while
+REQUEST_METRICS_ENABLED. SQL is timed with a connection execute_wrapper;
+outbound calls are timed where their clients are built (InstrumentedTransport
+for httpx, instrument_boto3_client for boto3) and only recorded while a
+request is being collected.
+
+Histograms are aggregated per process and rendered in the Prometheus text
+format by the /metrics view, so every worker process exposes its own.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import httpx
+from django.db import connection
+
+DB = 'db'
+
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+@dataclass
+class CallStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class RequestMetrics:
+    started: float = field(default_factory=time.perf_counter)
+    # DB plus one entry per outbound service called, e.g. 'modal' or 's3'
+    calls: dict[str, CallStats] = field(
+        default_factory=lambda: defaultdict(CallStats),
+    )
+
+    def record(self, kind: str, seconds: float) -> None:
+        stats = self.calls[kind]
+        stats.count += 1
+        stats.seconds += seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar(
+    'request_metrics',
+    default=None,
+)
+
+
+def record_call(kind: str, seconds: float) -> None:
+    """Add a call to the request being collected, if any."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.record(kind, seconds)
+
+
+@contextmanager
+def track_call(kind: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_call(kind, time.perf_counter() - start)
+
+
+def _time_query(execute, sql, params, many, context):
+    with track_call(DB):
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def collect_request_metrics() -> Iterator[RequestMetrics]:
+    """Record the SQL and outbound calls made inside the block."""
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        with connection.execute_wrapper(_time_query):
+            yield metrics
+    finally:
+        _current.reset(token)
+
+
+class InstrumentedTransport(httpx.HTTPTransport):
+    """httpx transport recording each request as a call to `service`."""
+
+    def __init__(self, service: str, **kwargs):
+        super().__init__(**kwargs)
+        self.service = service
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with track_call(self.service):
+            return super().handle_request(request)
+
+
+_BOTO3_START = 'request_metrics_start'
+
+
+def instrument_boto3_client(client, service: str = 's3'):
+    """Record each API call of a boto3 client as a call to `service`."""
+
+    def before_parameter_build(context, **kwargs):
+        context[_BOTO3_START] = time.perf_counter()
+
+    def after_call(context, **kwargs):
+        start = context.pop(_BOTO3_START, None)
+        if start is not None:
+            record_call(service, time.perf_counter() - start)
+
+    events = client.meta.events
+    # Every before-parameter-build handler runs, whereas a before-call
+    # handler returning a response (e.g. botocore's Stubber) skips the rest
+    events.register('before-parameter-build.*', before_parameter_build)
+    events.register('after-call.*', after_call)
+    events.register('after-call-error.*', after_call)
+    return client
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    pairs = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return f'{{{pairs}}}'
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """A Prometheus histogram aggregated in this process."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # label values -> (count per bucket, sum, count)
+        self._series: dict[tuple[str, ...], tuple[list[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            counts, total, count = self._series.get(
+                key,
+                ([0] * len(self.buckets), 0.0, 0),
+            )
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._series[key] = (counts, total + value, count + 1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} histogram',
+        ]
+        with self._lock:
+            series = sorted(
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self._series.items()
+            )
+
+        for key, (counts, total, count) in series:
+            labels = dict(zip(self.labelnames, key, strict=True))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(
+                    {**labels, 'le': _format_value(bound)},
+                )
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            inf_labels = _format_labels({**labels, 'le': '+Inf'})
+            lines.append(f'{self.name}_bucket{inf_labels} {count}')
+            series_labels = _format_labels(labels)
+            lines.append(
+                f'{self.name}_sum{series_labels} {_format_value(total)}',
+            )
+            lines.append(f'{self.name}_count{series_labels} {count}')
+        return lines
+
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Time to produce the response.',
+    ['view', 'method', 'status'],
+    DURATION_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'SQL queries per request.',
+    ['view'],
+    COUNT_BUCKETS,
+)
+DB_DURATION = Histogram(
+    'http_request_db_duration_seconds',
+    'Time spent in SQL queries per request.',
+    ['view'],
+    DURATION_BUCKETS,
+)
+OUTBOUND_CALLS = Histogram(
+    'http_request_outbound_calls',
+    'Outbound calls per request that called the service.',
+    ['view', 'service'],
+    COUNT_BUCKETS,
+)
+OUTBOUND_DURATION = Histogram(
+    'http_request_outbound_duration_seconds',
+    'Time spent in outbound calls per request that called the service.',
+    ['view', 'service'],
+    DURATION_BUCKETS,
+)
+HISTOGRAMS = [
+    REQUEST_DURATION,
+    DB_QUERIES,
+    DB_DURATION,
+    OUTBOUND_CALLS,
+    OUTBOUND_DURATION,
+]
+
+
+def observe_request(
+    metrics: RequestMetrics,
+    *,
+    view: str,
+    method: str,
+    status: int,
+    duration: float,
+) -> None:
+    REQUEST_DURATION.observe(
+        duration,
+        view=view,
+        method=method,
+        status=str(status),
+    )
+    db = metrics.calls.get(DB, CallStats())
+    DB_QUERIES.observe(db.count, view=view)
+    DB_DURATION.observe(db.seconds, view=view)
+    for service, stats in metrics.calls.items():
+        if service == DB:
+            continue
+        OUTBOUND_CALLS.observe(stats.count, view=view, service=service)
+        OUTBOUND_DURATION.observe(stats.seconds, view=view, service=service)
+
+
+def server_timing(metrics: RequestMetrics, duration: float) -> str:
+    """Server-Timing header value: one entry per call kind plus the total."""
+    entries = [
+        f'{kind};desc="{stats.count} calls";dur={stats.seconds * 1000:.1f}'
+        for kind, stats in sorted(metrics.calls.items())
+    ]
+    entries.append(f'total;dur={duration * 1000:.1f}')
+    return ', '.join(entries)
+
+
+def render_metrics() -> str:
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.render())
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from core.metrics import (
+    collect_request_metrics,
+    observe_request,
+    server_timing,
+)
+
+UNRESOLVED_VIEW = '<unresolved>'
+
+
+class RequestMetricsMiddleware:
+    """
+    Count and time the SQL queries and outbound calls of each request.
+
+    Adds a Server-Timing header to the response and records the request in
+    the histograms served at /metrics. Left out of the middleware chain
+    entirely unless REQUEST_METRICS_ENABLED. Streaming responses are timed
+    until the view returns, not until the body is sent.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect_request_metrics() as metrics:
+            response = self.get_response(request)
+        duration = metrics.elapsed()
+
+        match = request.resolver_match
+        observe_request(
+            metrics,
+            view=match.view_name if match else UNRESOLVED_VIEW,
+            method=request.method,
+            status=response.status_code,
+            duration=duration,
+        )
+        response['Server-Timing'] = server_timing(metrics, duration)
+        return response
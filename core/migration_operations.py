@@ -0,0 +1,173 @@
+from datetime import datetime
+
+from django.db.migrations.operations.base import Operation
+from django.utils import timezone
+from psqlextra.backend.migrations.state import PostgresPartitionedModelState
+from psqlextra.models import PostgresPartitionedModel
+from psqlextra.partitioning import (
+    PostgresTimePartition,
+    PostgresTimePartitionSize,
+)
+from psqlextra.partitioning.constants import AUTO_PARTITIONED_COMMENT
+from psqlextra.types import PostgresPartitioningMethod
+
+
+class ConvertToMonthlyPartitionedModel(Operation):
+    """
+    Convert an existing table into a table range-partitioned by month.
+
+    The table is swapped out for a partitioned copy with a default partition
+    and monthly partitions covering the existing rows plus `months_ahead`
+    future months, then the rows are copied across. Partitions are named and
+    commented the way psqlextra's partitioning manager does, so the manager
+    picks them up afterwards.
+
+    Postgres requires the partition key in every unique index, so the primary
+    key becomes (pk, key). Foreign keys pointing at the model must be
+    switched to db_constraint=False before this operation runs.
+    """
+
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(
+        self,
+        name: str,
+        key: str = 'created_at',
+        months_ahead: int = 3,
+    ):
+        self.name = name
+        self.key = key
+        self.months_ahead = months_ahead
+
+    @property
+    def name_lower(self) -> str:
+        return self.name.lower()
+
+    def deconstruct(self):
+        kwargs = {'name': self.name}
+        if self.key != 'created_at':
+            kwargs['key'] = self.key
+        if self.months_ahead != 3:
+            kwargs['months_ahead'] = self.months_ahead
+        return self.__class__.__qualname__, [], kwargs
+
+    def describe(self):
+        return f'Convert {self.name} to a monthly partitioned table'
+
+    @property
+    def migration_name_fragment(self):
+        return f'partition_{self.name_lower}'
+
+    def state_forwards(self, app_label, state):
+        model_state = state.models[app_label, self.name_lower]
+        state.models[app_label, self.name_lower] = (
+            PostgresPartitionedModelState(
+                app_label=app_label,
+                name=model_state.name,
+                fields=list(model_state.fields.items()),
+                options=dict(model_state.options),
+                bases=(PostgresPartitionedModel,),
+                managers=list(model_state.managers),
+                partitioning_options={
+                    'method': PostgresPartitioningMethod.RANGE,
+                    'key': [self.key],
+                },
+            )
+        )
+        state.reload_model(app_label, self.name_lower, delay=True)
+
+    def database_forwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        model = to_state.apps.get_model(app_label, self.name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+
+        old_table = self._retire_table(schema_editor, model)
+        schema_editor.create_partitioned_model(model)
+        schema_editor.add_default_partition(model, 'default')
+
+        oldest = self._min_key(schema_editor, old_table)
+        for partition in self._monthly_partitions(oldest):
+            partition.create(
+                model,
+                schema_editor,
+                comment=AUTO_PARTITIONED_COMMENT,
+            )
+
+        self._copy_rows(schema_editor, model, old_table)
+
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        model = to_state.apps.get_model(app_label, self.name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+
+        old_table = self._retire_table(schema_editor, model)
+        schema_editor.create_model(model)
+        self._copy_rows(schema_editor, model, old_table)
+
+    def _retire_table(self, schema_editor, model) -> str:
+        """
+        Rename the current table out of the way and free the index and
+        primary key names it holds, so the replacement can reuse them.
+        """
+        connection = schema_editor.connection
+        quote_name = schema_editor.quote_name
+        table = model._meta.db_table
+        old_table = f'{table}_unpartitioned'
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor,
+                table,
+            )
+
+        schema_editor.execute(
+            f'ALTER TABLE {quote_name(table)} RENAME TO {quote_name(old_table)}',
+        )
+        for name, constraint in constraints.items():
+            if constraint['primary_key']:
+                schema_editor.execute(
+                    f'ALTER TABLE {quote_name(old_table)} RENAME CONSTRAINT '
+                    f'{quote_name(name)} TO {quote_name(f"{old_table}_pkey")}',
+                )
+            elif constraint['index'] and not constraint['unique']:
+                schema_editor.execute(f'DROP INDEX {quote_name(name)}')
+
+        return old_table
+
+    def _min_key(self, schema_editor, table: str) -> datetime | None:
+        quote_name = schema_editor.quote_name
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT MIN({quote_name(self.key)}) FROM {quote_name(table)}',
+            )
+            return cursor.fetchone()[0]
+
+    def _monthly_partitions(self, oldest: datetime | None):
+        size = PostgresTimePartitionSize(months=1)
+        now = timezone.now()
+        start = size.start(min(oldest or now, now))
+        end = size.start(now)
+        for _ in range(self.months_ahead + 1):
+            end += size.as_delta()
+
+        while start < end:
+            yield PostgresTimePartition(size=size, start_datetime=start)
+            start += size.as_delta()
+
+    def _copy_rows(self, schema_editor, model, old_table: str) -> None:
+        quote_name = schema_editor.quote_name
+        table = model._meta.db_table
+        columns = ', '.join(
+            quote_name(field.column)
+            for field in model._meta.local_concrete_fields
+        )
+        schema_editor.execute(
+            f'INSERT INTO {quote_name(table)} ({columns}) '
+            f'SELECT {columns} FROM {quote_name(old_table)}',
+        )
+        schema_editor.execute(f'DROP TABLE {quote_name(old_table)}')
@@ -0,0 +1,113 @@
+import base64
+import binascii
+import uuid
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CreatedAtCursorPagination(BasePagination):
+    """
+    Keyset pagination over (created_at, id), newest first.
+
+    The cursor encodes the (created_at, id) of the last row of a page and the
+    next page is read with a range condition on it, so every page costs the
+    same index range scan however deep it is. Models paginated with this
+    need a composite index on (created_at, id).
+
+    Response:
+        {"next": <url or null>, "results": [...]}
+    """
+
+    cursor_query_param = 'cursor'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request) -> int:
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if requested > 0:
+            return min(requested, self.max_page_size)
+        return self.page_size
+
+    def encode_cursor(self, row) -> str:
+        position = f'{row.created_at.isoformat()}|{row.id}'
+        return base64.urlsafe_b64encode(position.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            position = base64.urlsafe_b64decode(encoded.encode()).decode()
+            created_at, row_id = position.split('|')
+            created_at = parse_datetime(created_at)
+            row_id = uuid.UUID(row_id)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message) from None
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, row_id
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by('-created_at', '-id')
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            created_at, row_id = cursor
+            # created_at <= c bounds the index scan; the OR breaks ties on id
+            queryset = queryset.filter(
+                Q(created_at__lte=created_at),
+                Q(created_at__lt=created_at) | Q(id__lt=row_id),
+            )
+
+        # Fetch one extra row to know whether there is a next page
+        rows = list(queryset[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.page[-1]),
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ('next', self.get_next_link()),
+                    ('results', data),
+                ],
+            ),
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'results': schema,
+            },
+        }
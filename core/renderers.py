@@ -0,0 +1,36 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with orjson.
+
+    UUIDs and datetimes are encoded natively; anything else orjson cannot
+    encode (Decimal, lazy translations, timedeltas...) goes through DRF's
+    JSONEncoder.default, so the output is byte-identical to JSONRenderer's
+    compact output. Indented output (e.g. `Accept: application/json;
+    indent=4` or the browsable API) is left to JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=ORJSON_OPTIONS,
+        )
+        # Like JSONRenderer, escape the separators that are invalid in
+        # JavaScript string literals
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+            b'\xe2\x80\xa9',
+            b'\\u2029',
+        )
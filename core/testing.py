@@ -0,0 +1,46 @@
+from collections.abc import Callable, Sequence
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryCountTestMixin:
+    """
+    TestCase assertions against N+1 queries in endpoints.
+
+    An endpoint is requested against fixtures of different sizes; the number
+    of queries must be the same for every size and within a fixed bound.
+    """
+
+    def assertQueryCountIndependentOfRows(
+        self,
+        make_request: Callable[[int], Callable[[], object]],
+        *,
+        max_queries: int,
+        sizes: Sequence[int] = (1, 10),
+    ) -> None:
+        """
+        make_request(rows) creates a fixture with `rows` rows and returns a
+        callable making the request; only that call is counted.
+        """
+        runs = []
+        for rows in sizes:
+            request = make_request(rows)
+            with CaptureQueriesContext(connection) as queries:
+                request()
+            runs.append((rows, [query['sql'] for query in queries]))
+
+        counts = {rows: len(sqls) for rows, sqls in runs}
+        largest, sqls = runs[-1]
+        self.assertEqual(
+            len(set(counts.values())),
+            1,
+            f'Query count grows with rows {counts}; with {largest} rows:\n'
+            + '\n'.join(sqls),
+        )
+        self.assertLessEqual(
+            len(sqls),
+            max_queries,
+            f'{len(sqls)} queries, expected at most {max_queries}:\n'
+            + '\n'.join(sqls),
+        )
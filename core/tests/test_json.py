@@ -0,0 +1,134 @@
+import datetime
+import io
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+from hand.constants import DetectionStatus
+from hand.factories import DetectionTileFactory, HandDetectionFactory
+from hand.packing import PackedDetectionTile, pack_detection_tiles
+from user.factories import ClientFactory
+
+
+class TestORJSONRenderer(SimpleTestCase):
+    def assertRendersLikeJSONRenderer(self, data, **kwargs):
+        self.assertEqual(
+            ORJSONRenderer().render(data, **kwargs),
+            JSONRenderer().render(data, **kwargs),
+        )
+
+    def test_matches_json_renderer(self):
+        fixtures = [
+            {'id': uuid.uuid4(), 'confidence_overall': '0.9500'},
+            {'confidence': Decimal('0.9876'), 'count': 3, 'ratio': 0.1},
+            {
+                'created_at': datetime.datetime(
+                    2026,
+                    1,
+                    2,
+                    3,
+                    4,
+                    5,
+                    678901,
+                    tzinfo=datetime.UTC,
+                ),
+                'updated_at': datetime.datetime(2026, 1, 2, 3, 4, 5),
+                'on': datetime.date(2026, 1, 2),
+            },
+            OrderedDict([('next', None), ('results', [{'tiles': []}])]),
+            {'asset_id': [ErrorDetail('Asset not found.', code='invalid')]},
+            {'detail': gettext_lazy('Not found.')},
+            {'took': datetime.timedelta(seconds=1.5)},
+            {'label': 'Mahjong 麻將 🀄', 'note': 'a\u2028b\u2029c'},
+            {'nested': [[1, 2], (3, 4), {'a': True, 'b': None}]},
+            [],
+        ]
+
+        for data in fixtures:
+            with self.subTest(data=data):
+                self.assertRendersLikeJSONRenderer(data)
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indent_falls_back_to_json_renderer(self):
+        self.assertRendersLikeJSONRenderer(
+            {'id': uuid.uuid4(), 'tiles': [1, 2]},
+            accepted_media_type='application/json; indent=4',
+        )
+
+    def test_unsupported_type_raises(self):
+        with self.assertRaises(TypeError):
+            ORJSONRenderer().render({'value': object()})
+
+
+class TestORJSONRendererResponses(TestCase):
+    def test_detection_responses_match_json_renderer(self):
+        client = ClientFactory()
+        HandDetectionFactory(
+            hand__client=client,
+            status=DetectionStatus.SUCCEEDED.value,
+            confidence_overall=Decimal('0.8125'),
+            packed_tiles=pack_detection_tiles(
+                [PackedDetectionTile('RD', 1, 2, 3, 4, Decimal('0.7000'))],
+            ),
+        )
+        detection = HandDetectionFactory(
+            hand__client=client,
+            status=DetectionStatus.FAILED.value,
+            error_code='inference_error',
+            error_message='Model inference failed',
+        )
+        DetectionTileFactory(detection=detection)
+
+        api = APIClient()
+        for url in [
+            '/hand/detection/',
+            f'/hand/detection/{detection.id}/',
+            f'/hand/detection/{uuid.uuid4()}/',
+        ]:
+            with self.subTest(url=url):
+                response = api.get(
+                    url,
+                    HTTP_X_INSTALL_ID=client.install_id,
+                    HTTP_ACCEPT='application/json',
+                )
+
+                self.assertEqual(
+                    response.content,
+                    JSONRenderer().render(response.data),
+                )
+
+
+class TestORJSONParser(SimpleTestCase):
+    def parse(self, body: bytes):
+        return ORJSONParser().parse(io.BytesIO(body))
+
+    def test_matches_json_parser(self):
+        body = (
+            '{"asset_id":"8c4a4d0e-52a1-4b7c-9a65-0a3f8c1e2d3b",'
+            '"tiles":[{"tile_code":"1B","sort_order":0}],'
+            '"label":"麻將","confidence":0.95,"source":null}'
+        ).encode()
+
+        self.assertEqual(
+            self.parse(body),
+            JSONParser().parse(io.BytesIO(body)),
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            self.parse(b'{"asset_id": ')
+
+    def test_nan_rejected(self):
+        with self.assertRaises(ParseError):
+            self.parse(b'{"confidence": NaN}')
@@ -0,0 +1,179 @@
+from unittest.mock import patch
+
+import boto3
+import httpx
+from botocore.stub import Stubber
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from core.metrics import (
+    DB,
+    HISTOGRAMS,
+    Histogram,
+    InstrumentedTransport,
+    collect_request_metrics,
+    instrument_boto3_client,
+    record_call,
+)
+from user.factories import ClientFactory
+from user.models import Client
+
+
+class TestHistogram(TestCase):
+    def test_renders_cumulative_buckets(self):
+        histogram = Histogram('test_seconds', 'Test.', ['view'], [0.1, 1.0])
+
+        histogram.observe(0.05, view='a')
+        histogram.observe(0.5, view='a')
+        histogram.observe(5, view='a')
+
+        self.assertEqual(
+            histogram.render(),
+            [
+                '# HELP test_seconds Test.',
+                '# TYPE test_seconds histogram',
+                'test_seconds_bucket{view="a",le="0.1"} 1',
+                'test_seconds_bucket{view="a",le="1.0"} 2',
+                'test_seconds_bucket{view="a",le="+Inf"} 3',
+                'test_seconds_sum{view="a"} 5.55',
+                'test_seconds_count{view="a"} 3',
+            ],
+        )
+
+    def test_escapes_label_values(self):
+        histogram = Histogram('test_total', 'Test.', ['view'], [1])
+
+        histogram.observe(1, view='a"b')
+
+        self.assertIn('test_total_count{view="a\\"b"} 1', histogram.render())
+
+
+class TestCollectRequestMetrics(TestCase):
+    def test_counts_queries(self):
+        with collect_request_metrics() as metrics:
+            Client.objects.count()
+            Client.objects.exists()
+
+        self.assertEqual(metrics.calls[DB].count, 2)
+        self.assertGreater(metrics.calls[DB].seconds, 0)
+
+    def test_ignores_calls_outside_collection(self):
+        record_call('modal', 1.0)
+
+        with collect_request_metrics() as metrics:
+            pass
+        Client.objects.count()
+
+        self.assertEqual(metrics.calls, {})
+
+    @patch(
+        'httpx.HTTPTransport.handle_request',
+        return_value=httpx.Response(200),
+    )
+    def test_counts_httpx_requests(self, mock_handle):
+        with (
+            collect_request_metrics() as metrics,
+            httpx.Client(transport=InstrumentedTransport('modal')) as http,
+        ):
+            http.get('http://modal.test/results/1')
+            http.get('http://modal.test/results/2')
+
+        self.assertEqual(metrics.calls['modal'].count, 2)
+
+    def test_counts_boto3_calls(self):
+        s3_client = instrument_boto3_client(
+            boto3.client(
+                's3',
+                endpoint_url='http://s3.test',
+                region_name='auto',
+                aws_access_key_id='key',
+                aws_secret_access_key='secret',
+            ),
+        )
+
+        with (
+            Stubber(s3_client) as stubber,
+            collect_request_metrics() as metrics,
+        ):
+            stubber.add_response(
+                'delete_object',
+                {},
+                {'Bucket': 'bucket', 'Key': 'key'},
+            )
+            s3_client.delete_object(Bucket='bucket', Key='key')
+
+        self.assertEqual(metrics.calls['s3'].count, 1)
+
+
+class TestRequestMetricsMiddleware(TestCase):
+    def setUp(self):
+        for histogram in HISTOGRAMS:
+            histogram.clear()
+        self.api_client = APIClient()
+        self.client_obj = ClientFactory()
+
+    def get_me(self):
+        return self.api_client.get(
+            '/user/client/me/',
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+        )
+
+    @override_settings(REQUEST_METRICS_ENABLED=True)
+    def test_adds_server_timing(self):
+        response = self.get_me()
+
+        self.assertEqual(response.status_code, 200)
+        timing = response['Server-Timing']
+        self.assertRegex(timing, r'db;desc="\d+ calls";dur=[\d.]+')
+        self.assertRegex(timing, r'total;dur=[\d.]+$')
+
+    @override_settings(
+        REQUEST_METRICS_ENABLED=True,
+        METRICS_AUTH_TOKEN='metrics-token',
+    )
+    def test_exposes_histograms(self):
+        self.get_me()
+
+        response = self.api_client.get(
+            '/metrics',
+            HTTP_AUTHORIZATION='Bearer metrics-token',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        self.assertIn(
+            'http_request_duration_seconds_count'
+            '{view="client-me",method="GET",status="200"} 1',
+            body,
+        )
+        self.assertIn(
+            'http_request_db_queries_count{view="client-me"} 1',
+            body,
+        )
+
+    @override_settings(
+        REQUEST_METRICS_ENABLED=True,
+        METRICS_AUTH_TOKEN='metrics-token',
+    )
+    def test_metrics_require_token(self):
+        self.assertEqual(self.api_client.get('/metrics').status_code, 401)
+
+        response = self.api_client.get(
+            '/metrics',
+            HTTP_AUTHORIZATION='Bearer metrics-token',
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(REQUEST_METRICS_ENABLED=True, METRICS_AUTH_TOKEN=None)
+    def test_metrics_not_served_without_token(self):
+        self.get_me()
+
+        self.assertEqual(self.api_client.get('/metrics').status_code, 404)
+
+    def test_disabled_by_default(self):
+        response = self.get_me()
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(self.api_client.get('/metrics').status_code, 404)
@@ -1 +1,30 @@
-# Create your views here.
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+
+from core.metrics import render_metrics
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def metrics(request):
+    """
+    Request histograms of this process in the Prometheus text format.
+
+    Requires `Authorization: Bearer <METRICS_AUTH_TOKEN>`; without a token
+    configured the endpoint does not exist, so metrics are never public.
+    """
+    token = settings.METRICS_AUTH_TOKEN
+    if not settings.REQUEST_METRICS_ENABLED or not token:
+        raise Http404
+
+    if not constant_time_compare(
+        request.headers.get('Authorization', ''),
+        f'Bearer {token}',
+    ):
+        return HttpResponse(status=401)
+
+    return HttpResponse(
+        render_metrics(),
+        content_type=PROMETHEUS_CONTENT_TYPE,
+    )
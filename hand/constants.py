@@ -63,3 +63,12 @@ class DetectionStatus(Enum):
     @classmethod
     def choices(cls):
         return [(item.value, item.name) for item in cls]
+
+
+# Detections in these statuses never change again
+TERMINAL_DETECTION_STATUSES = frozenset(
+    [DetectionStatus.SUCCEEDED.value, DetectionStatus.FAILED.value],
+)
+
+# Seconds clients may reuse a terminal detection without revalidating
+TERMINAL_DETECTION_MAX_AGE = 24 * 3600
@@ -1,6 +1,6 @@
 import django_filters
 
-from hand.models import HandCorrection
+from hand.models import HandCorrection, HandDetection
 
 
 class HandCorrectionFilter(django_filters.FilterSet):
@@ -11,3 +11,13 @@ class HandCorrectionFilter(django_filters.FilterSet):
     class Meta:
         model = HandCorrection
         fields = ['hand_id']
+
+
+class HandDetectionFilter(django_filters.FilterSet):
+    """Filter for HandDetection list endpoint."""
+
+    hand_id = django_filters.UUIDFilter(field_name='hand_id')
+
+    class Meta:
+        model = HandDetection
+        fields = ['hand_id']
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from hand.services.detection_packing import (
+    DEFAULT_BACKFILL_BATCH_SIZE,
+    backfill_packed_tiles,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Backfill HandDetection.packed_tiles from DetectionTile rows for '
+        'detections stored before tiles were packed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BACKFILL_BATCH_SIZE,
+            help='Detections packed per batch.',
+        )
+        parser.add_argument(
+            '--delete-rows',
+            action='store_true',
+            help='Delete DetectionTile rows once they are packed.',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+
+        report = backfill_packed_tiles(
+            batch_size=options['batch_size'],
+            delete_rows=options['delete_rows'],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Packed {report.packed} detections in {report.batches} '
+                f'batches ({report.skipped} skipped, '
+                f'{report.rows_deleted} tile rows deleted)',
+            ),
+        )
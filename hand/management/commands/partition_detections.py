@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+
+from hand.services.partitioning import maintain_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        'Create upcoming monthly partitions for the detection tables and '
+        'detach partitions older than DETECTION_PARTITION_RETENTION_MONTHS '
+        'into the archive schema.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report planned changes without applying them.',
+        )
+        parser.add_argument(
+            '--skip-create',
+            action='store_true',
+            help='Do not create partitions.',
+        )
+        parser.add_argument(
+            '--skip-archive',
+            action='store_true',
+            help='Do not archive expired partitions.',
+        )
+        parser.add_argument(
+            '--archive-schema',
+            default=None,
+            help='Schema for detached partitions '
+            '(defaults to DETECTION_ARCHIVE_SCHEMA).',
+        )
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Drop expired partitions instead of archiving them.',
+        )
+
+    def handle(self, *args, **options):
+        report = maintain_partitions(
+            skip_create=options['skip_create'],
+            skip_archive=options['skip_archive'],
+            dry_run=options['dry_run'],
+            schema=options['archive_schema'],
+            drop=options['drop'],
+        )
+
+        archive_verb = 'drop' if options['drop'] else 'archive'
+        for table in report.created:
+            self.stdout.write(
+                f'Would create {table}'
+                if report.dry_run
+                else f'Created {table}',
+            )
+        for table in report.archived:
+            self.stdout.write(
+                f'Would {archive_verb} {table}'
+                if report.dry_run
+                else f'{archive_verb.capitalize()}d {table}',
+            )
+
+        summary = (
+            f'{len(report.created)} partitions to create, '
+            f'{len(report.archived)} to {archive_verb}'
+            if report.dry_run
+            else f'{len(report.created)} partitions created, '
+            f'{len(report.archived)} {archive_verb}d'
+        )
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:36
+
+import django.db.models.deletion
+import psqlextra.manager.manager
+from core.migration_operations import ConvertToMonthlyPartitionedModel
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hand", "0007_handcontext_handwinmodifier"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="detectiontile",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="handdetection",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="detectiontile",
+            name="detection",
+            field=models.ForeignKey(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tiles",
+                to="hand.handdetection",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="handcorrection",
+            name="detection",
+            field=models.ForeignKey(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="corrections",
+                to="hand.handdetection",
+            ),
+        ),
+        ConvertToMonthlyPartitionedModel(name="HandDetection"),
+        ConvertToMonthlyPartitionedModel(name="DetectionTile"),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hand", "0008_partition_detections"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="handdetection",
+            name="packed_tiles",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:43
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+# hand.tiles.TILE_CODES as of this migration, frozen so the backfill does not
+# depend on the current code
+TILE_CODES = [
+    "1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B",
+    "1C", "2C", "3C", "4C", "5C", "6C", "7C", "8C", "9C",
+    "1D", "2D", "3D", "4D", "5D", "6D", "7D", "8D", "9D",
+    "EW", "SW", "WW", "NW", "RD", "GD", "WD",
+    "1F", "2F", "3F", "4F", "1S", "2S", "3S", "4S",
+]  # fmt: skip
+
+
+def pack_hand_tiles(apps, schema_editor):
+    schema_editor.execute(
+        """
+        UPDATE hand_handcorrection correction
+        SET tile_indexes = coalesce(
+            (
+                SELECT array_agg(
+                    array_position(%s::varchar[], tile.tile_code) - 1
+                    ORDER BY tile.sort_order, tile.created_at
+                )
+                FROM hand_handtile tile
+                WHERE tile.hand_correction_id = correction.id
+            ),
+            '{}'
+        )
+        WHERE correction.tile_indexes IS NULL
+        """,
+        [TILE_CODES],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hand", "0009_handdetection_packed_tiles"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="handcorrection",
+            name="tile_indexes",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.PositiveSmallIntegerField(),
+                blank=True,
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.RunPython(
+            pack_hand_tiles,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
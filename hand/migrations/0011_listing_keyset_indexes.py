@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("asset", "0002_alter_uploadsession_status_and_more"),
+        ("hand", "0010_handcorrection_tile_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="handcorrection",
+            index=models.Index(
+                fields=["created_at", "id"], name="hand_handco_created_552759_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="handdetection",
+            index=models.Index(
+                fields=["created_at", "id"], name="hand_handde_created_957daf_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hand", "0011_listing_keyset_indexes"),
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="handdetection",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="hand_detections",
+                to="user.client",
+            ),
+        ),
+        migrations.AddField(
+            model_name="handcorrection",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="hand_corrections",
+                to="user.client",
+            ),
+        ),
+        # Made NOT NULL in the next migration: updating rows here leaves
+        # deferred foreign key checks pending, which block ALTER TABLE
+        migrations.RunSQL(
+            sql="""
+                UPDATE hand_handdetection detection
+                SET client_id = hand.client_id
+                FROM hand_hand hand
+                WHERE detection.hand_id = hand.id
+                    AND detection.client_id IS NULL;
+
+                UPDATE hand_handcorrection correction
+                SET client_id = hand.client_id
+                FROM hand_hand hand
+                WHERE correction.hand_id = hand.id
+                    AND correction.client_id IS NULL;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("asset", "0004_client_indexes"),
+        ("hand", "0012_denormalize_client"),
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="handcorrection",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="hand_corrections",
+                to="user.client",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="handdetection",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="hand_detections",
+                to="user.client",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="handcorrection",
+            index=models.Index(
+                fields=["client", "created_at"], name="hand_handco_client__d699ae_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="handdetection",
+            index=models.Index(
+                fields=["client", "created_at"], name="hand_handde_client__5d78aa_idx"
+            ),
+        ),
+    ]
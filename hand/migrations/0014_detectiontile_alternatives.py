@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hand", "0013_client_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="detectiontile",
+            name="alternatives",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
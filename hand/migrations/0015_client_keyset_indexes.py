@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("asset", "0004_client_indexes"),
+        ("hand", "0014_detectiontile_alternatives"),
+        ("user", "0002_clientdeletion"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="handcorrection",
+            name="hand_handco_created_552759_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="handcorrection",
+            name="hand_handco_client__d699ae_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="handdetection",
+            name="hand_handde_created_957daf_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="handdetection",
+            name="hand_handde_client__5d78aa_idx",
+        ),
+        migrations.AddIndex(
+            model_name="handcorrection",
+            index=models.Index(
+                fields=["client", "created_at", "id"],
+                name="hand_handco_client__5b137a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="handdetection",
+            index=models.Index(
+                fields=["client", "created_at", "id"],
+                name="hand_handde_client__250d03_idx",
+            ),
+        ),
+    ]
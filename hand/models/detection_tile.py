@@ -1,13 +1,16 @@
 import uuid
 
 from django.db import models
+from psqlextra.models import PostgresPartitionedModel
+from psqlextra.types import PostgresPartitioningMethod
 
 from core.models import TimeStampedModel
 from hand.models.hand_detection import HandDetection
+from hand.packing import PackedDetectionTile, pack_tile_alternatives
 from hand.tiles import TileCode
 
 
-class DetectionTile(TimeStampedModel):
+class DetectionTile(PostgresPartitionedModel, TimeStampedModel):
     """
     Represents a single tile detected within a HandDetection run.
 
@@ -15,14 +18,22 @@ class DetectionTile(TimeStampedModel):
     - A canonical tile_code (e.g., '1W', 'RD', 'EW')
     - Bounding box coordinates (x1, y1, x2, y2) in pixels
     - Per-tile confidence score
+    - Next-best tiles for the box (packed by hand.packing)
+
+    Range-partitioned by created_at month, like HandDetection.
     """
 
+    class PartitioningMeta:
+        method = PostgresPartitioningMethod.RANGE
+        key = ['created_at']
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     detection = models.ForeignKey(
         HandDetection,
         on_delete=models.CASCADE,
         related_name='tiles',
+        db_constraint=False,
     )
 
     tile_code = models.CharField(max_length=8)
@@ -38,6 +49,9 @@ class DetectionTile(TimeStampedModel):
         decimal_places=4,
     )
 
+    # Packed hand.packing.TileAlternative records, best first
+    alternatives = models.BinaryField(null=True, blank=True)
+
     class Meta:
         indexes = [
             models.Index(fields=['detection']),
@@ -50,3 +64,23 @@ class DetectionTile(TimeStampedModel):
                 name='hand_detectiontile_tile_code_valid',
             ),
         ]
+
+    @classmethod
+    def from_packed(
+        cls,
+        detection: HandDetection,
+        tile: PackedDetectionTile,
+        **kwargs,
+    ) -> 'DetectionTile':
+        """An unsaved row for a tile as packed on the detection."""
+        return cls(
+            detection=detection,
+            tile_code=tile.tile_code,
+            x1=tile.x1,
+            y1=tile.y1,
+            x2=tile.x2,
+            y2=tile.y2,
+            confidence=tile.confidence,
+            alternatives=pack_tile_alternatives(tile.alternatives) or None,
+            **kwargs,
+        )
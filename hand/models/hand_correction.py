@@ -1,10 +1,13 @@
 import uuid
 
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
 from core.models import TimeStampedModel
 from hand.models.hand import Hand
 from hand.models.hand_detection import HandDetection
+from hand.packing import unpack_tile_codes
+from user.models import Client
 
 
 class HandCorrection(TimeStampedModel):
@@ -16,6 +19,10 @@ class HandCorrection(TimeStampedModel):
     of the tiles the user confirms are in the hand.
 
     The Hand.active_hand_correction points to the latest verified snapshot.
+
+    The snapshot is stored as an ordered array of tile indexes (see
+    hand.tiles.TILE_CODES). HandTile rows are only written while
+    HAND_CORRECTION_STORE_TILE_ROWS is on.
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -26,17 +33,68 @@ class HandCorrection(TimeStampedModel):
         related_name='corrections',
     )
 
+    # Denormalized from hand.client for join-free ownership filters
+    client = models.ForeignKey(
+        Client,
+        on_delete=models.CASCADE,
+        related_name='hand_corrections',
+        db_index=False,
+    )
+
     detection = models.ForeignKey(
         HandDetection,
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
         related_name='corrections',
+        # HandDetection is partitioned, so its id alone is not unique
+        db_constraint=False,
+    )
+
+    # Ordered tile indexes; null for corrections only stored as HandTile rows
+    tile_indexes = ArrayField(
+        models.PositiveSmallIntegerField(),
+        null=True,
+        blank=True,
     )
 
     class Meta:
         indexes = [
             models.Index(fields=['hand', 'created_at']),
+            # Client listings, in keyset pagination order
+            models.Index(fields=['client', 'created_at', 'id']),
             models.Index(fields=['detection']),
         ]
         ordering = ['-created_at']
+
+    def save(self, *args, **kwargs):
+        if self.client_id is None:
+            self.client_id = self.hand.client_id
+        return super().save(*args, **kwargs)
+
+    @property
+    def tile_codes(self) -> list[str]:
+        """Tile codes of the snapshot, in display order."""
+        if self.tile_indexes is None:
+            return [tile.tile_code for tile in self.tiles.all()]
+        return unpack_tile_codes(self.tile_indexes)
+
+    def snapshot_tiles(self) -> list:
+        """
+        The snapshot as HandTile instances, in display order.
+
+        Built from tile_indexes without a query when the snapshot is packed,
+        with sort_order set to each tile's position.
+        """
+        if self.tile_indexes is None:
+            return list(self.tiles.all())
+
+        hand_tile = self.tiles.model
+        return [
+            hand_tile(
+                hand_correction=self,
+                tile_code=tile_code,
+                sort_order=sort_order,
+            )
+            for sort_order, tile_code in enumerate(self.tile_codes)
+        ]
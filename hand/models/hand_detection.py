@@ -1,14 +1,17 @@
 import uuid
 
 from django.db import models
+from psqlextra.models import PostgresPartitionedModel
+from psqlextra.types import PostgresPartitioningMethod
 
 from core.models import TimeStampedModel
 from hand.constants import DetectionStatus
 from hand.models.hand import Hand
 from asset.models import AssetRef
+from user.models import Client
 
 
-class HandDetection(TimeStampedModel):
+class HandDetection(PostgresPartitionedModel, TimeStampedModel):
     """
     Represents a single detection run for a hand.
 
@@ -18,8 +21,16 @@ class HandDetection(TimeStampedModel):
 
     Status lifecycle:
         pending -> running -> succeeded | failed
+
+    The table is range-partitioned by created_at month (see
+    hand.services.partitioning). Foreign keys pointing here cannot be
+    enforced by the database, so they are declared with db_constraint=False.
     """
 
+    class PartitioningMeta:
+        method = PostgresPartitioningMethod.RANGE
+        key = ['created_at']
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     hand = models.ForeignKey(
@@ -28,6 +39,14 @@ class HandDetection(TimeStampedModel):
         related_name='detections',
     )
 
+    # Denormalized from hand.client for join-free ownership filters
+    client = models.ForeignKey(
+        Client,
+        on_delete=models.CASCADE,
+        related_name='hand_detections',
+        db_index=False,
+    )
+
     asset_ref = models.ForeignKey(
         AssetRef,
         on_delete=models.PROTECT,
@@ -54,6 +73,10 @@ class HandDetection(TimeStampedModel):
         blank=True,
     )
 
+    # Detected tiles in the compact layout of hand.packing, readable without
+    # a join on DetectionTile. Null for detections that were never packed.
+    packed_tiles = models.BinaryField(null=True, blank=True)
+
     # Error tracking for failed detections
     error_code = models.CharField(max_length=64, blank=True, default='')
     error_message = models.TextField(blank=True, default='')
@@ -61,6 +84,8 @@ class HandDetection(TimeStampedModel):
     class Meta:
         indexes = [
             models.Index(fields=['hand', 'created_at']),
+            # Client listings, in keyset pagination order
+            models.Index(fields=['client', 'created_at', 'id']),
             models.Index(fields=['asset_ref']),
             models.Index(fields=['status']),
             models.Index(fields=['model_version', 'status']),
@@ -74,3 +99,8 @@ class HandDetection(TimeStampedModel):
                 name='hand_handdetection_status_valid',
             ),
         ]
+
+    def save(self, *args, **kwargs):
+        if self.client_id is None:
+            self.client_id = self.hand.client_id
+        return super().save(*args, **kwargs)
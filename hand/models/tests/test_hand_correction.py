@@ -0,0 +1,35 @@
+from django.test import TestCase
+
+from hand.factories import HandFactory
+from hand.models import HandCorrection, HandTile
+from hand.packing import pack_tile_codes
+
+
+class TestHandCorrectionModel(TestCase):
+    def test_tile_codes_from_tile_indexes(self):
+        correction = HandCorrection.objects.create(
+            hand=HandFactory(),
+            tile_indexes=pack_tile_codes(['EW', '9D']),
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(correction.tile_codes, ['EW', '9D'])
+
+    def test_unpacked_correction_reads_hand_tiles(self):
+        correction = HandCorrection.objects.create(hand=HandFactory())
+        HandTile.objects.create(
+            hand_correction=correction,
+            tile_code='2B',
+            sort_order=1,
+        )
+        HandTile.objects.create(
+            hand_correction=correction,
+            tile_code='1B',
+            sort_order=0,
+        )
+
+        self.assertEqual(correction.tile_codes, ['1B', '2B'])
+        self.assertEqual(
+            [tile.sort_order for tile in correction.snapshot_tiles()],
+            [0, 1],
+        )
@@ -0,0 +1,223 @@
+import struct
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import NamedTuple
+
+from hand.tiles import tile_code_at, tile_index
+
+# Layout: one version byte, then one fixed-size record per tile. Version 2
+# follows each record with its alternatives: a count (u8) and that many
+# alternative records. Tiles without alternatives are packed as version 1.
+PACKED_TILES_VERSION = 1
+PACKED_TILES_WITH_ALTERNATIVES_VERSION = 2
+
+# tile index (u8), x1, y1, x2, y2 (u16 pixels), confidence (u16 fixed-point)
+DETECTION_TILE_RECORD = struct.Struct('<BHHHHH')
+
+# tile index (u8), confidence (u16 fixed-point)
+TILE_ALTERNATIVE_RECORD = struct.Struct('<BH')
+ALTERNATIVE_COUNT = struct.Struct('<B')
+
+# Confidence is stored in units of 1e-4, the precision of
+# DetectionTile.confidence, so packed and row values round-trip exactly
+CONFIDENCE_SCALE = 10_000
+CONFIDENCE_PLACES = 4
+
+MAX_COORDINATE = 0xFFFF
+
+
+class TileAlternative(NamedTuple):
+    """Another tile a detected box may show, with the detector's score."""
+
+    tile_code: str
+    confidence: Decimal
+
+
+class PackedDetectionTile(NamedTuple):
+    tile_code: str
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    confidence: Decimal
+    # Next-best tiles for the box, best first
+    alternatives: tuple[TileAlternative, ...] = ()
+
+
+def confidence_to_fixed(confidence: float | Decimal) -> int:
+    value = round(Decimal(str(confidence)) * CONFIDENCE_SCALE)
+    if not 0 <= value <= CONFIDENCE_SCALE:
+        raise ValueError(f'Confidence out of range: {confidence}')
+    return int(value)
+
+
+def confidence_from_fixed(value: int) -> Decimal:
+    return Decimal(value).scaleb(-CONFIDENCE_PLACES)
+
+
+def _coordinate(value: int) -> int:
+    value = int(value)
+    if not 0 <= value <= MAX_COORDINATE:
+        raise ValueError(f'Coordinate out of range: {value}')
+    return value
+
+
+def _pack_tile(tile: PackedDetectionTile) -> bytes:
+    return DETECTION_TILE_RECORD.pack(
+        tile_index(tile.tile_code),
+        _coordinate(tile.x1),
+        _coordinate(tile.y1),
+        _coordinate(tile.x2),
+        _coordinate(tile.y2),
+        confidence_to_fixed(tile.confidence),
+    )
+
+
+def pack_tile_alternatives(alternatives: Iterable[TileAlternative]) -> bytes:
+    """
+    Pack tile alternatives as consecutive alternative records.
+
+    Raises:
+        ValueError: If a tile code or confidence is out of range.
+    """
+    return b''.join(
+        TILE_ALTERNATIVE_RECORD.pack(
+            tile_index(alternative.tile_code),
+            confidence_to_fixed(alternative.confidence),
+        )
+        for alternative in alternatives
+    )
+
+
+def unpack_tile_alternatives(
+    data: bytes | memoryview | None,
+) -> tuple[TileAlternative, ...]:
+    """
+    Decode alternatives packed by pack_tile_alternatives (None for none).
+
+    Raises:
+        ValueError: If the data is truncated.
+    """
+    if not data:
+        return ()
+    if len(data) % TILE_ALTERNATIVE_RECORD.size:
+        raise ValueError('Truncated tile alternatives')
+    return tuple(
+        TileAlternative(tile_code_at(index), confidence_from_fixed(confidence))
+        for index, confidence in TILE_ALTERNATIVE_RECORD.iter_unpack(data)
+    )
+
+
+def pack_detection_tiles(tiles: Iterable[PackedDetectionTile]) -> bytes:
+    """
+    Pack detection tiles into the compact binary layout.
+
+    Tiles are stored sorted by x1, the order DetectionTile rows are read in,
+    so decoding needs no sorting.
+
+    Raises:
+        ValueError: If a tile code, coordinate or confidence is out of range,
+            or a tile has more than 255 alternatives.
+    """
+    tiles = sorted(tiles, key=lambda tile: tile.x1)
+    if not any(tile.alternatives for tile in tiles):
+        return bytes([PACKED_TILES_VERSION]) + b''.join(
+            _pack_tile(tile) for tile in tiles
+        )
+
+    records = []
+    for tile in tiles:
+        records.append(_pack_tile(tile))
+        try:
+            records.append(ALTERNATIVE_COUNT.pack(len(tile.alternatives)))
+        except struct.error:
+            raise ValueError('Too many tile alternatives') from None
+        records.append(pack_tile_alternatives(tile.alternatives))
+    return bytes([PACKED_TILES_WITH_ALTERNATIVES_VERSION]) + b''.join(records)
+
+
+def _unpack_tiles_with_alternatives(
+    body: memoryview,
+) -> list[PackedDetectionTile]:
+    tiles = []
+    offset = 0
+    try:
+        while offset < len(body):
+            index, x1, y1, x2, y2, confidence = (
+                DETECTION_TILE_RECORD.unpack_from(body, offset)
+            )
+            offset += DETECTION_TILE_RECORD.size
+            (count,) = ALTERNATIVE_COUNT.unpack_from(body, offset)
+            offset += ALTERNATIVE_COUNT.size
+            end = offset + count * TILE_ALTERNATIVE_RECORD.size
+            if end > len(body):
+                raise ValueError('Truncated packed tiles')
+            tiles.append(
+                PackedDetectionTile(
+                    tile_code=tile_code_at(index),
+                    x1=x1,
+                    y1=y1,
+                    x2=x2,
+                    y2=y2,
+                    confidence=confidence_from_fixed(confidence),
+                    alternatives=unpack_tile_alternatives(body[offset:end]),
+                ),
+            )
+            offset = end
+    except struct.error:
+        raise ValueError('Truncated packed tiles') from None
+    return tiles
+
+
+def unpack_detection_tiles(
+    data: bytes | memoryview,
+) -> list[PackedDetectionTile]:
+    """
+    Decode tiles packed by pack_detection_tiles.
+
+    Raises:
+        ValueError: If the data has an unknown version or is truncated.
+    """
+    data = bytes(data)
+    if data[:1] == bytes([PACKED_TILES_WITH_ALTERNATIVES_VERSION]):
+        return _unpack_tiles_with_alternatives(memoryview(data)[1:])
+    if not data or data[0] != PACKED_TILES_VERSION:
+        raise ValueError('Unsupported packed tiles version')
+
+    body = memoryview(data)[1:]
+    if len(body) % DETECTION_TILE_RECORD.size:
+        raise ValueError('Truncated packed tiles')
+
+    return [
+        PackedDetectionTile(
+            tile_code=tile_code_at(index),
+            x1=x1,
+            y1=y1,
+            x2=x2,
+            y2=y2,
+            confidence=confidence_from_fixed(confidence),
+        )
+        for index, x1, y1, x2, y2, confidence in (
+            DETECTION_TILE_RECORD.iter_unpack(body)
+        )
+    ]
+
+
+def pack_tile_codes(tile_codes: Iterable[str]) -> list[int]:
+    """
+    Pack an ordered list of tile codes into tile indexes.
+
+    Raises:
+        ValueError: If a tile code is invalid.
+    """
+    return [tile_index(code) for code in tile_codes]
+
+
+def unpack_tile_codes(tile_indexes: Iterable[int]) -> list[str]:
+    """
+    Decode tile indexes packed by pack_tile_codes.
+
+    Raises:
+        ValueError: If an index is out of range.
+    """
+    return [tile_code_at(index) for index in tile_indexes]
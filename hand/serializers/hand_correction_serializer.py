@@ -5,6 +5,13 @@ from hand.services.hand_correction import TileInput, create_hand_correction
 from hand.tiles import TileCode
 
 
+class HandTileListSerializer(serializers.ListSerializer):
+    """Reads a correction's tiles from its packed snapshot."""
+
+    def get_attribute(self, instance):
+        return instance.snapshot_tiles()
+
+
 class HandTileSerializer(serializers.ModelSerializer):
     """Serializer for hand tiles."""
 
@@ -13,6 +20,7 @@ class HandTileSerializer(serializers.ModelSerializer):
     class Meta:
         model = HandTile
         fields = ['tile_code', 'sort_order']
+        list_serializer_class = HandTileListSerializer
 
 
 class HandCorrectionSerializer(serializers.ModelSerializer):
@@ -20,7 +28,8 @@ class HandCorrectionSerializer(serializers.ModelSerializer):
     Serializer for hand corrections.
 
     For create: expects `install_id` in context, accepts hand_id, detection_id, tiles.
-    For read: returns all fields including computed is_active.
+    For read: returns all fields including computed is_active, built
+    directly by to_representation.
     """
 
     is_active = serializers.SerializerMethodField()
@@ -53,6 +62,29 @@ class HandCorrectionSerializer(serializers.ModelSerializer):
             return False
         return obj.hand.active_hand_correction_id == obj.id
 
+    def to_representation(self, correction):
+        """
+        Same output as the declared read fields, without binding them or
+        building HandTile instances for a packed snapshot.
+        """
+        if correction.tile_indexes is None:
+            tiles = [
+                {'tile_code': tile.tile_code, 'sort_order': tile.sort_order}
+                for tile in correction.tiles.all()
+            ]
+        else:
+            tiles = [
+                {'tile_code': tile_code, 'sort_order': sort_order}
+                for sort_order, tile_code in enumerate(correction.tile_codes)
+            ]
+
+        return {
+            'id': str(correction.id),
+            'tiles': tiles,
+            'is_active': self.get_is_active(correction),
+            'created_at': _CREATED_AT.to_representation(correction.created_at),
+        }
+
     def validate_hand_id(self, value):
         """Validate hand exists and belongs to client."""
         install_id = self.context.get('install_id')
@@ -60,11 +92,11 @@ class HandCorrectionSerializer(serializers.ModelSerializer):
             return value
 
         try:
-            hand = Hand.objects.select_related('client').get(id=value)
+            hand = Hand.objects.get(id=value)
         except Hand.DoesNotExist:
             raise serializers.ValidationError('Hand not found.') from None
 
-        if hand.client.install_id != install_id:
+        if hand.client_id != install_id:
             raise serializers.ValidationError(
                 'Hand does not belong to this client.',
             )
@@ -100,3 +132,7 @@ class HandCorrectionSerializer(serializers.ModelSerializer):
             tiles=tiles,
             detection=getattr(self, '_detection', None),
         )
+
+
+# Unbound field for the created_at conversion of HandCorrectionSerializer
+_CREATED_AT = serializers.DateTimeField()
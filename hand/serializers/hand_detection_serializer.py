@@ -3,11 +3,31 @@ from rest_framework import serializers
 from asset.models import Asset
 from hand.constants import HandSource
 from hand.models import DetectionTile, HandDetection
+from hand.packing import (
+    CONFIDENCE_PLACES,
+    TileAlternative,
+    unpack_detection_tiles,
+    unpack_tile_alternatives,
+)
+
+
+def _alternatives_representation(
+    alternatives: tuple[TileAlternative, ...],
+) -> list[dict]:
+    return [
+        {
+            'tile_code': alternative.tile_code,
+            'confidence': f'{alternative.confidence:.{CONFIDENCE_PLACES}f}',
+        }
+        for alternative in alternatives
+    ]
 
 
 class DetectionTileSerializer(serializers.ModelSerializer):
     """Serializer for detection tiles."""
 
+    alternatives = serializers.SerializerMethodField()
+
     class Meta:
         model = DetectionTile
         fields = [
@@ -17,6 +37,51 @@ class DetectionTileSerializer(serializers.ModelSerializer):
             'x2',
             'y2',
             'confidence',
+            'alternatives',
+        ]
+
+    def get_alternatives(self, tile: DetectionTile) -> list[dict]:
+        """Other tile codes the box could be, best first."""
+        return _alternatives_representation(
+            unpack_tile_alternatives(tile.alternatives),
+        )
+
+
+class DetectionTilesField(serializers.Field):
+    """
+    Read-only tiles of a detection.
+
+    Decodes HandDetection.packed_tiles when present, producing the same
+    output as DetectionTileSerializer without querying DetectionTile.
+    Detections that were never packed fall back to their DetectionTile rows.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, detection):
+        if detection.packed_tiles is None:
+            return DetectionTileSerializer(
+                detection.tiles.all(),
+                many=True,
+            ).data
+
+        return [
+            {
+                'tile_code': tile.tile_code,
+                'x1': tile.x1,
+                'y1': tile.y1,
+                'x2': tile.x2,
+                'y2': tile.y2,
+                # Matches DecimalField(decimal_places=4) string output
+                'confidence': f'{tile.confidence:.{CONFIDENCE_PLACES}f}',
+                'alternatives': _alternatives_representation(
+                    tile.alternatives,
+                ),
+            }
+            for tile in unpack_detection_tiles(detection.packed_tiles)
         ]
 
 
@@ -25,10 +90,11 @@ class HandDetectionSerializer(serializers.ModelSerializer):
     Serializer for hand detections.
 
     For create: expects `install_id` in context, accepts asset_id, source.
-    For read: returns all fields including nested tiles.
+    For read: returns all fields including nested tiles, built directly by
+    to_representation.
     """
 
-    tiles = DetectionTileSerializer(many=True, read_only=True)
+    tiles = DetectionTilesField()
     asset_ref_id = serializers.UUIDField(source='asset_ref.id', read_only=True)
 
     # Write-only for create
@@ -75,16 +141,11 @@ class HandDetectionSerializer(serializers.ModelSerializer):
         install_id = self.context.get('install_id')
 
         try:
-            asset = Asset.objects.select_related('upload_session__client').get(
-                id=value,
-            )
+            asset = Asset.objects.get(id=value)
         except Asset.DoesNotExist:
             raise serializers.ValidationError('Asset not found.') from None
 
-        if install_id and (
-            not asset.upload_session
-            or asset.upload_session.client.install_id != install_id
-        ):
+        if install_id and asset.client_id != install_id:
             raise serializers.ValidationError(
                 'Asset does not belong to this client.',
             )
@@ -95,3 +156,41 @@ class HandDetectionSerializer(serializers.ModelSerializer):
             )
 
         return value
+
+    def to_representation(self, detection):
+        """
+        Same output as the declared read fields, without binding them.
+
+        ModelSerializer builds its field set once per serializer, i.e. once
+        per polled or retrieved detection, which costs more than the
+        conversions themselves.
+        """
+        confidence_overall = detection.confidence_overall
+        if confidence_overall is not None:
+            confidence_overall = _CONFIDENCE_OVERALL.to_representation(
+                confidence_overall,
+            )
+
+        return {
+            'id': str(detection.id),
+            'hand_id': detection.hand_id,
+            'asset_ref_id': str(detection.asset_ref_id),
+            'status': detection.status,
+            'model_name': detection.model_name,
+            'model_version': detection.model_version,
+            'confidence_overall': confidence_overall,
+            'tiles': _TILES.to_representation(detection),
+            'error_code': detection.error_code,
+            'error_message': detection.error_message,
+            'created_at': _CREATED_AT.to_representation(detection.created_at),
+        }
+
+
+# Unbound fields for the conversions of HandDetectionSerializer
+_confidence_overall_field = HandDetection._meta.get_field('confidence_overall')
+_CONFIDENCE_OVERALL = serializers.DecimalField(
+    max_digits=_confidence_overall_field.max_digits,
+    decimal_places=_confidence_overall_field.decimal_places,
+)
+_TILES = DetectionTilesField()
+_CREATED_AT = serializers.DateTimeField()
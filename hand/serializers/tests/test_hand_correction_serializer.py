@@ -1,12 +1,15 @@
 import uuid
 
 from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
 
 from asset.constants import AssetRole
 from asset.factories import AssetFactory, ClientFactory, UploadSessionFactory
 from asset.models import AssetRef
 from hand.constants import DetectionStatus
 from hand.models import Hand, HandCorrection, HandDetection, HandTile
+from hand.packing import pack_tile_codes
 from hand.serializers.hand_correction_serializer import (
     HandCorrectionSerializer,
     HandTileSerializer,
@@ -152,6 +155,54 @@ class TestHandCorrectionSerializer(TestCase):
         self.assertTrue(serializer.data['is_active'])
         self.assertIn('created_at', serializer.data)
 
+    def test_serializes_packed_tiles_without_query(self):
+        correction = HandCorrection.objects.create(
+            hand=self.hand,
+            tile_indexes=pack_tile_codes(['RD', '1B']),
+        )
+        correction = HandCorrection.objects.select_related('hand').get(
+            id=correction.id,
+        )
+
+        with self.assertNumQueries(0):
+            data = HandCorrectionSerializer(instance=correction).data
+
+        self.assertEqual(
+            data['tiles'],
+            [
+                {'tile_code': 'RD', 'sort_order': 0},
+                {'tile_code': '1B', 'sort_order': 1},
+            ],
+        )
+
+    def test_output_matches_model_serializer(self):
+        packed = HandCorrection.objects.create(
+            hand=self.hand,
+            detection=self.detection,
+            tile_indexes=pack_tile_codes(['RD', '1B', 'EW']),
+        )
+        unpacked = HandCorrection.objects.create(hand=self.hand)
+        HandTile.objects.create(
+            hand_correction=unpacked,
+            tile_code='9D',
+            sort_order=3,
+        )
+        self.hand.active_hand_correction = packed
+        self.hand.save()
+
+        renderer = JSONRenderer()
+        for correction in HandCorrection.objects.select_related('hand'):
+            serializer = HandCorrectionSerializer(instance=correction)
+            expected = serializers.ModelSerializer.to_representation(
+                serializer,
+                correction,
+            )
+
+            self.assertEqual(
+                renderer.render(serializer.data),
+                renderer.render(expected),
+            )
+
     def test_hand_id_required(self):
         data = {
             'tiles': [{'tile_code': '1B', 'sort_order': 0}],
@@ -287,7 +338,8 @@ class TestHandCorrectionSerializer(TestCase):
 
         self.assertIsNotNone(correction.id)
         self.assertEqual(correction.hand_id, self.hand.id)
-        self.assertEqual(correction.tiles.count(), 2)
+        correction.refresh_from_db()
+        self.assertEqual(correction.tile_codes, ['1B', '2B'])
 
     def test_create_with_detection(self):
         data = {
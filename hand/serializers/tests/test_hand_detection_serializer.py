@@ -2,12 +2,21 @@ import uuid
 from decimal import Decimal
 
 from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
 
 from asset.constants import UploadStatus
 from asset.factories import AssetFactory, UploadSessionFactory
 from hand.constants import DetectionStatus
 from hand.factories import DetectionTileFactory, HandDetectionFactory
-from hand.models import HandDetection
+from hand.models import DetectionTile, HandDetection
+from hand.packing import (
+    PackedDetectionTile,
+    TileAlternative,
+    pack_detection_tiles,
+    pack_tile_alternatives,
+    unpack_tile_alternatives,
+)
 from hand.serializers.hand_detection_serializer import (
     DetectionTileSerializer,
     HandDetectionSerializer,
@@ -34,6 +43,28 @@ class TestDetectionTileSerializer(TestCase):
         self.assertEqual(serializer.data['x2'], 110)
         self.assertEqual(serializer.data['y2'], 120)
         self.assertEqual(serializer.data['confidence'], '0.9876')
+        self.assertEqual(serializer.data['alternatives'], [])
+
+    def test_serializes_alternatives(self):
+        tile = DetectionTileFactory(
+            tile_code='1B',
+            alternatives=pack_tile_alternatives(
+                [
+                    TileAlternative('7B', Decimal('0.0512')),
+                    TileAlternative('1F', Decimal('0.0100')),
+                ],
+            ),
+        )
+
+        serializer = DetectionTileSerializer(instance=tile)
+
+        self.assertEqual(
+            serializer.data['alternatives'],
+            [
+                {'tile_code': '7B', 'confidence': '0.0512'},
+                {'tile_code': '1F', 'confidence': '0.0100'},
+            ],
+        )
 
 
 class TestHandDetectionSerializer(TestCase):
@@ -91,6 +122,60 @@ class TestHandDetectionSerializer(TestCase):
 
         self.assertEqual(serializer.data['tiles'], [])
 
+    def test_packed_tiles_match_tile_rows(self):
+        detection = HandDetectionFactory(
+            hand__client=self.client_obj,
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+        DetectionTileFactory(detection=detection, tile_code='RD', x1=120)
+        DetectionTileFactory(
+            detection=detection,
+            tile_code='1B',
+            x1=10,
+            confidence=Decimal('0.5000'),
+            alternatives=pack_tile_alternatives(
+                [TileAlternative('7B', Decimal('0.2500'))],
+            ),
+        )
+        from_rows = HandDetectionSerializer(
+            instance=HandDetection.objects.get(id=detection.id),
+        ).data['tiles']
+
+        HandDetection.objects.filter(id=detection.id).update(
+            packed_tiles=pack_detection_tiles(
+                PackedDetectionTile(
+                    *values,
+                    alternatives=unpack_tile_alternatives(alternatives),
+                )
+                for *values, alternatives in DetectionTile.objects.filter(
+                    detection=detection,
+                ).values_list(
+                    'tile_code',
+                    'x1',
+                    'y1',
+                    'x2',
+                    'y2',
+                    'confidence',
+                    'alternatives',
+                )
+            ),
+        )
+        detection = HandDetection.objects.select_related('asset_ref').get(
+            id=detection.id,
+        )
+
+        with self.assertNumQueries(0):
+            from_packed = HandDetectionSerializer(instance=detection).data[
+                'tiles'
+            ]
+
+        self.assertEqual(from_packed, from_rows)
+        self.assertEqual(from_packed[0]['confidence'], '0.5000')
+        self.assertEqual(
+            from_packed[0]['alternatives'],
+            [{'tile_code': '7B', 'confidence': '0.2500'}],
+        )
+
     def test_error_fields_serialized(self):
         detection = HandDetectionFactory(
             hand__client=self.client_obj,
@@ -128,6 +213,46 @@ class TestHandDetectionSerializer(TestCase):
 
         self.assertIsNone(serializer.data['confidence_overall'])
 
+    def test_output_matches_model_serializer(self):
+        packed = HandDetectionFactory(
+            hand__client=self.client_obj,
+            status=DetectionStatus.SUCCEEDED.value,
+            confidence_overall=Decimal('0.8125'),
+            packed_tiles=pack_detection_tiles(
+                [PackedDetectionTile('RD', 1, 2, 3, 4, Decimal('0.7000'))],
+            ),
+        )
+        unpacked = HandDetectionFactory(
+            hand__client=self.client_obj,
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+        DetectionTileFactory(detection=unpacked, confidence=Decimal('0.9'))
+        failed = HandDetectionFactory(
+            hand__client=self.client_obj,
+            status=DetectionStatus.FAILED.value,
+            error_code='inference_error',
+            error_message='Model inference failed',
+        )
+        pending = HandDetectionFactory(
+            hand__client=self.client_obj,
+            confidence_overall=None,
+        )
+
+        renderer = JSONRenderer()
+        for detection in HandDetection.objects.filter(
+            id__in=[packed.id, unpacked.id, failed.id, pending.id],
+        ):
+            serializer = HandDetectionSerializer(instance=detection)
+            expected = serializers.ModelSerializer.to_representation(
+                serializer,
+                detection,
+            )
+
+            self.assertEqual(
+                renderer.render(serializer.data),
+                renderer.render(expected),
+            )
+
     def test_asset_id_required(self):
         data = {}
         serializer = HandDetectionSerializer(
@@ -0,0 +1,92 @@
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from django.conf import settings
+
+from hand.constants import TERMINAL_DETECTION_STATUSES
+from hand.models import HandDetection
+
+
+@dataclass(frozen=True)
+class DetectionResponseCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class DetectionResponseCache:
+    """
+    Per-process LRU of serialized terminal detections.
+
+    Entries are keyed by (id, updated_at): a detection no longer changes once
+    it succeeded or failed, and any save moves updated_at, so an entry never
+    needs invalidating. Pending and running detections are always serialized.
+    A `max_entries` of 0 disables the cache.
+
+    Cached representations are shared between requests and must not be
+    mutated.
+    """
+
+    def __init__(self, *, max_entries: int):
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[tuple[UUID, datetime], dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_serialize(
+        self,
+        detection: HandDetection,
+        serialize: Callable[[], dict],
+    ) -> dict:
+        """The cached representation of detection, or serialize() it."""
+        if (
+            self.max_entries <= 0
+            or detection.status not in TERMINAL_DETECTION_STATUSES
+        ):
+            return serialize()
+
+        key = (detection.id, detection.updated_at)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        self.misses += 1
+        data = serialize()
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> DetectionResponseCacheStats:
+        return DetectionResponseCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+        )
+
+
+@functools.cache
+def get_detection_response_cache() -> DetectionResponseCache:
+    """Process-wide cache configured from settings."""
+    return DetectionResponseCache(
+        max_entries=settings.DETECTION_RESPONSE_CACHE_MAX_ENTRIES,
+    )
@@ -0,0 +1,116 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Q
+
+from hand.constants import DetectionStatus
+from hand.models import DetectionTile, HandDetection
+from hand.packing import (
+    PackedDetectionTile,
+    pack_detection_tiles,
+    unpack_tile_alternatives,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKFILL_BATCH_SIZE = 500
+
+
+@dataclass
+class PackBackfillReport:
+    packed: int = 0
+    skipped: int = 0
+    rows_deleted: int = 0
+    batches: int = 0
+
+
+def _unpacked_detections(after: tuple | None):
+    queryset = HandDetection.objects.filter(
+        status=DetectionStatus.SUCCEEDED.value,
+        packed_tiles__isnull=True,
+    )
+    if after is not None:
+        created_at, detection_id = after
+        queryset = queryset.filter(
+            Q(created_at__gt=created_at)
+            | Q(created_at=created_at, id__gt=detection_id),
+        )
+    return queryset.order_by('created_at', 'id')
+
+
+def backfill_packed_tiles(
+    *,
+    batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE,
+    delete_rows: bool = False,
+) -> PackBackfillReport:
+    """
+    Pack the DetectionTile rows of succeeded detections into packed_tiles.
+
+    Detections are walked in (created_at, id) order in batches, so each
+    batch is one read of detections, one read of their tiles and one bulk
+    update. With delete_rows, the packed DetectionTile rows are deleted in
+    the same transaction.
+
+    Detections whose tiles cannot be packed (e.g. coordinates beyond u16)
+    are skipped and keep being served from their rows.
+    """
+    report = PackBackfillReport()
+    after = None
+
+    while True:
+        detections = list(
+            _unpacked_detections(after).only('id', 'created_at')[:batch_size],
+        )
+        if not detections:
+            break
+        after = (detections[-1].created_at, detections[-1].id)
+
+        tiles_by_detection = defaultdict(list)
+        for detection_id, *values in DetectionTile.objects.filter(
+            detection_id__in=[detection.id for detection in detections],
+        ).values_list(
+            'detection_id',
+            'tile_code',
+            'x1',
+            'y1',
+            'x2',
+            'y2',
+            'confidence',
+            'alternatives',
+        ):
+            *values, alternatives = values
+            tiles_by_detection[detection_id].append(
+                PackedDetectionTile(
+                    *values,
+                    alternatives=unpack_tile_alternatives(alternatives),
+                ),
+            )
+
+        packed = []
+        for detection in detections:
+            try:
+                detection.packed_tiles = pack_detection_tiles(
+                    tiles_by_detection[detection.id],
+                )
+            except ValueError as e:
+                logger.warning('Cannot pack detection %s: %s', detection.id, e)
+                report.skipped += 1
+                continue
+            packed.append(detection)
+
+        with transaction.atomic():
+            HandDetection.objects.bulk_update(packed, ['packed_tiles'])
+            if delete_rows and packed:
+                report.rows_deleted += DetectionTile.objects.filter(
+                    detection_id__in=[detection.id for detection in packed],
+                ).delete()[0]
+
+        report.packed += len(packed)
+        report.batches += 1
+
+        if len(detections) < batch_size:
+            break
+
+    return report
@@ -0,0 +1,199 @@
+import logging
+from typing import NamedTuple
+
+import numpy as np
+
+from hand.tiles import (
+    MAX_STANDARD_TILE_COUNT,
+    MAX_UNIQUE_TILE_COUNT,
+    TILE_CODE_TO_INDEX,
+    TILE_CODES,
+    UNIQUE_TILES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Copies of each tile in a set, by tile index
+TILE_CAPACITY = np.array(
+    [
+        MAX_UNIQUE_TILE_COUNT
+        if code in UNIQUE_TILES
+        else MAX_STANDARD_TILE_COUNT
+        for code in TILE_CODES
+    ],
+)
+
+
+class DetectedTile(NamedTuple):
+    tile_code: str
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    confidence: float
+    # The box's other candidates as (tile_code, score), best first
+    alternatives: tuple[tuple[str, float], ...] = ()
+
+
+def box_iou(boxes: np.ndarray) -> np.ndarray:
+    """Pairwise intersection over union of (n, 4) x1, y1, x2, y2 boxes."""
+    x1, y1, x2, y2 = boxes.T
+    areas = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+
+    width = np.clip(
+        np.minimum(x2[:, None], x2) - np.maximum(x1[:, None], x1),
+        0,
+        None,
+    )
+    height = np.clip(
+        np.minimum(y2[:, None], y2) - np.maximum(y1[:, None], y1),
+        0,
+        None,
+    )
+    intersection = width * height
+    union = areas[:, None] + areas - intersection
+    return np.divide(
+        intersection,
+        union,
+        out=np.zeros_like(intersection),
+        where=union > 0,
+    )
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float,
+) -> np.ndarray:
+    """
+    Indexes of the boxes kept by greedy NMS, highest score first.
+
+    Suppression ignores classes: two boxes over the same tile are duplicates
+    whatever they were classified as.
+    """
+    order = np.argsort(-scores, kind='stable')
+    overlaps = box_iou(boxes[order]) > iou_threshold
+    suppressed = np.zeros(len(order), dtype=bool)
+    kept = []
+    for rank in range(len(order)):
+        if suppressed[rank]:
+            continue
+        kept.append(rank)
+        suppressed |= overlaps[rank]
+    return order[kept]
+
+
+def assign_tile_codes(
+    scores: np.ndarray,
+    capacity: np.ndarray = TILE_CAPACITY,
+) -> np.ndarray:
+    """
+    Tile index assigned to each box of an (n, len(TILE_CODES)) score matrix,
+    or -1 for boxes that cannot be assigned.
+
+    (box, tile) pairs are taken in descending score order while the tile has
+    copies left, so a box only falls back to a lower-scored candidate once
+    more confident boxes used up every copy of its best one. Zero scores are
+    never assigned.
+    """
+    assigned = np.full(len(scores), -1)
+    remaining = capacity.copy()
+    flat_order = np.argsort(-scores, axis=None, kind='stable')
+    boxes, tiles = np.unravel_index(flat_order, scores.shape)
+    positive = scores[boxes, tiles] > 0
+
+    for box, tile in zip(boxes[positive], tiles[positive], strict=True):
+        if assigned[box] >= 0 or remaining[tile] == 0:
+            continue
+        assigned[box] = tile
+        remaining[tile] -= 1
+    return assigned
+
+
+def _candidates(detection: dict) -> list[tuple[str, float]]:
+    """The box's (tile_code, score) candidates, best first."""
+    candidates = detection.get('candidates')
+    if not candidates:
+        return [(detection['tile_code'], float(detection['confidence']))]
+    return [(tile_code, float(score)) for tile_code, score in candidates]
+
+
+def postprocess_detections(
+    detections: list[dict],
+    *,
+    confidence_threshold: float,
+    iou_threshold: float,
+) -> list[DetectedTile]:
+    """
+    Turn raw Modal detections into tiles a real set can contain.
+
+    Boxes below confidence_threshold are dropped, overlapping duplicates are
+    removed by NMS, and each remaining box is assigned a tile code so that
+    no tile appears more often than a set holds it. Boxes may list
+    second-best classes as `candidates`, [[tile_code, score], ...] best
+    first; only candidates scoring at least confidence_threshold are
+    assigned, so a box whose such candidates are all used up is dropped.
+    The candidates a box was not assigned, whatever their score, are kept
+    as its alternatives.
+    """
+    detections = [
+        detection
+        for detection in detections
+        if float(detection['confidence']) >= confidence_threshold
+    ]
+    if not detections:
+        return []
+
+    boxes = np.array(
+        [
+            [
+                detection['x1'],
+                detection['y1'],
+                detection['x2'],
+                detection['y2'],
+            ]
+            for detection in detections
+        ],
+        dtype=float,
+    )
+    scores = np.zeros((len(detections), len(TILE_CODES)))
+    for row, detection in enumerate(detections):
+        for tile_code, score in _candidates(detection):
+            index = TILE_CODE_TO_INDEX.get(tile_code)
+            if index is None:
+                logger.warning('Ignoring unknown tile code %r', tile_code)
+                continue
+            scores[row, index] = max(scores[row, index], score)
+
+    kept = non_max_suppression(boxes, scores.max(axis=1), iou_threshold)
+    kept_scores = scores[kept]
+    assigned = assign_tile_codes(
+        np.where(kept_scores >= confidence_threshold, kept_scores, 0),
+    )
+    if (assigned < 0).any():
+        logger.info(
+            'Dropped %d boxes exceeding tile counts',
+            (assigned < 0).sum(),
+        )
+
+    ranked = np.argsort(-kept_scores, axis=1, kind='stable')
+    tiles = []
+    for i, (row, tile) in enumerate(
+        zip(kept.tolist(), assigned.tolist(), strict=True),
+    ):
+        if tile < 0:
+            continue
+        alternatives = tuple(
+            (TILE_CODES[other], float(kept_scores[i, other]))
+            for other in ranked[i].tolist()
+            if other != tile and kept_scores[i, other] > 0
+        )
+        tiles.append(
+            DetectedTile(
+                TILE_CODES[tile],
+                *boxes[row].tolist(),
+                float(scores[row, tile]),
+                alternatives,
+            ),
+        )
+    return tiles
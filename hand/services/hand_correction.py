@@ -1,9 +1,11 @@
 from typing import TypedDict
 
+from django.conf import settings
 from django.db import transaction
 
 from hand.exceptions import DetectionHandMismatchError, InvalidTileDataError
 from hand.models import Hand, HandCorrection, HandDetection, HandTile
+from hand.packing import pack_tile_codes
 from hand.tiles import validate_tile_counts
 
 
@@ -24,7 +26,8 @@ def create_hand_correction(
     Business logic:
     - Validates detection belongs to hand (if provided)
     - Validates tile counts
-    - Creates correction and tiles atomically
+    - Creates the correction with its tiles packed in sort_order, plus
+      HandTile rows while HAND_CORRECTION_STORE_TILE_ROWS is on
     - Updates Hand.active_hand_correction
 
     Args:
@@ -46,6 +49,7 @@ def create_hand_correction(
         )
 
     # Validate tile counts
+    tiles = sorted(tiles, key=lambda t: t['sort_order'])
     tile_codes = [t['tile_code'] for t in tiles]
     validation_errors = validate_tile_counts(tile_codes)
     if validation_errors:
@@ -57,26 +61,17 @@ def create_hand_correction(
     with transaction.atomic():
         correction = HandCorrection.objects.create(
             hand=hand,
+            client_id=hand.client_id,
             detection=detection,
+            tile_indexes=pack_tile_codes(tile_codes),
         )
 
-        # Bulk create tiles
-        hand_tiles = [
-            HandTile(
-                hand_correction=correction,
-                tile_code=tile['tile_code'],
-                sort_order=tile['sort_order'],
-            )
-            for tile in tiles
-        ]
-        HandTile.objects.bulk_create(hand_tiles)
+        if settings.HAND_CORRECTION_STORE_TILE_ROWS:
+            HandTile.objects.bulk_create(correction.snapshot_tiles())
 
         # Update active correction on hand
         hand.active_hand_correction = correction
         hand.save(update_fields=['active_hand_correction', 'updated_at'])
 
-    # Reload with tiles for response
-    correction.refresh_from_db()
-    return HandCorrection.objects.prefetch_related('tiles').get(
-        id=correction.id,
-    )
+    # Tiles are read from tile_indexes, so no reload is needed
+    return correction
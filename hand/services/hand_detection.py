@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import transaction
+from django.db.models import prefetch_related_objects
 
 from asset.constants import AssetRole
 from asset.models import Asset, AssetRef
@@ -41,10 +42,8 @@ def find_existing_detection(asset: Asset) -> HandDetection | None:
         existing_detection
         and existing_detection.status != DetectionStatus.FAILED.value
     ):
-        return (
-            HandDetection.objects.select_related('asset_ref')
-            .prefetch_related('tiles')
-            .get(id=existing_detection.id)
+        return HandDetection.objects.select_related('asset_ref').get(
+            id=existing_detection.id,
         )
 
     return None
@@ -71,14 +70,26 @@ def create_detection(
 
         detection = HandDetection.objects.create(
             hand=hand,
+            client=client,
             asset_ref=asset_ref,
             status=DetectionStatus.PENDING.value,
             model_name='tile_detector',
             model_version=settings.MODEL_VERSION,
         )
 
-    return (
-        HandDetection.objects.select_related('asset_ref')
-        .prefetch_related('tiles')
-        .get(id=detection.id)
+    return HandDetection.objects.select_related('asset_ref').get(
+        id=detection.id,
     )
+
+
+def prefetch_unpacked_tiles(detections: list[HandDetection]) -> None:
+    """
+    Load the DetectionTile rows of detections without packed_tiles (stored
+    before packing, or not finished) with one query for all of them, so
+    serializing a page does not query once per detection.
+    """
+    unpacked = [
+        detection for detection in detections if detection.packed_tiles is None
+    ]
+    if unpacked:
+        prefetch_related_objects(unpacked, 'tiles')
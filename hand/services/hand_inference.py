@@ -3,9 +3,15 @@ from decimal import Decimal
 
 from django.conf import settings
 
-from asset.services.s3 import generate_presigned_get_url
+from asset.services.storage import get_storage_backend
 from hand.constants import DetectionStatus
 from hand.models import DetectionTile, HandDetection
+from hand.packing import (
+    PackedDetectionTile,
+    TileAlternative,
+    pack_detection_tiles,
+)
+from hand.services.detection_postprocessing import postprocess_detections
 from hand.services.modal_client import submit_detection
 
 logger = logging.getLogger(__name__)
@@ -15,14 +21,16 @@ def dispatch_detection(detection: HandDetection) -> None:
     """
     Dispatch a detection job to Modal.
 
-    Generates a presigned GET URL for the image, submits to Modal,
-    and updates the detection status to RUNNING with the call_id.
+    Gets a presigned GET URL for the image from the asset's storage backend
+    (cached for R2), submits to Modal, and updates the detection status to
+    RUNNING with the call_id.
     """
-    storage_key = detection.asset_ref.asset.storage_key
+    asset = detection.asset_ref.asset
+    storage = get_storage_backend(asset.storage_provider)
 
-    image_url = generate_presigned_get_url(
+    image_url = storage.generate_presigned_get_url(
         bucket_name=settings.STORAGE_BUCKET_IMAGES,
-        object_name=storage_key,
+        object_name=asset.storage_key,
     )
 
     call_id = submit_detection(image_url, detection.model_version)
@@ -32,6 +40,10 @@ def dispatch_detection(detection: HandDetection) -> None:
     detection.save(update_fields=['status', 'call_id', 'updated_at'])
 
 
+def _decimal_confidence(confidence: float) -> Decimal:
+    return Decimal(str(round(confidence, 4)))
+
+
 def process_detection_result(
     detection: HandDetection,
     result: dict,
@@ -39,35 +51,47 @@ def process_detection_result(
     """
     Process detection results from Modal.
 
-    Filters by confidence threshold, creates DetectionTile records,
-    computes overall confidence, and marks detection as SUCCEEDED.
+    Post-processes the boxes (confidence threshold, NMS, tile count
+    constraints), stores the tiles packed on the detection (plus
+    DetectionTile records while DETECTION_STORE_TILE_ROWS is on), computes
+    overall confidence, and marks detection as SUCCEEDED.
     """
-    threshold = settings.DETECTION_CONFIDENCE_THRESHOLD
-    detections = result.get('detections', [])
-
-    tiles_to_create = []
-    confidences = []
-
-    for det in detections:
-        conf = float(det['confidence'])
-        if conf < threshold:
-            continue
-
-        tiles_to_create.append(
-            DetectionTile(
-                detection=detection,
-                tile_code=det['tile_code'],
-                x1=int(det['x1']),
-                y1=int(det['y1']),
-                x2=int(det['x2']),
-                y2=int(det['y2']),
-                confidence=Decimal(str(round(conf, 4))),
+    detected = postprocess_detections(
+        result.get('detections', []),
+        confidence_threshold=settings.DETECTION_CONFIDENCE_THRESHOLD,
+        iou_threshold=settings.DETECTION_NMS_IOU_THRESHOLD,
+    )
+
+    tiles = [
+        PackedDetectionTile(
+            tile_code=tile.tile_code,
+            x1=int(tile.x1),
+            y1=int(tile.y1),
+            x2=int(tile.x2),
+            y2=int(tile.y2),
+            confidence=_decimal_confidence(tile.confidence),
+            alternatives=tuple(
+                TileAlternative(tile_code, _decimal_confidence(score))
+                for tile_code, score in tile.alternatives
             ),
         )
-        confidences.append(conf)
-
-    if tiles_to_create:
-        DetectionTile.objects.bulk_create(tiles_to_create)
+        for tile in detected
+    ]
+    confidences = [tile.confidence for tile in detected]
+
+    try:
+        detection.packed_tiles = pack_detection_tiles(tiles)
+    except ValueError as e:
+        # Served from DetectionTile rows instead, like unpacked detections
+        logger.warning('Cannot pack detection %s: %s', detection.id, e)
+        detection.packed_tiles = None
+
+    if tiles and (
+        settings.DETECTION_STORE_TILE_ROWS or detection.packed_tiles is None
+    ):
+        DetectionTile.objects.bulk_create(
+            [DetectionTile.from_packed(detection, tile) for tile in tiles],
+        )
 
     if confidences:
         avg_conf = sum(confidences) / len(confidences)
@@ -77,11 +101,15 @@ def process_detection_result(
 
     detection.status = DetectionStatus.SUCCEEDED.value
     detection.save(
-        update_fields=['status', 'confidence_overall', 'updated_at'],
+        update_fields=[
+            'status',
+            'confidence_overall',
+            'packed_tiles',
+            'updated_at',
+        ],
     )
 
-    return (
-        HandDetection.objects.select_related('asset_ref')
-        .prefetch_related('tiles')
-        .get(id=detection.id)
+    # Tiles are read from packed_tiles, so no prefetch is needed
+    return HandDetection.objects.select_related('asset_ref').get(
+        id=detection.id,
     )
@@ -1,8 +1,10 @@
 import logging
 
 import httpx
+import orjson
 from django.conf import settings
 
+from core.metrics import InstrumentedTransport
 from hand.exceptions import ModalServiceError
 
 logger = logging.getLogger(__name__)
@@ -13,24 +15,46 @@ def _get_client() -> httpx.Client:
         base_url=settings.MODAL_CV_ENDPOINT,
         headers={'Authorization': f'Bearer {settings.MODAL_AUTH_TOKEN}'},
         timeout=30.0,
+        transport=InstrumentedTransport('modal'),
     )
 
 
-def submit_detection(image_url: str, model_version: str) -> str:
+def detection_backend(model_version: str) -> str | None:
     """
-    Submit a detection job to Modal.
+    Backend configured for model_version (DETECTION_BACKENDS, else
+    DETECTION_BACKEND), or None for the version's default on Modal.
+    """
+    return settings.DETECTION_BACKENDS.get(
+        model_version,
+        settings.DETECTION_BACKEND,
+    )
+
+
+def submit_detection(
+    image_url: str,
+    model_version: str,
+    *,
+    backend: str | None = None,
+) -> str:
+    """
+    Submit a detection job to Modal, asking for DETECTION_TOP_K candidate
+    tiles per box, on `backend` ('gpu' or 'cpu'; default: the one
+    configured for model_version).
 
     Returns the call_id for polling results.
     """
+    payload = {
+        'image_url': image_url,
+        'version': model_version,
+        'top_k': settings.DETECTION_TOP_K,
+    }
+    backend = backend or detection_backend(model_version)
+    if backend:
+        payload['backend'] = backend
+
     with _get_client() as client:
         try:
-            response = client.post(
-                '/detect',
-                json={
-                    'image_url': image_url,
-                    'version': model_version,
-                },
-            )
+            response = client.post('/detect', json=payload)
             response.raise_for_status()
         except httpx.HTTPError as e:
             logger.error('Modal submit_detection failed: %s', e)
@@ -38,7 +62,7 @@ def submit_detection(image_url: str, model_version: str) -> str:
                 message=f'Failed to submit detection to Modal: {e}',
             ) from e
 
-    return response.json()['call_id']
+    return orjson.loads(response.content)['call_id']
 
 
 def poll_detection_result(call_id: str) -> dict | None:
@@ -69,4 +93,4 @@ def poll_detection_result(call_id: str) -> dict | None:
             message=f'Modal returned status {response.status_code}',
         )
 
-    return response.json()
+    return orjson.loads(response.content)
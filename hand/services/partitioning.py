@@ -0,0 +1,217 @@
+from dataclasses import dataclass, field
+
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.db import connection, models
+from psqlextra.partitioning import (
+    PostgresCurrentTimePartitioningStrategy,
+    PostgresModelPartitioningPlan,
+    PostgresPartitioningConfig,
+    PostgresPartitioningManager,
+    PostgresTimePartitionSize,
+)
+
+from hand.models import DetectionTile, HandDetection
+
+# Detaching takes an ACCESS EXCLUSIVE lock on the parent table; give up
+# rather than queue behind long-running queries and block new ones
+DETACH_LOCK_TIMEOUT = '5s'
+
+PARTITIONED_MODELS = [HandDetection, DetectionTile]
+
+
+@dataclass
+class PartitionMaintenanceReport:
+    created: list[str] = field(default_factory=list)
+    archived: list[str] = field(default_factory=list)
+    dry_run: bool = False
+
+
+def build_partitioning_manager() -> PostgresPartitioningManager:
+    """
+    Monthly partitioning for detection tables, configured from settings.
+
+    Partitions are created DETECTION_PARTITION_MONTHS_AHEAD months in
+    advance. With DETECTION_PARTITION_RETENTION_MONTHS set, partitions older
+    than that are planned for removal; maintain_partitions archives them
+    instead of dropping them.
+    """
+    retention = settings.DETECTION_PARTITION_RETENTION_MONTHS
+    max_age = relativedelta(months=retention) if retention else None
+
+    return PostgresPartitioningManager(
+        [
+            PostgresPartitioningConfig(
+                model=model,
+                strategy=PostgresCurrentTimePartitioningStrategy(
+                    size=PostgresTimePartitionSize(months=1),
+                    count=settings.DETECTION_PARTITION_MONTHS_AHEAD + 1,
+                    max_age=max_age,
+                ),
+            )
+            for model in PARTITIONED_MODELS
+        ],
+    )
+
+
+# Used by psqlextra's pgpartition command (PSQLEXTRA_PARTITIONING_MANAGER)
+partitioning_manager = build_partitioning_manager()
+
+
+def archive_partition(
+    model,
+    name: str,
+    *,
+    schema: str,
+    drop: bool = False,
+) -> None:
+    """
+    Detach a partition from its parent table and move it to `schema`.
+
+    Detaching is a metadata operation, so retention never rewrites or
+    vacuums the live table. The detached table loses its foreign keys, so
+    archived rows never block deletes of the hands they belonged to.
+    References to the partition's rows that have no database constraint
+    are set to NULL or deleted first, as deleting the rows would (see
+    _clear_references).
+
+    With drop=True the detached table is dropped instead.
+    """
+    with connection.schema_editor() as schema_editor:
+        quote_name = schema_editor.quote_name
+        table = schema_editor.create_partition_table_name(model, name)
+
+        schema_editor.execute(
+            f"SET LOCAL lock_timeout = '{DETACH_LOCK_TIMEOUT}'",
+        )
+        _clear_references(schema_editor, model, name, table)
+        schema_editor.execute(
+            f'ALTER TABLE {quote_name(model._meta.db_table)} '
+            f'DETACH PARTITION {quote_name(table)}',
+        )
+
+        if drop:
+            schema_editor.execute(f'DROP TABLE {quote_name(table)}')
+            return
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor,
+                table,
+            )
+        for constraint_name, constraint in constraints.items():
+            if constraint['foreign_key']:
+                schema_editor.execute(
+                    f'ALTER TABLE {quote_name(table)} '
+                    f'DROP CONSTRAINT {quote_name(constraint_name)}',
+                )
+
+        schema_editor.execute(
+            f'CREATE SCHEMA IF NOT EXISTS {quote_name(schema)}',
+        )
+        schema_editor.alter_table_schema(table, schema)
+
+
+def _clear_references(schema_editor, model, name: str, table: str) -> None:
+    """
+    Apply the on_delete of foreign keys to rows of a partition of model.
+
+    Partitioned tables cannot be the target of a foreign key on id alone,
+    so such keys have db_constraint=False and would otherwise keep pointing
+    at rows that left the table. SET_NULL keys (HandCorrection.detection)
+    are set to NULL. CASCADE rows (DetectionTile) are deleted, except those
+    in the referencing model's partition of the same name, which is
+    archived in the same run; rows created after the month boundary, e.g.
+    tiles of a detection that finished the next month, are not.
+    """
+    quote_name = schema_editor.quote_name
+    for relation in model._meta.related_objects:
+        field = relation.field
+        if field.db_constraint:
+            continue
+        related_table = quote_name(field.model._meta.db_table)
+        references = (
+            f'{quote_name(field.column)} IN '
+            f'(SELECT {quote_name(field.target_field.column)} '
+            f'FROM {quote_name(table)})'
+        )
+
+        if relation.on_delete is models.SET_NULL:
+            schema_editor.execute(
+                f'UPDATE {related_table} '
+                f'SET {quote_name(field.column)} = NULL '
+                f'WHERE {references}',
+            )
+        elif relation.on_delete is models.CASCADE:
+            # to_regclass is NULL when the model has no such partition
+            schema_editor.execute(
+                f'DELETE FROM {related_table} WHERE {references} '
+                f'AND tableoid IS DISTINCT FROM to_regclass(%s)',
+                [
+                    quote_name(
+                        schema_editor.create_partition_table_name(
+                            field.model,
+                            name,
+                        ),
+                    ),
+                ],
+            )
+
+
+def maintain_partitions(
+    *,
+    skip_create: bool = False,
+    skip_archive: bool = False,
+    dry_run: bool = False,
+    schema: str | None = None,
+    drop: bool = False,
+) -> PartitionMaintenanceReport:
+    """
+    Pre-create upcoming monthly partitions and archive expired ones for the
+    detection tables.
+
+    Args:
+        skip_create: Do not create partitions.
+        skip_archive: Do not archive partitions.
+        dry_run: Only report what would be done.
+        schema: Archive schema (defaults to DETECTION_ARCHIVE_SCHEMA).
+        drop: Drop expired partitions instead of archiving them.
+
+    Returns:
+        PartitionMaintenanceReport listing the affected partition tables.
+    """
+    schema = schema or settings.DETECTION_ARCHIVE_SCHEMA
+    report = PartitionMaintenanceReport(dry_run=dry_run)
+
+    plan = build_partitioning_manager().plan(
+        skip_create=skip_create,
+        skip_delete=skip_archive,
+    )
+
+    for model_plan in plan.model_plans:
+        model = model_plan.config.model
+        table = model._meta.db_table
+        report.created += [
+            f'{table}_{partition.name()}' for partition in model_plan.creations
+        ]
+        report.archived += [
+            f'{table}_{partition.name()}' for partition in model_plan.deletions
+        ]
+        if dry_run:
+            continue
+
+        if model_plan.creations:
+            PostgresModelPartitioningPlan(
+                config=model_plan.config,
+                creations=model_plan.creations,
+            ).apply(using=None)
+
+        for partition in model_plan.deletions:
+            archive_partition(
+                model,
+                partition.name(),
+                schema=schema,
+                drop=drop,
+            )
+
+    return report
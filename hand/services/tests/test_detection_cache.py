@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+
+from hand.constants import DetectionStatus
+from hand.factories import HandDetectionFactory
+from hand.services.detection_cache import DetectionResponseCache
+
+
+class TestDetectionResponseCache(TestCase):
+    def test_serializes_terminal_detection_once(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+        cache = DetectionResponseCache(max_entries=10)
+        serialize = MagicMock(return_value={'id': str(detection.id)})
+
+        first = cache.get_or_serialize(detection, serialize)
+        second = cache.get_or_serialize(detection, serialize)
+
+        self.assertIs(first, second)
+        serialize.assert_called_once()
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.stats().misses, 1)
+
+    def test_never_caches_pending_or_running(self):
+        cache = DetectionResponseCache(max_entries=10)
+        for status in [DetectionStatus.PENDING, DetectionStatus.RUNNING]:
+            detection = HandDetectionFactory(status=status.value)
+            serialize = MagicMock(return_value={})
+
+            cache.get_or_serialize(detection, serialize)
+            cache.get_or_serialize(detection, serialize)
+
+            self.assertEqual(serialize.call_count, 2)
+        self.assertEqual(cache.stats().size, 0)
+
+    def test_saved_detection_is_serialized_again(self):
+        detection = HandDetectionFactory(status=DetectionStatus.FAILED.value)
+        cache = DetectionResponseCache(max_entries=10)
+        cache.get_or_serialize(detection, lambda: {'error_code': ''})
+
+        detection.error_code = 'inference_error'
+        detection.save()
+        data = cache.get_or_serialize(
+            detection,
+            lambda: {'error_code': detection.error_code},
+        )
+
+        self.assertEqual(data, {'error_code': 'inference_error'})
+
+    def test_evicts_least_recently_used(self):
+        first, second, third = HandDetectionFactory.create_batch(
+            3,
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+        cache = DetectionResponseCache(max_entries=2)
+
+        cache.get_or_serialize(first, dict)
+        cache.get_or_serialize(second, dict)
+        cache.get_or_serialize(first, dict)
+        cache.get_or_serialize(third, dict)
+        serialize = MagicMock(return_value={})
+        cache.get_or_serialize(second, serialize)
+
+        serialize.assert_called_once()
+        self.assertEqual(cache.stats().size, 2)
+
+    def test_disabled_with_zero_entries(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+        cache = DetectionResponseCache(max_entries=0)
+        serialize = MagicMock(return_value={})
+
+        cache.get_or_serialize(detection, serialize)
+        cache.get_or_serialize(detection, serialize)
+
+        self.assertEqual(serialize.call_count, 2)
+        self.assertEqual(cache.stats().size, 0)
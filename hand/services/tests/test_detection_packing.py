@@ -0,0 +1,78 @@
+import io
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from hand.constants import DetectionStatus
+from hand.factories import DetectionTileFactory, HandDetectionFactory
+from hand.models import DetectionTile, HandDetection
+from hand.packing import unpack_detection_tiles
+from hand.services.detection_packing import backfill_packed_tiles
+
+
+class TestBackfillPackedTiles(TestCase):
+    def create_detection(self, tiles: int = 2) -> HandDetection:
+        detection = HandDetectionFactory(
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+        for i in range(tiles):
+            DetectionTileFactory(
+                detection=detection,
+                tile_code='5D',
+                x1=i * 100,
+                confidence=Decimal('0.8765'),
+            )
+        return detection
+
+    def test_packs_tile_rows_in_batches(self):
+        detections = [self.create_detection() for _ in range(3)]
+
+        report = backfill_packed_tiles(batch_size=2)
+
+        self.assertEqual(report.packed, 3)
+        self.assertEqual(report.batches, 2)
+        for detection in detections:
+            detection.refresh_from_db()
+            tiles = unpack_detection_tiles(detection.packed_tiles)
+            self.assertEqual([tile.x1 for tile in tiles], [0, 100])
+            self.assertEqual(tiles[0].confidence, Decimal('0.8765'))
+        self.assertEqual(DetectionTile.objects.count(), 6)
+
+    def test_skips_unfinished_and_packed_detections(self):
+        pending = HandDetectionFactory(status=DetectionStatus.PENDING.value)
+        self.create_detection()
+        backfill_packed_tiles()
+
+        report = backfill_packed_tiles()
+
+        self.assertEqual(report.packed, 0)
+        pending.refresh_from_db()
+        self.assertIsNone(pending.packed_tiles)
+
+    def test_delete_rows(self):
+        self.create_detection(tiles=3)
+
+        report = backfill_packed_tiles(delete_rows=True)
+
+        self.assertEqual(report.rows_deleted, 3)
+        self.assertFalse(DetectionTile.objects.exists())
+
+    def test_unpackable_detection_is_skipped(self):
+        detection = self.create_detection(tiles=0)
+        DetectionTileFactory(detection=detection, x2=70000)
+
+        report = backfill_packed_tiles(delete_rows=True)
+
+        self.assertEqual(report.skipped, 1)
+        self.assertEqual(DetectionTile.objects.count(), 1)
+        detection.refresh_from_db()
+        self.assertIsNone(detection.packed_tiles)
+
+    def test_command(self):
+        self.create_detection()
+        stdout = io.StringIO()
+
+        call_command('pack_detection_tiles', stdout=stdout)
+
+        self.assertIn('Packed 1 detections', stdout.getvalue())
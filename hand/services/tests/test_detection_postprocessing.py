@@ -0,0 +1,183 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from hand.services.detection_postprocessing import (
+    DetectedTile,
+    assign_tile_codes,
+    box_iou,
+    non_max_suppression,
+    postprocess_detections,
+)
+from hand.tiles import TILE_CODE_TO_INDEX, TILE_CODES
+
+
+def box(tile_code: str, x: float, confidence: float, **kwargs) -> dict:
+    return {
+        'tile_code': tile_code,
+        'x1': x,
+        'y1': 0.0,
+        'x2': x + 75.0,
+        'y2': 100.0,
+        'confidence': confidence,
+        **kwargs,
+    }
+
+
+def postprocess(detections: list[dict]) -> list[DetectedTile]:
+    return postprocess_detections(
+        detections,
+        confidence_threshold=0.5,
+        iou_threshold=0.5,
+    )
+
+
+class TestBoxIou(SimpleTestCase):
+    def test_pairwise_iou(self):
+        boxes = np.array(
+            [[0, 0, 10, 10], [5, 0, 15, 10], [20, 0, 30, 10], [0, 0, 0, 0]],
+            dtype=float,
+        )
+
+        iou = box_iou(boxes)
+
+        self.assertEqual(iou.shape, (4, 4))
+        self.assertAlmostEqual(iou[0, 0], 1.0)
+        self.assertAlmostEqual(iou[0, 1], 50 / 150)
+        self.assertEqual(iou[0, 2], 0.0)
+        # Degenerate boxes overlap nothing, not even themselves
+        self.assertEqual(iou[3, 3], 0.0)
+
+
+class TestNonMaxSuppression(SimpleTestCase):
+    def test_keeps_most_confident_of_overlapping_boxes(self):
+        boxes = np.array(
+            [[0, 0, 75, 100], [5, 0, 80, 100], [80, 0, 155, 100]],
+            dtype=float,
+        )
+        scores = np.array([0.7, 0.9, 0.8])
+
+        kept = non_max_suppression(boxes, scores, iou_threshold=0.5)
+
+        self.assertEqual(kept.tolist(), [1, 2])
+
+    def test_keeps_boxes_overlapping_below_threshold(self):
+        boxes = np.array([[0, 0, 75, 100], [60, 0, 135, 100]], dtype=float)
+        scores = np.array([0.9, 0.8])
+
+        kept = non_max_suppression(boxes, scores, iou_threshold=0.5)
+
+        self.assertEqual(sorted(kept.tolist()), [0, 1])
+
+
+class TestAssignTileCodes(SimpleTestCase):
+    def scores(self, rows: list[dict[str, float]]) -> np.ndarray:
+        scores = np.zeros((len(rows), len(TILE_CODES)))
+        for row, candidates in enumerate(rows):
+            for tile_code, score in candidates.items():
+                scores[row, TILE_CODE_TO_INDEX[tile_code]] = score
+        return scores
+
+    def assigned_codes(self, rows: list[dict[str, float]]) -> list:
+        return [
+            TILE_CODES[tile] if tile >= 0 else None
+            for tile in assign_tile_codes(self.scores(rows))
+        ]
+
+    def test_least_confident_box_falls_back_to_second_best(self):
+        rows = [{'1B': 0.9 - i * 0.01, '2B': 0.05} for i in range(4)]
+        rows.append({'1B': 0.7, '7B': 0.2})
+
+        self.assertEqual(
+            self.assigned_codes(rows),
+            ['1B', '1B', '1B', '1B', '7B'],
+        )
+
+    def test_unique_tiles_assigned_once(self):
+        rows = [{'1F': 0.9, '2F': 0.3}, {'1F': 0.8, '2F': 0.6}]
+
+        self.assertEqual(self.assigned_codes(rows), ['1F', '2F'])
+
+    def test_box_without_remaining_candidate_is_unassigned(self):
+        rows = [{'1S': 0.9}, {'1S': 0.8}]
+
+        self.assertEqual(self.assigned_codes(rows), ['1S', None])
+
+
+class TestPostprocessDetections(SimpleTestCase):
+    def test_drops_boxes_below_threshold(self):
+        tiles = postprocess([box('1B', 0, 0.9), box('2B', 80, 0.3)])
+
+        self.assertEqual([tile.tile_code for tile in tiles], ['1B'])
+
+    def test_removes_duplicates_across_classes(self):
+        tiles = postprocess(
+            [box('1B', 0, 0.7), box('7B', 4, 0.9), box('2B', 80, 0.8)],
+        )
+
+        self.assertEqual(
+            sorted(tile.tile_code for tile in tiles),
+            ['2B', '7B'],
+        )
+
+    def test_fifth_copy_uses_candidate(self):
+        detections = [
+            box(
+                '1B',
+                i * 80,
+                0.9 - i * 0.01,
+                candidates=[['1B', 0.9 - i * 0.01], ['7B', 0.6]],
+            )
+            for i in range(5)
+        ]
+
+        tiles = postprocess(detections)
+
+        self.assertEqual(
+            [tile.tile_code for tile in tiles],
+            ['1B', '1B', '1B', '1B', '7B'],
+        )
+        self.assertEqual(tiles[-1].x1, 320.0)
+        self.assertAlmostEqual(tiles[-1].confidence, 0.6)
+        self.assertEqual(tiles[0].alternatives, (('7B', 0.6),))
+        self.assertEqual(
+            [code for code, _ in tiles[-1].alternatives],
+            ['1B'],
+        )
+
+    def test_drops_fifth_copy_with_candidates_below_threshold(self):
+        detections = [
+            box(
+                '1B',
+                i * 80,
+                0.9 - i * 0.01,
+                candidates=[['1B', 0.9 - i * 0.01], ['7B', 0.05]],
+            )
+            for i in range(5)
+        ]
+
+        tiles = postprocess(detections)
+
+        self.assertEqual([tile.tile_code for tile in tiles], ['1B'] * 4)
+        self.assertEqual(tiles[-1].x1, 240.0)
+        # Low scores are not assigned, but still offered as alternatives
+        self.assertEqual(tiles[0].alternatives, (('7B', 0.05),))
+
+    def test_alternatives_exclude_unscored_tiles(self):
+        tiles = postprocess([box('1B', 0, 0.9)])
+
+        self.assertEqual(tiles[0].alternatives, ())
+
+    def test_drops_excess_copies_without_candidates(self):
+        tiles = postprocess([box('1F', 0, 0.9), box('1F', 80, 0.8)])
+
+        self.assertEqual(len(tiles), 1)
+        self.assertEqual(tiles[0].x1, 0.0)
+
+    def test_ignores_unknown_tile_codes(self):
+        with self.assertLogs('hand.services.detection_postprocessing'):
+            tiles = postprocess([box('ZZ', 0, 0.9), box('1B', 80, 0.9)])
+
+        self.assertEqual([tile.tile_code for tile in tiles], ['1B'])
+
+    def test_empty(self):
+        self.assertEqual(postprocess([]), [])
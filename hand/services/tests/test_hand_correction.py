@@ -1,9 +1,9 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from hand.constants import DetectionStatus
 from hand.exceptions import DetectionHandMismatchError, InvalidTileDataError
 from hand.factories import HandDetectionFactory
-from hand.models import HandTile
+from hand.models import HandCorrection, HandTile
 from hand.services.hand_correction import TileInput, create_hand_correction
 
 
@@ -30,6 +30,42 @@ class TestCreateHandCorrection(TestCase):
         self.assertEqual(correction.hand_id, self.hand.id)
         self.assertIsNone(correction.detection)
 
+        correction = HandCorrection.objects.get(id=correction.id)
+        self.assertEqual(correction.tile_codes, ['1B', '2B', '3B'])
+        self.assertFalse(
+            HandTile.objects.filter(hand_correction=correction).exists(),
+        )
+
+    def test_orders_tiles_by_sort_order(self):
+        tiles = [
+            TileInput(tile_code='3B', sort_order=7),
+            TileInput(tile_code='1B', sort_order=2),
+        ]
+
+        correction = create_hand_correction(
+            hand=self.hand,
+            tiles=tiles,
+        )
+
+        self.assertEqual(correction.tile_codes, ['1B', '3B'])
+        self.assertEqual(
+            [tile.sort_order for tile in correction.snapshot_tiles()],
+            [0, 1],
+        )
+
+    @override_settings(HAND_CORRECTION_STORE_TILE_ROWS=True)
+    def test_creates_hand_tile_rows_when_enabled(self):
+        tiles = [
+            TileInput(tile_code='1B', sort_order=0),
+            TileInput(tile_code='2B', sort_order=1),
+            TileInput(tile_code='3B', sort_order=2),
+        ]
+
+        correction = create_hand_correction(
+            hand=self.hand,
+            tiles=tiles,
+        )
+
         hand_tiles = HandTile.objects.filter(hand_correction=correction)
         self.assertEqual(hand_tiles.count(), 3)
 
@@ -135,7 +171,7 @@ class TestCreateHandCorrection(TestCase):
 
         self.assertIsNotNone(correction.id)
 
-    def test_returns_correction_with_prefetched_tiles(self):
+    def test_returns_correction_with_packed_tiles(self):
         tiles = [
             TileInput(tile_code='1B', sort_order=0),
             TileInput(tile_code='2B', sort_order=1),
@@ -146,4 +182,5 @@ class TestCreateHandCorrection(TestCase):
             tiles=tiles,
         )
 
-        self.assertEqual(correction.tiles.count(), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(correction.snapshot_tiles()), 2)
@@ -6,6 +6,11 @@ from django.test import TestCase, override_settings
 from hand.constants import DetectionStatus
 from hand.factories import HandDetectionFactory
 from hand.models import HandDetection
+from hand.packing import (
+    TileAlternative,
+    unpack_detection_tiles,
+    unpack_tile_alternatives,
+)
 from hand.services.hand_inference import (
     dispatch_detection,
     process_detection_result,
@@ -17,7 +22,9 @@ from hand.services.hand_inference import (
 )
 class TestDispatchDetection(TestCase):
     @patch('hand.services.hand_inference.submit_detection')
-    @patch('hand.services.hand_inference.generate_presigned_get_url')
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_get_url',
+    )
     def test_updates_status_and_call_id(
         self,
         mock_presign,
@@ -38,7 +45,9 @@ class TestDispatchDetection(TestCase):
         self.assertEqual(detection.call_id, 'fc-abc123')
 
     @patch('hand.services.hand_inference.submit_detection')
-    @patch('hand.services.hand_inference.generate_presigned_get_url')
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_get_url',
+    )
     def test_generates_presigned_url_with_storage_key(
         self,
         mock_presign,
@@ -60,7 +69,9 @@ class TestDispatchDetection(TestCase):
         )
 
     @patch('hand.services.hand_inference.submit_detection')
-    @patch('hand.services.hand_inference.generate_presigned_get_url')
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_get_url',
+    )
     def test_submits_with_model_version(
         self,
         mock_presign,
@@ -266,3 +277,147 @@ class TestProcessDetectionResult(TestCase):
         # Verify it's a fresh queryset result (not the same instance)
         self.assertIsInstance(updated, HandDetection)
         self.assertEqual(updated.id, detection.id)
+
+    def test_stores_packed_tiles(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.RUNNING.value,
+        )
+
+        result = {
+            'detections': [
+                {
+                    'tile_code': '2B',
+                    'x1': 120,
+                    'y1': 20,
+                    'x2': 220,
+                    'y2': 120,
+                    'confidence': 0.85,
+                },
+                {
+                    'tile_code': '1B',
+                    'x1': 10,
+                    'y1': 20,
+                    'x2': 110,
+                    'y2': 120,
+                    'confidence': 0.95,
+                },
+            ],
+        }
+
+        updated = process_detection_result(detection, result)
+
+        tiles = unpack_detection_tiles(updated.packed_tiles)
+        self.assertEqual([tile.tile_code for tile in tiles], ['1B', '2B'])
+        self.assertEqual(tiles[0].confidence, Decimal('0.9500'))
+
+    @override_settings(DETECTION_STORE_TILE_ROWS=False)
+    def test_skips_tile_rows_when_disabled(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.RUNNING.value,
+        )
+
+        result = {
+            'detections': [
+                {
+                    'tile_code': '1B',
+                    'x1': 10,
+                    'y1': 20,
+                    'x2': 110,
+                    'y2': 120,
+                    'confidence': 0.95,
+                },
+            ],
+        }
+
+        updated = process_detection_result(detection, result)
+
+        self.assertEqual(updated.tiles.count(), 0)
+        self.assertEqual(len(unpack_detection_tiles(updated.packed_tiles)), 1)
+
+    @override_settings(DETECTION_STORE_TILE_ROWS=False)
+    def test_keeps_tile_rows_when_packing_fails(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.RUNNING.value,
+        )
+
+        result = {
+            'detections': [
+                {
+                    'tile_code': '1B',
+                    'x1': 10,
+                    'y1': 20,
+                    'x2': 70000,  # Beyond the packed u16 range
+                    'y2': 120,
+                    'confidence': 0.95,
+                },
+            ],
+        }
+
+        updated = process_detection_result(detection, result)
+
+        self.assertIsNone(updated.packed_tiles)
+        self.assertEqual(updated.tiles.count(), 1)
+
+    def test_stores_overlapping_boxes_once(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.RUNNING.value,
+        )
+
+        result = {
+            'detections': [
+                {
+                    'tile_code': '1B',
+                    'x1': 10,
+                    'y1': 20,
+                    'x2': 110,
+                    'y2': 120,
+                    'confidence': 0.95,
+                },
+                {
+                    'tile_code': '7B',
+                    'x1': 14,
+                    'y1': 22,
+                    'x2': 112,
+                    'y2': 121,
+                    'confidence': 0.6,
+                },
+            ],
+        }
+
+        updated = process_detection_result(detection, result)
+
+        tiles = unpack_detection_tiles(updated.packed_tiles)
+        self.assertEqual([tile.tile_code for tile in tiles], ['1B'])
+        self.assertEqual(updated.confidence_overall, Decimal('0.95'))
+
+    def test_stores_candidates_as_alternatives(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.RUNNING.value,
+        )
+
+        result = {
+            'detections': [
+                {
+                    'tile_code': '1B',
+                    'x1': 10,
+                    'y1': 20,
+                    'x2': 110,
+                    'y2': 120,
+                    'confidence': 0.9,
+                    'candidates': [['1B', 0.9], ['7B', 0.06], ['1F', 0.01]],
+                },
+            ],
+        }
+
+        updated = process_detection_result(detection, result)
+
+        expected = (
+            TileAlternative('7B', Decimal('0.0600')),
+            TileAlternative('1F', Decimal('0.0100')),
+        )
+        (tile,) = unpack_detection_tiles(updated.packed_tiles)
+        self.assertEqual(tile.alternatives, expected)
+        self.assertEqual(
+            unpack_tile_alternatives(updated.tiles.get().alternatives),
+            expected,
+        )
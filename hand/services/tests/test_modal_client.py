@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import orjson
 from django.test import TestCase, override_settings
 
 from hand.exceptions import ModalServiceError
@@ -9,12 +10,15 @@ from hand.services.modal_client import poll_detection_result, submit_detection
 @override_settings(
     MODAL_CV_ENDPOINT='http://modal.test',
     MODAL_AUTH_TOKEN='test-token',
+    DETECTION_TOP_K=3,
+    DETECTION_BACKEND=None,
+    DETECTION_BACKENDS={},
 )
 class TestSubmitDetection(TestCase):
     @patch('hand.services.modal_client._get_client')
     def test_returns_call_id(self, mock_get_client):
         mock_response = MagicMock()
-        mock_response.json.return_value = {'call_id': 'fc-abc123'}
+        mock_response.content = orjson.dumps({'call_id': 'fc-abc123'})
         mock_response.raise_for_status.return_value = None
 
         mock_client = MagicMock()
@@ -34,9 +38,61 @@ class TestSubmitDetection(TestCase):
             json={
                 'image_url': 'https://r2.example.com/image.jpg',
                 'version': 'v0',
+                'top_k': 3,
             },
         )
 
+    @override_settings(DETECTION_BACKEND='cpu')
+    @patch('hand.services.modal_client._get_client')
+    def test_sends_backend_when_set(self, mock_get_client):
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({'call_id': 'fc-abc123'})
+
+        mock_client = MagicMock()
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client.post.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        submit_detection(
+            image_url='https://r2.example.com/image.jpg',
+            model_version='v0',
+        )
+
+        payload = mock_client.post.call_args.kwargs['json']
+        self.assertEqual(payload['backend'], 'cpu')
+
+    @override_settings(
+        DETECTION_BACKEND='gpu',
+        DETECTION_BACKENDS={'v2': 'cpu'},
+    )
+    @patch('hand.services.modal_client._get_client')
+    def test_sends_backend_of_model_version(self, mock_get_client):
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({'call_id': 'fc-abc123'})
+
+        mock_client = MagicMock()
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client.post.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        for model_version, backend in [('v2', 'cpu'), ('v1', 'gpu')]:
+            submit_detection(
+                image_url='https://r2.example.com/image.jpg',
+                model_version=model_version,
+            )
+            payload = mock_client.post.call_args.kwargs['json']
+            self.assertEqual(payload['backend'], backend)
+
+        submit_detection(
+            image_url='https://r2.example.com/image.jpg',
+            model_version='v2',
+            backend='gpu',
+        )
+        payload = mock_client.post.call_args.kwargs['json']
+        self.assertEqual(payload['backend'], 'gpu')
+
     @patch('hand.services.modal_client._get_client')
     def test_raises_modal_service_error_on_http_error(
         self,
@@ -78,7 +134,7 @@ class TestPollDetectionResult(TestCase):
         }
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = result_data
+        mock_response.content = orjson.dumps(result_data)
 
         mock_client = MagicMock()
         mock_client.__enter__ = MagicMock(return_value=mock_client)
@@ -0,0 +1,196 @@
+import io
+from datetime import datetime, timezone
+
+from dateutil.relativedelta import relativedelta
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from psqlextra.partitioning import (
+    PostgresTimePartition,
+    PostgresTimePartitionSize,
+)
+from psqlextra.partitioning.constants import AUTO_PARTITIONED_COMMENT
+
+from hand.factories import DetectionTileFactory, HandDetectionFactory
+from hand.models import DetectionTile, HandCorrection, HandDetection
+from hand.services.partitioning import maintain_partitions
+
+MONTH = PostgresTimePartitionSize(months=1)
+
+
+def month_partition(months_ago: int) -> PostgresTimePartition:
+    start = MONTH.start(datetime.now(timezone.utc)) - relativedelta(
+        months=months_ago,
+    )
+    return PostgresTimePartition(size=MONTH, start_datetime=start)
+
+
+def partition_names(model) -> set[str]:
+    with connection.cursor() as cursor:
+        table = connection.introspection.get_partitioned_table(
+            cursor,
+            model._meta.db_table,
+        )
+    return {partition.name for partition in table.partitions}
+
+
+def table_exists(qualified_name: str) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [qualified_name])
+        return cursor.fetchone()[0]
+
+
+def check_deferred_constraints() -> None:
+    """
+    Run the foreign key checks deferred by rows created in the test's
+    transaction; a table with pending trigger events cannot be detached.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+
+class TestDetectionPartitioning(TestCase):
+    def test_migration_creates_current_and_default_partitions(self):
+        current = month_partition(0).name()
+
+        for model in (HandDetection, DetectionTile):
+            names = partition_names(model)
+            self.assertIn('default', names)
+            self.assertIn(current, names)
+
+    def test_rows_are_routed_to_monthly_partition(self):
+        tile = DetectionTileFactory()
+        table = f'hand_detectiontile_{month_partition(0).name()}'
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT count(*) FROM {table} WHERE id = %s',
+                [tile.id],
+            )
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+    @override_settings(DETECTION_PARTITION_MONTHS_AHEAD=5)
+    def test_creates_future_partitions(self):
+        report = maintain_partitions(skip_archive=True)
+
+        expected = month_partition(-5).name()
+        self.assertIn(f'hand_handdetection_{expected}', report.created)
+        self.assertIn(expected, partition_names(HandDetection))
+        self.assertIn(expected, partition_names(DetectionTile))
+
+        second = maintain_partitions(skip_archive=True)
+        self.assertEqual(second.created, [])
+
+    def create_expired_partition(self) -> PostgresTimePartition:
+        partition = month_partition(12)
+        with connection.schema_editor() as schema_editor:
+            for model in (HandDetection, DetectionTile):
+                partition.create(
+                    model,
+                    schema_editor,
+                    comment=AUTO_PARTITIONED_COMMENT,
+                )
+        return partition
+
+    @override_settings(DETECTION_PARTITION_RETENTION_MONTHS=12)
+    def test_archives_expired_partitions(self):
+        partition = self.create_expired_partition()
+        created_at = partition.start_datetime.replace(
+            day=15,
+            tzinfo=timezone.utc,
+        )
+        old = HandDetectionFactory(created_at=created_at)
+        DetectionTileFactory(detection=old, created_at=created_at)
+        recent = HandDetectionFactory()
+        check_deferred_constraints()
+
+        report = maintain_partitions(skip_create=True, schema='archive_test')
+
+        name = partition.name()
+        self.assertEqual(
+            sorted(report.archived),
+            [f'hand_detectiontile_{name}', f'hand_handdetection_{name}'],
+        )
+        self.assertFalse(HandDetection.objects.filter(id=old.id).exists())
+        self.assertFalse(DetectionTile.objects.filter(detection=old).exists())
+        self.assertTrue(HandDetection.objects.filter(id=recent.id).exists())
+        self.assertTrue(
+            table_exists(f'archive_test.hand_handdetection_{name}'),
+        )
+        self.assertTrue(
+            table_exists(f'archive_test.hand_detectiontile_{name}'),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT count(*) FROM archive_test.hand_detectiontile_{name}',
+            )
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+        # Archived rows must not block deleting the hand they belonged to
+        old.hand.delete()
+
+    @override_settings(DETECTION_PARTITION_RETENTION_MONTHS=12)
+    def test_archiving_clears_corrections_of_archived_detections(self):
+        partition = self.create_expired_partition()
+        old = HandDetectionFactory(
+            created_at=partition.start_datetime.replace(
+                day=15,
+                tzinfo=timezone.utc,
+            ),
+        )
+        recent = HandDetectionFactory()
+        old_correction, recent_correction = (
+            HandCorrection.objects.create(
+                hand=detection.hand,
+                detection=detection,
+                tile_indexes=[0, 1],
+            )
+            for detection in (old, recent)
+        )
+        check_deferred_constraints()
+
+        maintain_partitions(skip_create=True, drop=True)
+
+        old_correction.refresh_from_db()
+        recent_correction.refresh_from_db()
+        self.assertIsNone(old_correction.detection_id)
+        self.assertEqual(recent_correction.detection_id, recent.id)
+
+    @override_settings(DETECTION_PARTITION_RETENTION_MONTHS=12)
+    def test_archiving_deletes_later_tiles_of_archived_detections(self):
+        partition = self.create_expired_partition()
+        old = HandDetectionFactory(
+            created_at=partition.start_datetime.replace(
+                day=15,
+                tzinfo=timezone.utc,
+            ),
+        )
+        # Stored after the month boundary, in a partition that stays live
+        later_tile = DetectionTileFactory(
+            detection=old,
+            created_at=partition.end_datetime + relativedelta(hours=1),
+        )
+        recent_tile = DetectionTileFactory()
+        check_deferred_constraints()
+
+        maintain_partitions(skip_create=True, schema='archive_test')
+
+        self.assertFalse(
+            DetectionTile.objects.filter(id=later_tile.id).exists()
+        )
+        self.assertTrue(
+            DetectionTile.objects.filter(id=recent_tile.id).exists()
+        )
+
+    @override_settings(DETECTION_PARTITION_MONTHS_AHEAD=5)
+    def test_command_dry_run_changes_nothing(self):
+        stdout = io.StringIO()
+
+        call_command('partition_detections', '--dry-run', stdout=stdout)
+
+        expected = month_partition(-5).name()
+        self.assertIn(
+            f'Would create hand_handdetection_{expected}',
+            stdout.getvalue(),
+        )
+        self.assertNotIn(expected, partition_names(HandDetection))
@@ -0,0 +1,179 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from hand.packing import (
+    DETECTION_TILE_RECORD,
+    PACKED_TILES_VERSION,
+    PACKED_TILES_WITH_ALTERNATIVES_VERSION,
+    PackedDetectionTile,
+    TileAlternative,
+    confidence_to_fixed,
+    pack_detection_tiles,
+    pack_tile_alternatives,
+    pack_tile_codes,
+    unpack_detection_tiles,
+    unpack_tile_alternatives,
+    unpack_tile_codes,
+)
+
+
+def make_tile(**kwargs) -> PackedDetectionTile:
+    defaults = {
+        'tile_code': '1B',
+        'x1': 10,
+        'y1': 20,
+        'x2': 110,
+        'y2': 120,
+        'confidence': Decimal('0.9500'),
+    }
+    return PackedDetectionTile(**{**defaults, **kwargs})
+
+
+class TestPackDetectionTiles(TestCase):
+    def test_round_trip(self):
+        tiles = [
+            make_tile(),
+            make_tile(tile_code='RD', x1=120, x2=200, confidence=Decimal('1')),
+            make_tile(
+                tile_code='4S',
+                x1=210,
+                x2=65535,
+                confidence=Decimal('0'),
+            ),
+        ]
+
+        unpacked = unpack_detection_tiles(pack_detection_tiles(tiles))
+
+        self.assertEqual(unpacked, tiles)
+
+    def test_record_size(self):
+        data = pack_detection_tiles([make_tile(), make_tile(x1=200)])
+
+        self.assertEqual(len(data), 1 + 2 * DETECTION_TILE_RECORD.size)
+        self.assertEqual(DETECTION_TILE_RECORD.size, 11)
+
+    def test_confidence_keeps_four_decimal_places(self):
+        data = pack_detection_tiles([make_tile(confidence=0.12345678)])
+
+        (tile,) = unpack_detection_tiles(data)
+        self.assertEqual(tile.confidence, Decimal('0.1235'))
+        self.assertEqual(str(tile.confidence), '0.1235')
+
+    def test_tiles_are_sorted_by_x1(self):
+        tiles = [make_tile(tile_code='2B', x1=300), make_tile(x1=5)]
+
+        unpacked = unpack_detection_tiles(pack_detection_tiles(tiles))
+
+        self.assertEqual([t.tile_code for t in unpacked], ['1B', '2B'])
+
+    def test_empty(self):
+        self.assertEqual(unpack_detection_tiles(pack_detection_tiles([])), [])
+
+    def test_accepts_memoryview(self):
+        data = pack_detection_tiles([make_tile()])
+
+        self.assertEqual(
+            unpack_detection_tiles(memoryview(data)),
+            [make_tile()],
+        )
+
+    def test_out_of_range_values_raise(self):
+        for tile in (
+            make_tile(tile_code='XX'),
+            make_tile(x2=65536),
+            make_tile(y1=-1),
+            make_tile(confidence=Decimal('1.5')),
+        ):
+            with self.assertRaises(ValueError):
+                pack_detection_tiles([tile])
+
+    def test_round_trip_with_alternatives(self):
+        tiles = [
+            make_tile(
+                alternatives=(
+                    TileAlternative('7B', Decimal('0.0300')),
+                    TileAlternative('1F', Decimal('0.0100')),
+                ),
+            ),
+            make_tile(tile_code='RD', x1=120),
+        ]
+
+        data = pack_detection_tiles(tiles)
+
+        self.assertEqual(data[0], PACKED_TILES_WITH_ALTERNATIVES_VERSION)
+        self.assertEqual(unpack_detection_tiles(data), tiles)
+
+    def test_without_alternatives_keeps_v1_layout(self):
+        data = pack_detection_tiles([make_tile()])
+
+        self.assertEqual(data[0], PACKED_TILES_VERSION)
+        self.assertEqual(len(data), 1 + DETECTION_TILE_RECORD.size)
+
+    def test_confidence_to_fixed(self):
+        self.assertEqual(confidence_to_fixed(Decimal('0.9500')), 9500)
+        self.assertEqual(confidence_to_fixed(0.5), 5000)
+
+
+class TestUnpackDetectionTiles(TestCase):
+    def test_unknown_version_raises(self):
+        data = pack_detection_tiles([make_tile()])
+
+        with self.assertRaises(ValueError):
+            unpack_detection_tiles(b'\xff' + data[1:])
+
+    def test_empty_data_raises(self):
+        with self.assertRaises(ValueError):
+            unpack_detection_tiles(b'')
+
+    def test_truncated_data_raises(self):
+        data = pack_detection_tiles([make_tile()])
+
+        with self.assertRaises(ValueError):
+            unpack_detection_tiles(data[:-1])
+
+    def test_truncated_alternatives_raise(self):
+        data = pack_detection_tiles(
+            [
+                make_tile(
+                    alternatives=(TileAlternative('7B', Decimal('0.1')),),
+                ),
+            ],
+        )
+
+        with self.assertRaises(ValueError):
+            unpack_detection_tiles(data[:-1])
+
+
+class TestPackTileAlternatives(TestCase):
+    def test_round_trip(self):
+        alternatives = (
+            TileAlternative('7B', Decimal('0.0300')),
+            TileAlternative('RD', Decimal('0.0012')),
+        )
+
+        self.assertEqual(
+            unpack_tile_alternatives(pack_tile_alternatives(alternatives)),
+            alternatives,
+        )
+
+    def test_none_is_empty(self):
+        self.assertEqual(pack_tile_alternatives(()), b'')
+        self.assertEqual(unpack_tile_alternatives(None), ())
+
+
+class TestPackTileCodes(TestCase):
+    def test_round_trip_keeps_order(self):
+        tile_codes = ['RD', '1B', '1B', '4S']
+
+        unpacked = unpack_tile_codes(pack_tile_codes(tile_codes))
+
+        self.assertEqual(unpacked, tile_codes)
+
+    def test_invalid_code_raises(self):
+        with self.assertRaises(ValueError):
+            pack_tile_codes(['1B', 'XX'])
+
+    def test_invalid_index_raises(self):
+        with self.assertRaises(ValueError):
+            unpack_tile_codes([255])
@@ -1,9 +1,12 @@
 from django.test import TestCase
 
 from hand.tiles import (
+    TILE_CODES,
     TileCode,
     is_valid_tile_code,
     label_to_tile,
+    tile_code_at,
+    tile_index,
     validate_tile_counts,
 )
 
@@ -128,6 +131,24 @@ class TestIsValidTileCode(TestCase):
             )
 
 
+class TestTileIndex(TestCase):
+    def test_every_code_round_trips(self):
+        for code in TileCode:
+            self.assertEqual(tile_code_at(tile_index(code.value)), code.value)
+
+    def test_indexes_fit_in_a_byte(self):
+        self.assertLessEqual(len(TILE_CODES), 256)
+
+    def test_invalid_code_raises(self):
+        with self.assertRaises(ValueError):
+            tile_index('XX')
+
+    def test_invalid_index_raises(self):
+        for index in (-1, len(TILE_CODES)):
+            with self.assertRaises(ValueError):
+                tile_code_at(index)
+
+
 class TestValidateTileCounts(TestCase):
     def test_empty_list_passes(self):
         errors = validate_tile_counts([])
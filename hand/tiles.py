@@ -78,6 +78,17 @@ class TileCode(Enum):
         return [(tile.value, tile.name) for tile in cls]
 
 
+# Stable ordering of tile codes for compact storage: a tile's index is its
+# position here. Only ever append, never reorder, or stored data changes meaning.
+TILE_CODES: tuple[str, ...] = tuple(tile.value for tile in TileCode)
+
+TILE_CODE_TO_INDEX: dict[str, int] = {
+    code: index for index, code in enumerate(TILE_CODES)
+}
+
+VALID_TILE_CODES: frozenset[str] = frozenset(TILE_CODES)
+
+
 class TileSetCode(Enum):
     BAMBOO = 'bamboo'
     CHARACTER = 'character'
@@ -189,7 +200,32 @@ def is_valid_tile_code(code: str) -> bool:
     Returns:
         True if the code is a valid TileCode value, False otherwise.
     """
-    return code in {t.value for t in TileCode}
+    return code in VALID_TILE_CODES
+
+
+def tile_index(code: str) -> int:
+    """
+    Get the compact storage index of a tile code.
+
+    Raises:
+        ValueError: If the code is not a valid TileCode value.
+    """
+    try:
+        return TILE_CODE_TO_INDEX[code]
+    except KeyError:
+        raise ValueError(f'Invalid tile code: {code}') from None
+
+
+def tile_code_at(index: int) -> str:
+    """
+    Get the tile code stored at a compact storage index.
+
+    Raises:
+        ValueError: If the index is out of range.
+    """
+    if not 0 <= index < len(TILE_CODES):
+        raise ValueError(f'Invalid tile index: {index}')
+    return TILE_CODES[index]
 
 
 def validate_tile_counts(tile_codes: list[str]) -> list[str]:
@@ -1,6 +1,8 @@
 from rest_framework import mixins, status, viewsets
 from rest_framework.response import Response
 
+from core.conditional import CacheValidators, weak_etag
+from core.pagination import CreatedAtCursorPagination
 from user.views import get_install_id
 from hand.filters import HandCorrectionFilter
 from hand.models import HandCorrection
@@ -9,6 +11,27 @@ from hand.serializers.hand_correction_serializer import (
 )
 
 
+def correction_cache_validators(
+    correction: HandCorrection,
+) -> CacheValidators:
+    """
+    Validators of a correction's representation.
+
+    The tile snapshot never changes, but is_active does when another
+    correction of the hand becomes active. Clients therefore revalidate
+    before every reuse. That can happen within the same second, which
+    Last-Modified cannot tell apart, so only an ETag is sent.
+    """
+    is_active = correction.hand.active_hand_correction_id == correction.id
+    return CacheValidators(
+        etag=weak_etag(
+            correction.id,
+            correction.updated_at.isoformat(),
+            is_active,
+        ),
+    )
+
+
 class HandCorrectionViewSet(
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
@@ -20,33 +43,45 @@ class HandCorrectionViewSet(
 
     Endpoints:
         POST /hand/correction/
-        GET /hand/correction/
+        GET /hand/correction/  (cursor paginated, newest first)
         GET /hand/correction/{id}/
+
+    Retrieve answers conditional GETs (If-None-Match) with 304.
     """
 
     serializer_class = HandCorrectionSerializer
     filterset_class = HandCorrectionFilter
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
-        """Filter corrections by client ownership."""
+        """
+        Filter corrections by client ownership.
+
+        Tiles are read from the packed tile_indexes, so no prefetch is needed.
+        """
         install_id = get_install_id(self.request)
-        queryset = (
-            HandCorrection.objects.filter(hand__client__install_id=install_id)
+        return (
+            HandCorrection.objects.filter(client_id=install_id)
             .select_related('hand', 'detection')
             .order_by('-created_at')
         )
 
-        # Prefetch tiles for retrieve action
-        if self.action == 'retrieve':
-            queryset = queryset.prefetch_related('tiles')
-
-        return queryset
-
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context['install_id'] = get_install_id(self.request)
         return context
 
+    def retrieve(self, request, *args, **kwargs):
+        correction = self.get_object()
+
+        validators = correction_cache_validators(correction)
+        response = validators.not_modified(request)
+        if response is not None:
+            return response
+
+        serializer = self.get_serializer(correction)
+        return validators.apply(Response(serializer.data))
+
     def create(self, request, *args, **kwargs):
         """Create a new correction for a hand."""
         serializer = self.get_serializer(data=request.data)
@@ -4,15 +4,23 @@ from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from user.views import get_install_id
-from user.models import Client
+from core.conditional import CacheValidators, weak_etag
+from core.pagination import CreatedAtCursorPagination
+from user.views import get_install_id, get_request_client
 from asset.models import Asset
-from hand.constants import DetectionStatus, HandSource
+from hand.constants import (
+    TERMINAL_DETECTION_MAX_AGE,
+    TERMINAL_DETECTION_STATUSES,
+    HandSource,
+)
+from hand.filters import HandDetectionFilter
 from hand.models import HandDetection
 from hand.serializers.hand_detection_serializer import HandDetectionSerializer
+from hand.services.detection_cache import get_detection_response_cache
 from hand.services.hand_detection import (
     find_existing_detection,
     create_detection,
+    prefetch_unpacked_tiles,
 )
 from hand.services.hand_inference import (
     dispatch_detection,
@@ -23,7 +31,27 @@ from hand.services.modal_client import poll_detection_result
 logger = logging.getLogger(__name__)
 
 
+def detection_cache_validators(detection: HandDetection) -> CacheValidators:
+    """
+    Validators of a detection's representation, derived from updated_at.
+
+    Terminal detections never change, so clients may reuse them for
+    TERMINAL_DETECTION_MAX_AGE. Pending and running detections move on
+    within the same second, which Last-Modified cannot tell apart, so they
+    only carry an ETag.
+    """
+    etag = weak_etag(detection.id, detection.updated_at.isoformat())
+    if detection.status not in TERMINAL_DETECTION_STATUSES:
+        return CacheValidators(etag=etag)
+    return CacheValidators(
+        etag=etag,
+        last_modified=detection.updated_at,
+        max_age=TERMINAL_DETECTION_MAX_AGE,
+    )
+
+
 class HandDetectionViewSet(
+    mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     viewsets.GenericViewSet,
 ):
@@ -32,20 +60,37 @@ class HandDetectionViewSet(
 
     Endpoints:
         POST /hand/detection/
+        GET /hand/detection/  (cursor paginated, newest first)
         GET /hand/detection/{id}/
         GET /hand/detection/{id}/poll/
+
+    Retrieve and poll answer conditional GETs (If-None-Match,
+    If-Modified-Since) with 304, and serve succeeded and failed detections
+    from the detection response cache.
     """
 
     serializer_class = HandDetectionSerializer
+    filterset_class = HandDetectionFilter
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
-        """Filter detections by client ownership."""
+        """
+        Filter detections by client ownership.
+
+        Tiles are decoded from packed_tiles by the serializer; DetectionTile
+        rows of detections stored before packing existed are prefetched per
+        page (see paginate_queryset).
+        """
         install_id = get_install_id(self.request)
-        return (
-            HandDetection.objects.filter(hand__client__install_id=install_id)
-            .select_related('hand', 'asset_ref')
-            .prefetch_related('tiles')
-        )
+        return HandDetection.objects.filter(
+            client_id=install_id,
+        ).select_related('hand', 'asset_ref')
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None:
+            prefetch_unpacked_tiles(page)
+        return page
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -54,8 +99,6 @@ class HandDetectionViewSet(
 
     def create(self, request, *args, **kwargs):
         """Trigger detection on an uploaded asset."""
-        install_id = get_install_id(request)
-
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -70,7 +113,7 @@ class HandDetectionViewSet(
         created = False
 
         if not detection:
-            client = Client.objects.get(install_id=install_id)
+            client = get_request_client(request)
             detection = create_detection(asset, client, source)
             dispatch_detection(detection)
             created = True
@@ -84,22 +127,31 @@ class HandDetectionViewSet(
             status=response_status,
         )
 
+    def retrieve(self, request, *args, **kwargs):
+        return self.detection_response(self.get_object())
+
     @action(detail=True, methods=['get'])
     def poll(self, request, pk=None):
         """Poll Modal for detection results."""
         detection = self.get_object()
 
-        if detection.status in (
-            DetectionStatus.SUCCEEDED.value,
-            DetectionStatus.FAILED.value,
-        ):
-            serializer = self.get_serializer(detection)
-            return Response(serializer.data)
+        if detection.status not in TERMINAL_DETECTION_STATUSES:
+            result = poll_detection_result(detection.call_id)
+            if result:
+                detection = process_detection_result(detection, result)
 
-        result = poll_detection_result(detection.call_id)
+        return self.detection_response(detection)
 
-        if result:
-            detection = process_detection_result(detection, result)
+    def detection_response(self, detection: HandDetection):
+        """The detection, or 304 if the client's copy is current."""
+        validators = detection_cache_validators(detection)
+        response = validators.not_modified(self.request)
+        if response is not None:
+            return response
 
-        serializer = self.get_serializer(detection)
-        return Response(serializer.data)
+        # A plain dict, so cached entries do not keep their serializer alive
+        data = get_detection_response_cache().get_or_serialize(
+            detection,
+            lambda: dict(self.get_serializer(detection).data),
+        )
+        return validators.apply(Response(data))
@@ -1,5 +1,7 @@
 import uuid
 
+from django.utils import timezone
+from django.utils.http import http_date
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -224,9 +226,9 @@ class TestHandCorrectionViewSetList(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(
-            response.data[0]['id'],
+            response.data['results'][0]['id'],
             str(correction.id),
         )
 
@@ -255,9 +257,9 @@ class TestHandCorrectionViewSetList(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(
-            response.data[0]['id'],
+            response.data['results'][0]['id'],
             str(correction1.id),
         )
 
@@ -273,7 +275,7 @@ class TestHandCorrectionViewSetList(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
 
     def test_only_returns_own_corrections(self):
         correction = HandCorrection.objects.create(hand=self.hand)
@@ -291,7 +293,46 @@ class TestHandCorrectionViewSetList(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_cursor_pagination_walks_all_pages(self):
+        # Shared created_at, so pages are split on the id tie-breaker
+        created_at = timezone.now()
+        corrections = [
+            HandCorrection.objects.create(
+                hand=self.hand,
+                created_at=created_at,
+            )
+            for _ in range(3)
+        ]
+        newest = HandCorrection.objects.create(hand=self.hand)
+
+        ids = []
+        url = '/hand/correction/?page_size=2'
+        while url:
+            response = self.client.get(
+                url,
+                HTTP_X_INSTALL_ID=self.client_obj.install_id,
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            ids += [row['id'] for row in response.data['results']]
+            url = response.data['next']
+
+        expected = [newest] + sorted(
+            corrections,
+            key=lambda correction: correction.id,
+            reverse=True,
+        )
+        self.assertEqual(ids, [str(correction.id) for correction in expected])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            '/hand/correction/?cursor=not-a-cursor',
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
 class TestHandCorrectionViewSetRetrieve(APITestCase):
@@ -348,3 +389,70 @@ class TestHandCorrectionViewSetRetrieve(APITestCase):
         response = self.client.get(f'/hand/correction/{self.correction.id}/')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_not_modified_while_unchanged(self):
+        url = f'/hand/correction/{self.correction.id}/'
+        response = self.client.get(
+            url,
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+        )
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        self.assertIn('X-Install-Id', response['Vary'])
+
+        response = self.client.get(
+            url,
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_modified_when_active_correction_changes(self):
+        url = f'/hand/correction/{self.correction.id}/'
+        self.hand.active_hand_correction = self.correction
+        self.hand.save()
+        etag = self.client.get(
+            url,
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+        )['ETag']
+
+        self.hand.active_hand_correction = HandCorrection.objects.create(
+            hand=self.hand,
+        )
+        self.hand.save()
+        response = self.client.get(
+            url,
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['is_active'])
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_modified_since_within_the_same_second(self):
+        url = f'/hand/correction/{self.correction.id}/'
+        self.hand.active_hand_correction = self.correction
+        self.hand.save()
+        response = self.client.get(
+            url,
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+        )
+        self.assertNotIn('Last-Modified', response)
+
+        self.hand.active_hand_correction = HandCorrection.objects.create(
+            hand=self.hand,
+        )
+        self.hand.save()
+        # A date validator could not tell this change from the first GET
+        response = self.client.get(
+            url,
+            HTTP_X_INSTALL_ID=self.client_obj.install_id,
+            HTTP_IF_MODIFIED_SINCE=http_date(
+                self.hand.updated_at.timestamp(),
+            ),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['is_active'])
@@ -7,7 +7,7 @@ from rest_framework.test import APITestCase
 
 from asset.constants import UploadStatus
 from asset.factories import AssetFactory, UploadSessionFactory
-from hand.constants import DetectionStatus
+from hand.constants import TERMINAL_DETECTION_MAX_AGE, DetectionStatus
 from hand.factories import HandDetectionFactory
 from hand.models import HandDetection
 from user.factories import ClientFactory
@@ -59,6 +59,59 @@ class TestDetectionViewSetRetrieve(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+class TestDetectionViewSetList(APITestCase):
+    def test_lists_own_detections_newest_first(self):
+        older = HandDetectionFactory()
+        client_obj = older.hand.client
+        newer = HandDetectionFactory(hand__client=client_obj)
+        HandDetectionFactory()
+
+        response = self.client.get(
+            '/hand/detection/',
+            HTTP_X_INSTALL_ID=client_obj.install_id,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row['id'] for row in response.data['results']],
+            [str(newer.id), str(older.id)],
+        )
+        self.assertIsNone(response.data['next'])
+
+    def test_paginates(self):
+        first = HandDetectionFactory()
+        client_obj = first.hand.client
+        second = HandDetectionFactory(hand=first.hand)
+
+        response = self.client.get(
+            '/hand/detection/?page_size=1',
+            HTTP_X_INSTALL_ID=client_obj.install_id,
+        )
+        self.assertEqual(response.data['results'][0]['id'], str(second.id))
+
+        response = self.client.get(
+            response.data['next'],
+            HTTP_X_INSTALL_ID=client_obj.install_id,
+        )
+        self.assertEqual(response.data['results'][0]['id'], str(first.id))
+        self.assertIsNone(response.data['next'])
+
+    def test_filter_by_hand_id(self):
+        detection = HandDetectionFactory()
+        client_obj = detection.hand.client
+        HandDetectionFactory(hand__client=client_obj)
+
+        response = self.client.get(
+            f'/hand/detection/?hand_id={detection.hand_id}',
+            HTTP_X_INSTALL_ID=client_obj.install_id,
+        )
+
+        self.assertEqual(
+            [row['id'] for row in response.data['results']],
+            [str(detection.id)],
+        )
+
+
 class TestDetectionViewSetCreate(APITestCase):
     @patch('hand.views.hand_detection_view.dispatch_detection')
     def test_create_dispatches_detection(self, mock_dispatch):
@@ -225,3 +278,99 @@ class TestDetectionViewSetPoll(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         mock_poll.assert_not_called()
+
+
+class TestDetectionViewSetConditionalGet(APITestCase):
+    def get(self, url: str, client, **headers):
+        return self.client.get(
+            url,
+            HTTP_X_INSTALL_ID=client.install_id,
+            **headers,
+        )
+
+    def test_terminal_detection_is_cacheable(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+
+        response = self.get(
+            f'/hand/detection/{detection.id}/',
+            detection.hand.client,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(
+            response['Cache-Control'],
+            f'private, max-age={TERMINAL_DETECTION_MAX_AGE}',
+        )
+        self.assertIn('X-Install-Id', response['Vary'])
+
+    def test_not_modified_with_matching_etag(self):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.SUCCEEDED.value,
+        )
+        url = f'/hand/detection/{detection.id}/'
+        etag = self.get(url, detection.hand.client)['ETag']
+
+        response = self.get(
+            url,
+            detection.hand.client,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_not_modified_since_last_modified(self):
+        detection = HandDetectionFactory(status=DetectionStatus.FAILED.value)
+        url = f'/hand/detection/{detection.id}/poll/'
+        last_modified = self.get(url, detection.hand.client)['Last-Modified']
+
+        response = self.get(
+            url,
+            detection.hand.client,
+            HTTP_IF_MODIFIED_SINCE=last_modified,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_pending_detection_must_revalidate(self):
+        detection = HandDetectionFactory()
+        url = f'/hand/detection/{detection.id}/'
+        response = self.get(url, detection.hand.client)
+
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        self.assertNotIn('Last-Modified', response)
+
+        detection.status = DetectionStatus.RUNNING.value
+        detection.save()
+        response = self.get(
+            url,
+            detection.hand.client,
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'running')
+
+    @patch('hand.views.hand_detection_view.poll_detection_result')
+    def test_poll_not_modified_while_running(self, mock_poll):
+        detection = HandDetectionFactory(
+            status=DetectionStatus.RUNNING.value,
+            call_id='fc-123',
+        )
+        mock_poll.return_value = None
+        url = f'/hand/detection/{detection.id}/poll/'
+        etag = self.get(url, detection.hand.client)['ETag']
+
+        response = self.get(
+            url,
+            detection.hand.client,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(mock_poll.call_count, 2)
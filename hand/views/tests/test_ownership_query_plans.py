@@ -0,0 +1,101 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from hand.factories import HandDetectionFactory
+from hand.models import HandCorrection
+from hand.views import HandCorrectionViewSet, HandDetectionViewSet
+
+CLIENT_INDEX_SCAN = re.compile(
+    r'Index Scan (?:Backward )?(?:using|on) \S*client',
+)
+# A Sort node, as opposed to the Sort Key of a Merge Append over partitions
+SORT_NODE = re.compile(r'(?:Incremental )?Sort  \(cost')
+
+
+def explain_ownership_filter(viewset_class, install_id: str) -> str:
+    """EXPLAIN a viewset's ownership-filtered queryset, without seq scans."""
+    request = APIRequestFactory().get('/', HTTP_X_INSTALL_ID=install_id)
+    view = viewset_class(
+        request=Request(request),
+        action='list',
+        kwargs={},
+        format_kwarg=None,
+    )
+    # Drop the select_related joins: only the ownership filter is checked
+    queryset = view.get_queryset().select_related(None).order_by('-created_at')
+
+    with connection.cursor() as cursor:
+        # Tables this small would be seq scanned regardless of indexes
+        cursor.execute('SET LOCAL enable_seqscan = off')
+    return queryset[:50].explain()
+
+
+def explain_listing_page(viewset_class, install_id: str) -> str:
+    """EXPLAIN a page after a cursor, as CreatedAtCursorPagination reads it."""
+    request = APIRequestFactory().get('/', HTTP_X_INSTALL_ID=install_id)
+    view = viewset_class(
+        request=Request(request),
+        action='list',
+        kwargs={},
+        format_kwarg=None,
+    )
+    now = timezone.now()
+    queryset = (
+        view.get_queryset()
+        .select_related(None)
+        .order_by('-created_at', '-id')
+        .filter(
+            Q(created_at__lte=now),
+            Q(created_at__lt=now)
+            | Q(id__lt='ffffffff-ffff-ffff-ffff-ffffffffffff'),
+        )
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+    return queryset[:51].explain()
+
+
+class TestOwnershipQueryPlans(TestCase):
+    def setUp(self):
+        self.detection = HandDetectionFactory()
+        self.install_id = self.detection.hand.client_id
+        HandCorrection.objects.create(hand=self.detection.hand)
+
+    def test_detection_ownership_uses_client_index(self):
+        plan = explain_ownership_filter(HandDetectionViewSet, self.install_id)
+
+        self.assertRegex(plan, CLIENT_INDEX_SCAN)
+        self.assertNotIn('hand_hand ', plan)
+        self.assertNotIn('user_client', plan)
+
+    def test_correction_ownership_uses_client_index(self):
+        plan = explain_ownership_filter(HandCorrectionViewSet, self.install_id)
+
+        self.assertRegex(plan, CLIENT_INDEX_SCAN)
+        self.assertNotIn('hand_hand ', plan)
+        self.assertNotIn('user_client', plan)
+
+    def test_detection_listing_order_comes_from_client_index(self):
+        plan = explain_listing_page(HandDetectionViewSet, self.install_id)
+
+        self.assertRegex(plan, CLIENT_INDEX_SCAN)
+        self.assertNotRegex(plan, SORT_NODE)
+
+    def test_correction_listing_order_comes_from_client_index(self):
+        plan = explain_listing_page(HandCorrectionViewSet, self.install_id)
+
+        self.assertRegex(plan, CLIENT_INDEX_SCAN)
+        self.assertNotRegex(plan, SORT_NODE)
+
+    def test_denormalized_client_matches_hand(self):
+        correction = HandCorrection.objects.get(hand=self.detection.hand)
+
+        self.assertEqual(self.detection.client_id, self.install_id)
+        self.assertEqual(correction.client_id, self.install_id)
@@ -0,0 +1,255 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from asset.constants import UploadStatus
+from asset.factories import AssetFactory, UploadSessionFactory
+from core.testing import QueryCountTestMixin
+from hand.constants import DetectionStatus
+from hand.factories import (
+    DetectionTileFactory,
+    HandDetectionFactory,
+    HandFactory,
+)
+from hand.models import HandCorrection
+from hand.packing import (
+    PackedDetectionTile,
+    pack_detection_tiles,
+    pack_tile_codes,
+)
+from hand.tiles import TILE_CODES
+from user.factories import ClientFactory
+
+HAND_TILE_CODES = list(TILE_CODES[:14])
+
+
+def modal_detections(count: int) -> list[dict]:
+    return [
+        {
+            'tile_code': tile_code,
+            'x1': i * 80,
+            'y1': 0,
+            'x2': i * 80 + 75,
+            'y2': 100,
+            'confidence': 0.9,
+        }
+        for i, tile_code in enumerate(HAND_TILE_CODES[:count])
+    ]
+
+
+def packed_hand() -> bytes:
+    return pack_detection_tiles(
+        PackedDetectionTile(
+            tile_code=tile['tile_code'],
+            x1=tile['x1'],
+            y1=tile['y1'],
+            x2=tile['x2'],
+            y2=tile['y2'],
+            confidence=Decimal('0.9000'),
+        )
+        for tile in modal_detections(len(HAND_TILE_CODES))
+    )
+
+
+def make_detections(client, rows: int) -> list:
+    """
+    A pending detection plus succeeded ones, alternating between packed
+    tiles and DetectionTile rows (stored before packing existed).
+    """
+    detections = [HandDetectionFactory(hand__client=client)]
+    for i in range(1, rows):
+        if i % 2:
+            detections.append(
+                HandDetectionFactory(
+                    hand__client=client,
+                    status=DetectionStatus.SUCCEEDED.value,
+                    packed_tiles=packed_hand(),
+                ),
+            )
+        else:
+            detection = HandDetectionFactory(
+                hand__client=client,
+                status=DetectionStatus.SUCCEEDED.value,
+            )
+            DetectionTileFactory.create_batch(3, detection=detection)
+            detections.append(detection)
+    return detections
+
+
+def make_corrections(client, rows: int) -> list[HandCorrection]:
+    corrections = []
+    for _ in range(rows):
+        hand = HandFactory(client=client)
+        correction = HandCorrection.objects.create(
+            hand=hand,
+            tile_indexes=pack_tile_codes(HAND_TILE_CODES),
+        )
+        hand.active_hand_correction = correction
+        hand.save()
+        corrections.append(correction)
+    return corrections
+
+
+class TestDetectionQueryCounts(QueryCountTestMixin, APITestCase):
+    def get(self, url: str, client):
+        response = self.client.get(url, HTTP_X_INSTALL_ID=client.install_id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_list(self):
+        def make_request(rows):
+            client = ClientFactory()
+            make_detections(client, rows)
+            return lambda: self.get('/hand/detection/', client)
+
+        # Client, page, DetectionTile rows of unpacked detections
+        self.assertQueryCountIndependentOfRows(
+            make_request,
+            max_queries=3,
+            sizes=(2, 20),
+        )
+
+    def test_retrieve(self):
+        def make_request(rows):
+            client = ClientFactory()
+            detection = make_detections(client, rows + 1)[1]
+            return lambda: self.get(f'/hand/detection/{detection.id}/', client)
+
+        # Client, detection
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=2)
+
+    @patch('hand.views.hand_detection_view.poll_detection_result')
+    def test_poll_finished(self, mock_poll):
+        def make_request(rows):
+            client = ClientFactory()
+            detection = make_detections(client, rows + 1)[1]
+            return lambda: self.get(
+                f'/hand/detection/{detection.id}/poll/',
+                client,
+            )
+
+        # Client, detection
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=2)
+        mock_poll.assert_not_called()
+
+    @patch('hand.views.hand_detection_view.poll_detection_result')
+    def test_poll_stores_result(self, mock_poll):
+        def make_request(rows):
+            detection = HandDetectionFactory(
+                status=DetectionStatus.RUNNING.value,
+                call_id='fc-test',
+            )
+            mock_poll.return_value = {'detections': modal_detections(rows)}
+            return lambda: self.get(
+                f'/hand/detection/{detection.id}/poll/',
+                detection.hand.client,
+            )
+
+        # Client, detection, DetectionTile insert, update, reload
+        self.assertQueryCountIndependentOfRows(
+            make_request,
+            max_queries=5,
+            sizes=(1, 14),
+        )
+
+    @patch(
+        'hand.services.hand_inference.submit_detection',
+        return_value='fc-test',
+    )
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_get_url',
+        return_value='https://images.example/photo.jpg',
+    )
+    def test_create(self, mock_url, mock_submit):
+        def make_request(rows):
+            client = ClientFactory()
+            make_detections(client, rows)
+            asset = AssetFactory(
+                upload_session=UploadSessionFactory(
+                    client=client,
+                    status=UploadStatus.COMPLETED.value,
+                ),
+                is_active=True,
+            )
+
+            def request():
+                response = self.client.post(
+                    '/hand/detection/',
+                    data={'asset_id': str(asset.id)},
+                    format='json',
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+            return request
+
+        # Client, asset validation and lookup, existing AssetRef lookup,
+        # savepoint with hand, AssetRef and detection inserts (5), reload,
+        # asset for the image URL, status update, tiles of the response
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=13)
+
+
+class TestCorrectionQueryCounts(QueryCountTestMixin, APITestCase):
+    def get(self, url: str, client):
+        response = self.client.get(url, HTTP_X_INSTALL_ID=client.install_id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_list(self):
+        def make_request(rows):
+            client = ClientFactory()
+            make_corrections(client, rows)
+            return lambda: self.get('/hand/correction/', client)
+
+        # Client, page
+        self.assertQueryCountIndependentOfRows(
+            make_request,
+            max_queries=2,
+            sizes=(2, 20),
+        )
+
+    def test_retrieve(self):
+        def make_request(rows):
+            client = ClientFactory()
+            correction = make_corrections(client, rows)[0]
+            return lambda: self.get(
+                f'/hand/correction/{correction.id}/',
+                client,
+            )
+
+        # Client, correction
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=2)
+
+    def test_create(self):
+        def make_request(rows):
+            detection = HandDetectionFactory()
+
+            def request():
+                response = self.client.post(
+                    '/hand/correction/',
+                    data={
+                        'hand_id': str(detection.hand_id),
+                        'detection_id': str(detection.id),
+                        'tiles': [
+                            {'tile_code': tile_code, 'sort_order': i}
+                            for i, tile_code in enumerate(
+                                HAND_TILE_CODES[:rows],
+                            )
+                        ],
+                    },
+                    format='json',
+                    HTTP_X_INSTALL_ID=detection.hand.client_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+            return request
+
+        # Client, hand and detection validation, savepoint with correction
+        # insert and hand update (4)
+        self.assertQueryCountIndependentOfRows(
+            make_request,
+            max_queries=7,
+            sizes=(1, 14),
+        )
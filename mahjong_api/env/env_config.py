@@ -84,6 +84,21 @@ class EnvConfig:
         group='Storage',
     )
 
+    STORAGE_PROVIDER: str = EnvVar(
+        'STORAGE_PROVIDER',
+        default='r2',
+        choices=['r2', 's3', 'local'],
+        description='Storage backend for uploads',
+        group='Storage',
+    )
+
+    LOCAL_STORAGE_BASE_URL: str = EnvVar(
+        'LOCAL_STORAGE_BASE_URL',
+        default='http://localhost:8000',
+        description='Base URL for local storage presigned URLs',
+        group='Storage',
+    )
+
     MODAL_CV_ENDPOINT: str = EnvVar(
         'MODAL_CV_ENDPOINT',
         required=True,
@@ -116,6 +131,34 @@ class EnvConfig:
         group='ML/CV',
     )
 
+    DETECTION_BACKEND: str | None = EnvVar(
+        'DETECTION_BACKEND',
+        choices=['gpu', 'cpu'],
+        description='Modal inference backend (unset: per model version)',
+        group='ML/CV',
+    )
+
+    DETECTION_BACKENDS: list[str] = EnvVar(
+        'DETECTION_BACKENDS',
+        default=[],
+        description='Backend per model version, e.g. v1:cpu,v2:gpu',
+        group='ML/CV',
+    )
+
+    REQUEST_METRICS_ENABLED: bool = EnvVar(
+        'REQUEST_METRICS_ENABLED',
+        default=False,
+        description='Per-request metrics, Server-Timing and /metrics',
+        group='Observability',
+    )
+
+    METRICS_AUTH_TOKEN: str | None = EnvVar(
+        'METRICS_AUTH_TOKEN',
+        secret=True,
+        description='Bearer token for /metrics (404 when unset)',
+        group='Observability',
+    )
+
     @property
     def _is_test(self) -> bool:
         """Internal: check if running tests."""
@@ -167,6 +210,20 @@ class EnvConfig:
             and self.AWS_SECRET_ACCESS_KEY,
         )
 
+    @property
+    def detection_backends(self) -> dict[str, str]:
+        """DETECTION_BACKENDS as a model version to backend mapping."""
+        backends = {}
+        for entry in self.DETECTION_BACKENDS:
+            version, _, backend = entry.partition(':')
+            if backend not in ('gpu', 'cpu'):
+                raise ValueError(
+                    f"'DETECTION_BACKENDS' entry {entry!r} must be "
+                    'version:gpu or version:cpu',
+                )
+            backends[version] = backend
+        return backends
+
     @property
     def has_modal(self) -> bool:
         """Check if Modal.com is configured."""
@@ -26,6 +26,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -105,12 +106,97 @@ STORAGES = {
 
 STORAGE_BUCKET_IMAGES = ''
 
+# Backend for new uploads (asset.constants.StorageProvider value). 'local'
+# stores objects under LOCAL_STORAGE_ROOT and serves presigned URLs from
+# LOCAL_STORAGE_BASE_URL, so the pipeline runs without R2.
+STORAGE_PROVIDER = 'r2'
+LOCAL_STORAGE_ROOT = MEDIA_ROOT / 'local-storage'
+LOCAL_STORAGE_BASE_URL = 'http://localhost:8000'
+
+# Presigned URL cache: per-process LRU size, plus an optional CACHES alias
+# shared between workers (None keeps the cache process-local).
+PRESIGNED_URL_CACHE_MAX_ENTRIES = 1024
+PRESIGNED_URL_CACHE_ALIAS = None
+
+# Per-process cache of clients resolved from X-Install-Id: seconds an entry
+# is trusted (0 disables the cache) and LRU size.
+CLIENT_CACHE_TTL = 30
+CLIENT_CACHE_MAX_ENTRIES = 4096
+
+# Per-process LRU size of serialized succeeded/failed detections served by
+# GET /hand/detection/{id}/ and its poll (0 disables the cache).
+DETECTION_RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# Client.last_seen_at is buffered per process and written in one batch every
+# CLIENT_ACTIVITY_FLUSH_INTERVAL seconds (or at CLIENT_ACTIVITY_MAX_PENDING
+# buffered clients), only once the stored value is more than
+# CLIENT_ACTIVITY_GRANULARITY seconds old.
+CLIENT_ACTIVITY_FLUSH_INTERVAL = 30
+CLIENT_ACTIVITY_GRANULARITY = 60
+CLIENT_ACTIVITY_MAX_PENDING = 1000
+
+# DELETE /user/client/me/ deletes the client's data in a background thread
+# after responding. Interrupted deletions are resumed by
+# process_client_deletions.
+CLIENT_DELETION_ASYNC = True
+
+# Detected boxes overlapping a more confident box by more than this IoU are
+# dropped as duplicates, whatever tile they were classified as.
+DETECTION_NMS_IOU_THRESHOLD = 0.5
+
+# Candidate tiles Modal returns per box (1-5). Candidates other than the
+# assigned tile are stored as the tile's alternatives.
+DETECTION_TOP_K = 3
+
+# Modal backend detections run on: 'gpu', 'cpu' (ONNX Runtime), or None for
+# the model version's default on Modal. DETECTION_BACKENDS picks the backend
+# of specific model versions, e.g. {'v2': 'cpu'}, over DETECTION_BACKEND.
+DETECTION_BACKEND = None
+DETECTION_BACKENDS = {}
+
+# Detections always store their tiles packed on HandDetection.packed_tiles.
+# While True, one DetectionTile row per tile is written as well.
+DETECTION_STORE_TILE_ROWS = True
+
+# Corrections store their tiles as HandCorrection.tile_indexes. While True,
+# one HandTile row per tile is written as well (for readers of HandTile).
+HAND_CORRECTION_STORE_TILE_ROWS = False
+
+# Monthly detection partitions: how many future months to keep created, and
+# how many months of history to keep attached (None keeps everything).
+# Older partitions are detached into DETECTION_ARCHIVE_SCHEMA.
+DETECTION_PARTITION_MONTHS_AHEAD = 3
+DETECTION_PARTITION_RETENTION_MONTHS = None
+DETECTION_ARCHIVE_SCHEMA = 'archive'
+PSQLEXTRA_PARTITIONING_MANAGER = (
+    'hand.services.partitioning.partitioning_manager'
+)
+
+# Count and time SQL queries and outbound calls per request, reported in a
+# Server-Timing header and as histograms at /metrics (served only with the
+# bearer METRICS_AUTH_TOKEN, and not at all without one). Off: the
+# middleware is not loaded.
+REQUEST_METRICS_ENABLED = False
+METRICS_AUTH_TOKEN = None
+
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
 REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'user.authentication.InstallIdAuthentication',
+    ],
     'EXCEPTION_HANDLER': 'core.exceptions.exception_handler',
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
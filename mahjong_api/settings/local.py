@@ -21,6 +21,8 @@ DATABASES = {
 DETECTION_CONFIDENCE_THRESHOLD = env.DETECTION_CONFIDENCE_THRESHOLD
 
 STORAGE_BUCKET_IMAGES = env.R2_BUCKET_IMAGES
+STORAGE_PROVIDER = env.STORAGE_PROVIDER
+LOCAL_STORAGE_BASE_URL = env.LOCAL_STORAGE_BASE_URL
 
 STORAGES = {
     'default': {
@@ -47,3 +49,8 @@ MEDIA_URL = f'{R2_ENDPOINT_URL}/{env.R2_BUCKET_IMAGES}/'  # noqa: F405
 MODAL_CV_ENDPOINT = env.MODAL_CV_ENDPOINT
 MODAL_AUTH_TOKEN = env.MODAL_AUTH_TOKEN
 MODEL_VERSION = env.MODEL_VERSION
+DETECTION_BACKEND = env.DETECTION_BACKEND
+DETECTION_BACKENDS = env.detection_backends
+
+REQUEST_METRICS_ENABLED = env.REQUEST_METRICS_ENABLED
+METRICS_AUTH_TOKEN = env.METRICS_AUTH_TOKEN
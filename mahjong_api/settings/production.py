@@ -60,6 +60,11 @@ DETECTION_CONFIDENCE_THRESHOLD = env.DETECTION_CONFIDENCE_THRESHOLD
 MODAL_CV_ENDPOINT = env.MODAL_CV_ENDPOINT
 MODAL_AUTH_TOKEN = env.MODAL_AUTH_TOKEN
 MODEL_VERSION = env.MODEL_VERSION
+DETECTION_BACKEND = env.DETECTION_BACKEND
+DETECTION_BACKENDS = env.detection_backends
+
+REQUEST_METRICS_ENABLED = env.REQUEST_METRICS_ENABLED
+METRICS_AUTH_TOKEN = env.METRICS_AUTH_TOKEN
 
 LOGGING = {
     'version': 1,
@@ -50,3 +50,12 @@ MODAL_AUTH_TOKEN = 'test-token'
 MODEL_VERSION = 'v0'
 
 DETECTION_CONFIDENCE_THRESHOLD = 0.5
+
+# Tests reuse install_ids across rolled-back transactions
+CLIENT_CACHE_TTL = 0
+
+# Write activity immediately so nothing is buffered across test transactions
+CLIENT_ACTIVITY_FLUSH_INTERVAL = 0
+
+# Delete clients before DELETE /user/client/me/ responds
+CLIENT_DELETION_ASYNC = False
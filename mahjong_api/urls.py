@@ -20,6 +20,8 @@ from django.urls import include, path
 from rest_framework import routers
 from django.http import JsonResponse
 
+from core.views import metrics
+
 router = routers.DefaultRouter()
 
 
@@ -31,6 +33,7 @@ urlpatterns = [
     path('', include(router.urls)),
     path('admin/', admin.site.urls),
     path('healthz/', healthz),
+    path('metrics', metrics),
     path(
         'api-auth/',
         include('rest_framework.urls', namespace='rest_framework'),
@@ -1,4 +1,5 @@
 from . import app  # noqa: F401
 from . import detect  # noqa: F401
+from . import export  # noqa: F401
 from . import server  # noqa: F401
 from . import utils  # noqa: F401
@@ -4,10 +4,18 @@ image = (
     modal.Image.debian_slim(python_version='3.12')
     .apt_install('libgl1', 'libglib2.0-0')
     .pip_install(
-        'ultralytics>=8.0.0',
+        'ultralytics>=8.4,<9',
         'pillow',
         'fastapi[standard]',
     )
 )
 
+# CPU inference on ONNX exports needs neither torch nor ultralytics
+cpu_image = modal.Image.debian_slim(python_version='3.12').pip_install(
+    'onnxruntime',
+    'numpy',
+    'opencv-python-headless',
+    'fastapi[standard]',
+)
+
 app = modal.App('mahjong-cv', image=image)
@@ -1,56 +1,90 @@
-import modal
+import functools
 from pathlib import Path
 
-from .app import app
-from .utils import validate_tile_code
+import modal
+
+from .app import app, cpu_image
+from .utils import DEFAULT_TOP_K, tile_codes_by_class
 
 volume = modal.Volume.from_name('mahjong-model-weights-vol')
 
 MODEL_DIR = '/models'
 
+# Physical cores reserved per CPU container, one ONNX Runtime thread each
+CPU_INFERENCE_CORES = 4
+
 
 @app.function(
     gpu='T4',
     timeout=60,
     volumes={MODEL_DIR: volume},
 )
-def detect_tiles(model_version: str, image_url: str) -> dict:
-    """Detect mahjong tiles in an image using a YOLO model."""
+def detect_tiles(
+    model_version: str,
+    image_url: str,
+    top_k: int = DEFAULT_TOP_K,
+) -> dict:
+    """
+    Detect mahjong tiles in an image using a YOLO model.
+
+    Each detection lists its top_k classes as `candidates`,
+    [[tile_code, confidence], ...] best first.
+    """
     from ultralytics import YOLO
 
+    from .postprocess import result_detections
+    from .topk import TopKDetectionPredictor
+
     model_path = Path(MODEL_DIR) / model_version / 'model.pt'
     model = YOLO(model_path)
-    results = model(image_url)
+    results = model.predict(
+        image_url,
+        predictor=functools.partial(TopKDetectionPredictor, top_k=top_k),
+    )
 
+    tile_codes = tile_codes_by_class(model.names)
     detections = []
     inference_time_ms = 0.0
 
     for result in results:
         inference_time_ms = result.speed.get('inference', 0.0)
-
-        for box in result.boxes:
-            cls_id = int(box.cls.cpu().numpy().item())
-            label = model.names[cls_id]
-            tile_code = validate_tile_code(label)
-            if tile_code is None:
-                continue
-
-            confidence = float(box.conf.cpu().numpy().item())
-            x1, y1, x2, y2 = box.xyxy[0].cpu().numpy().tolist()
-
-            detections.append(
-                {
-                    'tile_code': tile_code,
-                    'confidence': confidence,
-                    'x1': x1,
-                    'y1': y1,
-                    'x2': x2,
-                    'y2': y2,
-                },
-            )
+        detections.extend(result_detections(result, tile_codes))
 
     return {
         'detections': detections,
         'model_version': model_version,
         'inference_time_ms': inference_time_ms,
     }
+
+
+@functools.cache
+def _onnx_detector(model_version: str):
+    """The ONNX Runtime session of a version, kept while the container is."""
+    from .onnx_detector import OnnxTileDetector
+
+    return OnnxTileDetector(
+        Path(MODEL_DIR) / model_version / 'model.onnx',
+        threads=CPU_INFERENCE_CORES,
+    )
+
+
+@app.function(
+    image=cpu_image,
+    cpu=CPU_INFERENCE_CORES,
+    timeout=60,
+    volumes={MODEL_DIR: volume},
+)
+def detect_tiles_cpu(
+    model_version: str,
+    image_url: str,
+    top_k: int = DEFAULT_TOP_K,
+) -> dict:
+    """
+    detect_tiles on CPU, with the ONNX export of the model (see export.py).
+    """
+    result = _onnx_detector(model_version).detect_url(image_url, top_k=top_k)
+    return {
+        'detections': result['detections'],
+        'model_version': model_version,
+        'inference_time_ms': result['inference_time_ms'],
+    }
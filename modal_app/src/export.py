@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from .app import app, image
+from .detect import MODEL_DIR, volume
+from .utils import SUPPORTED_MODEL_VERSIONS
+
+
+@app.function(
+    image=image.pip_install('onnx', 'onnxslim'),
+    timeout=600,
+    volumes={MODEL_DIR: volume},
+)
+def export_onnx(model_versions: list[str] | None = None) -> list[str]:
+    """
+    Export model.pt of each version to model.onnx beside it, for the CPU
+    backend. Versions without a model.pt are skipped. Exports take any
+    input shape, so the CPU backend pads images as little as detect_tiles.
+
+    Returns the exported versions.
+    """
+    from ultralytics import YOLO
+
+    exported = []
+    for version in model_versions or SUPPORTED_MODEL_VERSIONS:
+        model_path = Path(MODEL_DIR) / version / 'model.pt'
+        if not model_path.exists():
+            continue
+        YOLO(model_path).export(
+            format='onnx',
+            simplify=True,
+            dynamic=True,
+            device='cpu',
+        )
+        exported.append(version)
+
+    volume.commit()
+    return exported
+
+
+@app.local_entrypoint()
+def main(versions: str = ''):
+    """modal run -m modal_app.src.export [--versions v1,v2]"""
+    print(export_onnx.remote(versions.split(',') if versions else None))
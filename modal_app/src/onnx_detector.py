@@ -0,0 +1,252 @@
+import ast
+import time
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+import onnxruntime
+
+from .utils import tile_codes_by_class
+
+# Ultralytics predict defaults, so both backends keep the same boxes
+CONFIDENCE_THRESHOLD = 0.25
+IOU_THRESHOLD = 0.7
+MAX_DETECTIONS = 300
+# Offset separating classes for class-aware NMS, as in ultralytics
+MAX_WH = 7680
+PAD_VALUE = 114
+DOWNLOAD_TIMEOUT_SECONDS = 10
+
+
+@dataclass(frozen=True)
+class Letterbox:
+    """How an image was resized and padded to the model input."""
+
+    gain_x: float
+    gain_y: float
+    pad_x: int
+    pad_y: int
+    width: int
+    height: int
+
+
+def decode_image(data: bytes) -> np.ndarray:
+    """
+    Decode an image file to a BGR array the way ultralytics reads the images
+    detect_tiles downloads: full size, EXIF orientation applied.
+    """
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError('Unsupported or corrupt image')
+    return image
+
+
+def letterbox(
+    image: np.ndarray,
+    size: int,
+    *,
+    stride: int | None = None,
+) -> tuple[np.ndarray, Letterbox]:
+    """
+    Resize a BGR image to fit size x size keeping its aspect ratio, pad the
+    rest grey, and return it as a (1, 3, h, w) RGB float32 batch in [0, 1].
+
+    Follows ultralytics' LetterBox step for step (cv2 INTER_LINEAR resize,
+    rounding, padding split) so both backends see the same pixels. With
+    stride, each side is only padded up to a multiple of stride, as
+    ultralytics does for models taking any input shape.
+    """
+    height, width = image.shape[:2]
+    gain = min(size / height, size / width)
+    resized_width, resized_height = round(width * gain), round(height * gain)
+    pad_x, pad_y = size - resized_width, size - resized_height
+    if stride:
+        pad_x, pad_y = pad_x % stride, pad_y % stride
+
+    if (resized_width, resized_height) != (width, height):
+        image = cv2.resize(
+            image,
+            (resized_width, resized_height),
+            interpolation=cv2.INTER_LINEAR,
+        )
+    top, bottom = round(pad_y / 2 - 0.1), round(pad_y / 2 + 0.1)
+    left, right = round(pad_x / 2 - 0.1), round(pad_x / 2 + 0.1)
+    image = cv2.copyMakeBorder(
+        image,
+        top,
+        bottom,
+        left,
+        right,
+        cv2.BORDER_CONSTANT,
+        value=(PAD_VALUE,) * 3,
+    )
+
+    # HWC BGR to NCHW RGB
+    batch = np.ascontiguousarray(image[None, ..., ::-1].transpose(0, 3, 1, 2))
+    return batch.astype(np.float32) / 255.0, Letterbox(
+        resized_width / width,
+        resized_height / height,
+        left,
+        top,
+        width,
+        height,
+    )
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float,
+) -> np.ndarray:
+    """Indexes of the (n, 4) x1, y1, x2, y2 boxes kept by greedy NMS."""
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    order = np.argsort(-scores, kind='stable')
+    kept = []
+    while order.size:
+        best, rest = order[0], order[1:]
+        kept.append(best)
+        width = np.clip(
+            np.minimum(boxes[best, 2], boxes[rest, 2])
+            - np.maximum(boxes[best, 0], boxes[rest, 0]),
+            0,
+            None,
+        )
+        height = np.clip(
+            np.minimum(boxes[best, 3], boxes[rest, 3])
+            - np.maximum(boxes[best, 1], boxes[rest, 1]),
+            0,
+            None,
+        )
+        intersection = width * height
+        iou = intersection / (areas[best] + areas[rest] - intersection)
+        order = rest[iou <= iou_threshold]
+    return np.array(kept, dtype=int)
+
+
+class OnnxTileDetector:
+    """
+    Tile detection with an ONNX export of a YOLO model on ONNX Runtime.
+
+    Runs without torch or ultralytics and returns detections in the format
+    of detect_tiles, each box with its top_k `candidates`.
+    Intra-op parallelism uses `threads` threads; a single session runs one
+    image at a time, so inter-op parallelism is disabled.
+    """
+
+    def __init__(self, model_path: str | Path, *, threads: int):
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        self.session = onnxruntime.InferenceSession(
+            str(model_path),
+            options,
+            providers=['CPUExecutionProvider'],
+        )
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        # Ultralytics stores its export arguments as metadata literals
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.names: dict[int, str] = ast.literal_eval(metadata['names'])
+        self.image_size = ast.literal_eval(metadata['imgsz'])[0]
+        self.tile_codes = tile_codes_by_class(self.names)
+        # Exports with dynamic axes (see export.py) take the same minimal
+        # padding as model.pt does in detect_tiles; fixed ones a square
+        dynamic = not all(isinstance(dim, int) for dim in model_input.shape)
+        self.stride = int(metadata['stride']) if dynamic else None
+
+    def detect_url(self, image_url: str, *, top_k: int) -> dict:
+        """Download an image and detect its tiles."""
+        with urllib.request.urlopen(
+            image_url,
+            timeout=DOWNLOAD_TIMEOUT_SECONDS,
+        ) as response:
+            data = response.read()
+        return self.detect(decode_image(data), top_k=top_k)
+
+    def detect(self, image: np.ndarray, *, top_k: int) -> dict:
+        """
+        Detect tiles in a BGR image (see decode_image).
+
+        Returns detections and inference_time_ms, like detect_tiles.
+        """
+        batch, box = letterbox(image, self.image_size, stride=self.stride)
+
+        start = time.perf_counter()
+        (output,) = self.session.run(None, {self.input_name: batch})
+        inference_time_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            'detections': self._detections(output[0], box, top_k),
+            'inference_time_ms': inference_time_ms,
+        }
+
+    def _detections(
+        self,
+        output: np.ndarray,
+        box: Letterbox,
+        top_k: int,
+    ) -> list[dict]:
+        # (4 + nc, anchors) of cx, cy, w, h then class scores
+        predictions = output.T
+        scores = predictions[:, 4:]
+        confidences = scores.max(axis=1)
+        candidates = confidences > CONFIDENCE_THRESHOLD
+        predictions = predictions[candidates]
+        scores = scores[candidates]
+        confidences = confidences[candidates]
+        classes = scores.argmax(axis=1)
+
+        cx, cy, w, h = predictions[:, :4].T
+        boxes = np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], 1)
+        kept = non_max_suppression(
+            boxes + classes[:, None] * MAX_WH,
+            confidences,
+            IOU_THRESHOLD,
+        )[:MAX_DETECTIONS]
+
+        # Back to source image pixels
+        boxes = boxes[kept]
+        boxes -= [box.pad_x, box.pad_y, box.pad_x, box.pad_y]
+        boxes /= [box.gain_x, box.gain_y, box.gain_x, box.gain_y]
+        boxes.clip(0, [box.width, box.height, box.width, box.height], boxes)
+
+        k = min(top_k, scores.shape[1])
+        topk_classes = np.argsort(-scores[kept], axis=1, kind='stable')[:, :k]
+        topk_scores = np.take_along_axis(scores[kept], topk_classes, axis=1)
+
+        confidences = confidences[kept].tolist()
+        classes = classes[kept].tolist()
+        topk_classes = topk_classes.tolist()
+        topk_scores = topk_scores.tolist()
+
+        detections = []
+        for i, (x1, y1, x2, y2) in enumerate(boxes.tolist()):
+            tile_code = self.tile_codes[classes[i]]
+            if tile_code is None:
+                continue
+            detections.append(
+                {
+                    'tile_code': tile_code,
+                    'confidence': confidences[i],
+                    'x1': x1,
+                    'y1': y1,
+                    'x2': x2,
+                    'y2': y2,
+                    'candidates': [
+                        [self.tile_codes[candidate], round(score, 4)]
+                        for candidate, score in zip(
+                            topk_classes[i],
+                            topk_scores[i],
+                            strict=True,
+                        )
+                        if self.tile_codes[candidate] is not None
+                    ],
+                },
+            )
+        return detections
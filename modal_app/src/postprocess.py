@@ -0,0 +1,52 @@
+import torch
+from ultralytics.engine.results import Results
+
+
+def result_detections(
+    result: Results,
+    tile_codes: list[str | None],
+) -> list[dict]:
+    """
+    Detections of a TopKDetectionPredictor result, in one pass.
+
+    Boxes, confidences, classes and top-k candidates are concatenated on the
+    inference device and copied to the host once, rather than syncing per
+    box. tile_codes maps class ids to tile codes (see tile_codes_by_class);
+    boxes whose class is not a tile are skipped, as are such candidates.
+    """
+    k = result.topk_conf.shape[1]
+    data = result.boxes.data
+    rows = (
+        torch.cat(
+            [data, result.topk_conf.to(data), result.topk_cls.to(data)],
+            dim=1,
+        )
+        .cpu()
+        .tolist()
+    )
+
+    detections = []
+    for x1, y1, x2, y2, confidence, class_id, *topk in rows:
+        tile_code = tile_codes[int(class_id)]
+        if tile_code is None:
+            continue
+        detections.append(
+            {
+                'tile_code': tile_code,
+                'confidence': confidence,
+                'x1': x1,
+                'y1': y1,
+                'x2': x2,
+                'y2': y2,
+                'candidates': [
+                    [tile_codes[int(candidate)], round(score, 4)]
+                    for score, candidate in zip(
+                        topk[:k],
+                        topk[k:],
+                        strict=True,
+                    )
+                    if tile_codes[int(candidate)] is not None
+                ],
+            },
+        )
+    return detections
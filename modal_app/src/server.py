@@ -1,9 +1,10 @@
 import os
+from typing import Literal
 
 import modal
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from starlette.middleware.base import (
     BaseHTTPMiddleware,
     RequestResponseEndpoint,
@@ -11,8 +12,14 @@ from starlette.middleware.base import (
 from starlette.responses import Response
 
 from .app import app
-from .detect import detect_tiles
-from .utils import SUPPORTED_MODEL_VERSIONS, validate_model_version
+from .detect import detect_tiles, detect_tiles_cpu
+from .utils import (
+    DEFAULT_TOP_K,
+    MAX_TOP_K,
+    SUPPORTED_MODEL_VERSIONS,
+    default_backend,
+    validate_model_version,
+)
 
 auth_secret = modal.Secret.from_name('mahjong-cv-auth')
 
@@ -48,6 +55,8 @@ web_app.add_middleware(BearerAuthMiddleware)
 class DetectRequest(BaseModel):
     image_url: HttpUrl
     version: str
+    top_k: int = Field(default=DEFAULT_TOP_K, ge=1, le=MAX_TOP_K)
+    backend: Literal['gpu', 'cpu'] | None = None
 
 
 @web_app.post('/detect')
@@ -62,7 +71,13 @@ async def accept_detection(body: DetectRequest):
             status_code=400,
         )
 
-    call = detect_tiles.spawn(body.version, str(body.image_url))
+    backend = body.backend or default_backend(body.version)
+    detect = detect_tiles_cpu if backend == 'cpu' else detect_tiles
+    call = detect.spawn(
+        body.version,
+        str(body.image_url),
+        body.top_k,
+    )
     return JSONResponse({'call_id': call.object_id})
 
 
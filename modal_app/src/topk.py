@@ -0,0 +1,60 @@
+import torch
+from ultralytics.models.yolo.detect import DetectionPredictor
+from ultralytics.utils import nms, ops
+
+
+class TopKDetectionPredictor(DetectionPredictor):
+    """
+    DetectionPredictor that keeps the top_k class scores of each box.
+
+    Ultralytics NMS only returns the best class per box, so NMS is asked for
+    the anchor indexes it kept and the class scores of those anchors are
+    gathered from the raw predictions. The top k are taken with one topk
+    over every kept box, on the inference device. End-to-end models output
+    no class scores, so their boxes only list their best class.
+
+    Each result gets `topk_conf` and `topk_cls`, (n, k) tensors aligned
+    with result.boxes.
+    """
+
+    def __init__(self, *args, top_k: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.top_k = top_k
+
+    def postprocess(self, preds, img, orig_imgs, **kwargs):
+        if isinstance(preds, (list, tuple)):
+            preds = preds[0]
+        end2end = getattr(self.model, 'end2end', False)
+        kept, kept_idxs = nms.non_max_suppression(
+            preds,
+            self.args.conf,
+            self.args.iou,
+            self.args.classes,
+            self.args.agnostic_nms,
+            max_det=self.args.max_det,
+            end2end=end2end,
+            return_idxs=True,
+        )
+        if not isinstance(orig_imgs, list):
+            orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)[..., ::-1]
+
+        results = self.construct_results(kept, img, orig_imgs)
+        for result, pred, raw, idxs in zip(
+            results,
+            kept,
+            preds,
+            kept_idxs,
+            strict=True,
+        ):
+            if end2end or pred.shape[0] == 0:
+                result.topk_conf = pred[:, 4:5]
+                result.topk_cls = pred[:, 5:6].long()
+                continue
+            # (4 + nc, anchors) -> (n, nc) class scores of the kept boxes
+            scores = raw[4 : 4 + len(self.model.names), idxs.long()].T
+            result.topk_conf, result.topk_cls = torch.topk(
+                scores.float(),
+                min(self.top_k, scores.shape[1]),
+                dim=1,
+            )
+        return results
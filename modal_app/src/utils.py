@@ -1,55 +1,72 @@
 SUPPORTED_MODEL_VERSIONS = ['v0', 'v1', 'v2']
 
+# Candidate classes returned per detected box
+DEFAULT_TOP_K = 3
+MAX_TOP_K = 5
+
+# 'gpu' runs model.pt on a T4, 'cpu' its ONNX export (see export.py) on
+# ONNX Runtime. Requests may pick a backend (the API configures one per
+# model version), else their version's entry here, else DEFAULT_BACKEND.
+DEFAULT_BACKEND = 'gpu'
+MODEL_VERSION_BACKENDS: dict[str, str] = {}
+
 
 def validate_model_version(version: str) -> str | None:
     """Validate if the provided model version is supported"""
     return version if version in SUPPORTED_MODEL_VERSIONS else None
 
 
-VALID_TILE_CODES = [
-    '1B',
-    '2B',
-    '3B',
-    '4B',
-    '5B',
-    '6B',
-    '7B',
-    '8B',
-    '9B',
-    '1C',
-    '2C',
-    '3C',
-    '4C',
-    '5C',
-    '6C',
-    '7C',
-    '8C',
-    '9C',
-    '1D',
-    '2D',
-    '3D',
-    '4D',
-    '5D',
-    '6D',
-    '7D',
-    '8D',
-    '9D',
-    'EW',
-    'SW',
-    'WW',
-    'NW',
-    'RD',
-    'GD',
-    'WD',
-    '1F',
-    '2F',
-    '3F',
-    '4F',
-    '1S',
-    '2S',
-    '3S',
-    '4S',
-]
+def default_backend(version: str) -> str:
+    """Backend used for version when a request does not pick one."""
+    return MODEL_VERSION_BACKENDS.get(version, DEFAULT_BACKEND)
+
+
+VALID_TILE_CODES = frozenset(
+    [
+        '1B',
+        '2B',
+        '3B',
+        '4B',
+        '5B',
+        '6B',
+        '7B',
+        '8B',
+        '9B',
+        '1C',
+        '2C',
+        '3C',
+        '4C',
+        '5C',
+        '6C',
+        '7C',
+        '8C',
+        '9C',
+        '1D',
+        '2D',
+        '3D',
+        '4D',
+        '5D',
+        '6D',
+        '7D',
+        '8D',
+        '9D',
+        'EW',
+        'SW',
+        'WW',
+        'NW',
+        'RD',
+        'GD',
+        'WD',
+        '1F',
+        '2F',
+        '3F',
+        '4F',
+        '1S',
+        '2S',
+        '3S',
+        '4S',
+    ],
+)
 
 
 def validate_tile_code(label: str) -> str | None:
@@ -58,3 +75,13 @@ def validate_tile_code(label: str) -> str | None:
     Returns None if the label is not a known tile.
     """
     return label if label in VALID_TILE_CODES else None
+
+
+def tile_codes_by_class(names: dict[int, str]) -> list[str | None]:
+    """Tile code of each model class id, None for labels that are not tiles.
+
+    Built once per model so detections map class ids by indexing.
+    """
+    return [
+        validate_tile_code(names[class_id]) for class_id in range(len(names))
+    ]
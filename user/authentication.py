@@ -0,0 +1,36 @@
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+
+
+INSTALL_ID_HEADER = 'HTTP_X_INSTALL_ID'
+
+
+class InstallIdAuthentication(BaseAuthentication):
+    """
+    Resolve the Client named by the X-Install-Id header once per request.
+
+    The client becomes `request.user` (and the install_id `request.auth`),
+    so views and services share one lookup, served from the per-process
+    client cache when possible, and the client's activity is recorded for
+    the buffered last_seen_at flush. Requests without the header, or naming an
+    unknown install_id, stay anonymous; views that need a client raise
+    through user.views.get_request_client.
+
+    DRF imports authentication classes while rest_framework.views is still
+    loading, so nothing that imports core.exceptions may be imported at
+    module level here.
+    """
+
+    def authenticate(self, request: Request):
+        install_id = request.META.get(INSTALL_ID_HEADER)
+        if not install_id:
+            return None
+
+        from user.services.client_activity import get_client_activity_tracker
+        from user.services.client_cache import get_client_cache
+
+        client = get_client_cache().get(install_id)
+        if client is None:
+            return None
+        get_client_activity_tracker().record(client)
+        return client, install_id
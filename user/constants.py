@@ -0,0 +1,26 @@
+from enum import Enum
+
+
+class ClientDeletionStatus(Enum):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    @classmethod
+    def choices(cls):
+        return [(item.value, item.name) for item in cls]
+
+
+# Rows deleted per statement when deleting a client's data
+CLIENT_DELETION_CHUNK_SIZE = 1000
+
+# A RUNNING deletion not updated for this long is assumed abandoned (its
+# process died) and can be claimed again
+CLIENT_DELETION_STALE_MINUTES = 15
+
+# Rows fetched per server-side cursor round trip when exporting a client
+CLIENT_EXPORT_CHUNK_SIZE = 500
+
+# Image links in an export stay valid this long (seconds)
+CLIENT_EXPORT_IMAGE_URL_EXPIRY = 24 * 3600
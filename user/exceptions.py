@@ -15,3 +15,10 @@ class MissingInstallIdHeader(BaseAPIException):
     code: str = 'missing_install_id_header'
     message: str = 'X-Install-Id header is required.'
     status_code: int = 400
+
+
+@attr.s(auto_attribs=True, auto_exc=True)
+class ClientDeletionNotFound(BaseAPIException):
+    code: str = 'client_deletion_not_found'
+    message: str = 'The specified client deletion does not exist.'
+    status_code: int = 404
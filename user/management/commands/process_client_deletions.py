@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from user.constants import CLIENT_DELETION_CHUNK_SIZE, ClientDeletionStatus
+from user.services import process_client_deletions
+
+
+class Command(BaseCommand):
+    help = (
+        'Run client deletions that are pending, failed, or were interrupted '
+        'while running.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CLIENT_DELETION_CHUNK_SIZE,
+            help='Rows deleted per statement.',
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be positive')
+
+        deletions = process_client_deletions(
+            chunk_size=options['chunk_size'],
+        )
+        failed = [
+            deletion
+            for deletion in deletions
+            if deletion.status == ClientDeletionStatus.FAILED.value
+        ]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Processed {len(deletions)} client deletions',
+            ),
+        )
+        for deletion in failed:
+            self.stderr.write(
+                f'Deletion {deletion.id} failed: {deletion.error_message}',
+            )
@@ -0,0 +1,63 @@
+# Generated by Django 6.0 on 2026-10-19 08:12
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClientDeletion",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("install_id", models.CharField(max_length=64)),
+                ("status", models.CharField(default="pending", max_length=32)),
+                ("deleted_counts", models.JSONField(blank=True, default=dict)),
+                ("objects_deleted", models.IntegerField(default=0)),
+                ("error_message", models.TextField(blank=True, default="")),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["install_id"], name="user_client_install_ee52d8_idx"
+                    ),
+                    models.Index(
+                        fields=["status"], name="user_client_status_ec1331_idx"
+                    ),
+                ],
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            (
+                                "status__in",
+                                ["pending", "running", "succeeded", "failed"],
+                            )
+                        ),
+                        name="user_clientdeletion_status_valid",
+                    ),
+                ],
+            },
+        ),
+    ]
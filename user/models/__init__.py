@@ -1,3 +1,4 @@
 from user.models.client import Client
+from user.models.client_deletion import ClientDeletion
 
-__all__ = ['Client']
+__all__ = ['Client', 'ClientDeletion']
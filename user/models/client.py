@@ -35,10 +35,16 @@ class Client(models.Model):
         db_index=True,
     )
 
+    # Clients are request.user for requests with X-Install-Id
+    # (see user.authentication.InstallIdAuthentication)
+    is_authenticated = True
+    is_anonymous = False
+
     def touch(self, *, when: timezone.datetime | None = None) -> None:
         """
         Update last_seen_at without changing other fields.
-        Call this whenever the app pings /identify or performs any request.
+        Request activity goes through the buffered tracker instead
+        (see user.services.client_activity).
         """
         self.last_seen_at = when or timezone.now()
         self.save(update_fields=['last_seen_at'])
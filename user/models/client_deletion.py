@@ -0,0 +1,50 @@
+import uuid
+
+from django.db import models
+
+from core.models import TimeStampedModel
+from user.constants import ClientDeletionStatus
+
+
+class ClientDeletion(TimeStampedModel):
+    """
+    A request to delete a client and everything it owns.
+
+    The client's rows are deleted in the background (see
+    user.services.client_deletion) so that DELETE /user/client/me/ returns
+    immediately. Not a foreign key: the client row is deleted last, while
+    this record stays behind for status polling.
+
+    Status lifecycle:
+        pending -> running -> succeeded | failed
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    install_id = models.CharField(max_length=64)
+
+    status = models.CharField(
+        max_length=32,
+        default=ClientDeletionStatus.PENDING.value,
+    )
+
+    # Rows deleted so far, keyed by table name
+    deleted_counts = models.JSONField(default=dict, blank=True)
+    objects_deleted = models.IntegerField(default=0)
+
+    error_message = models.TextField(blank=True, default='')
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['install_id']),
+            models.Index(fields=['status']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(
+                    status__in=[e.value for e in ClientDeletionStatus],
+                ),
+                name='user_clientdeletion_status_valid',
+            ),
+        ]
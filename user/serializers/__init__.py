@@ -1,3 +1,6 @@
+from user.serializers.client_deletion_serializer import (
+    ClientDeletionSerializer,
+)
 from user.serializers.client_serializer import ClientSerializer
 
-__all__ = ['ClientSerializer']
+__all__ = ['ClientDeletionSerializer', 'ClientSerializer']
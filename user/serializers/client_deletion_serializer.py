@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from user.models import ClientDeletion
+
+
+class ClientDeletionSerializer(serializers.ModelSerializer):
+    """Status of a client deletion, polled after DELETE /user/client/me/."""
+
+    class Meta:
+        model = ClientDeletion
+        fields = [
+            'id',
+            'status',
+            'deleted_counts',
+            'objects_deleted',
+            'error_message',
+            'created_at',
+            'completed_at',
+        ]
+        read_only_fields = fields
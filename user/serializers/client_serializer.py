@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from user.models import Client
+from user.services import identify_client
 
 
 class ClientSerializer(serializers.ModelSerializer):
@@ -18,24 +19,13 @@ class ClientSerializer(serializers.ModelSerializer):
         """
         Get or create a client by install_id and update last_seen_at.
 
-        If the client exists, updates last_seen_at.
+        If the client exists, updates last_seen_at and a non-empty label.
         If the client doesn't exist, creates a new one.
 
         Returns:
             Tuple of (client, created) where created is True if new client.
         """
-        install_id = validated_data['install_id']
-        label = validated_data.get('label', '')
-
-        client, created = Client.objects.get_or_create(
-            install_id=install_id,
-            defaults={'label': label},
+        return identify_client(
+            install_id=validated_data['install_id'],
+            label=validated_data.get('label', ''),
         )
-
-        if not created:
-            client.touch()
-            if label and label != client.label:
-                client.label = label
-                client.save(update_fields=['label'])
-
-        return client, created
@@ -1,6 +1,21 @@
 from user.services.client import (
     delete_client,
     get_client,
+    identify_client,
 )
+from user.services.client_deletion import (
+    process_client_deletions,
+    request_client_deletion,
+    run_client_deletion,
+)
+from user.services.client_export import iter_client_export
 
-__all__ = ['delete_client', 'get_client']
+__all__ = [
+    'delete_client',
+    'get_client',
+    'identify_client',
+    'iter_client_export',
+    'process_client_deletions',
+    'request_client_deletion',
+    'run_client_deletion',
+]
@@ -1,6 +1,14 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
 from core.exceptions import catch_and_reraise
 from user.exceptions import ClientNotFound
-from user.models import Client
+from user.models import Client, ClientDeletion
+from user.services.client_cache import get_client_cache
+from user.services.client_deletion import run_client_deletion
 
 
 def get_client(*, install_id: str) -> Client:
@@ -17,16 +25,54 @@ def get_client(*, install_id: str) -> Client:
         return Client.objects.get(install_id=install_id)
 
 
-def delete_client(*, install_id: str) -> None:
+def identify_client(
+    *,
+    install_id: str,
+    label: str = '',
+) -> tuple[Client, bool]:
     """
-    Delete a client by install_id.
+    Create the client for install_id, or update it if it exists, in one
+    INSERT ... ON CONFLICT statement.
 
-    Raises Client.DoesNotExist if not found.
+    An existing client keeps its label unless a non-empty one is given, and
+    its last_seen_at only moves once it is more than
+    CLIENT_ACTIVITY_GRANULARITY seconds old (as with the activity tracker).
+
+    Returns:
+        Tuple of (client, created) where created is True if new client.
     """
-    with catch_and_reraise(
-        Client.DoesNotExist,
-        ClientNotFound,
-        f"Client with install_id '{install_id}' not found",
-    ):
-        client = Client.objects.get(install_id=install_id)
-        client.delete()
+    table = connection.ops.quote_name(Client._meta.db_table)
+    now = timezone.now()
+    granularity = timedelta(seconds=settings.CLIENT_ACTIVITY_GRANULARITY)
+
+    # xmax is 0 only for a row version written by a plain insert
+    client = Client.objects.raw(
+        f'INSERT INTO {table} AS client '
+        '(install_id, label, created_at, last_seen_at) '
+        'VALUES (%s, %s, %s, %s) '
+        'ON CONFLICT (install_id) DO UPDATE SET '
+        "label = CASE WHEN excluded.label <> '' "
+        'THEN excluded.label ELSE client.label END, '
+        'last_seen_at = CASE '
+        'WHEN client.last_seen_at < excluded.last_seen_at - %s '
+        'THEN excluded.last_seen_at ELSE client.last_seen_at END '
+        'RETURNING install_id, label, created_at, last_seen_at, '
+        '(xmax = 0) AS created',
+        [install_id, label, now, now, granularity],
+    )[0]
+
+    if not client.created:
+        get_client_cache().invalidate(install_id)
+    return client, client.created
+
+
+def delete_client(*, install_id: str) -> ClientDeletion:
+    """
+    Delete a client by install_id, with everything it owns, before
+    returning (see run_client_deletion).
+
+    Raises ClientNotFound if not found.
+    """
+    get_client(install_id=install_id)
+    deletion = ClientDeletion.objects.create(install_id=install_id)
+    return run_client_deletion(deletion.id)
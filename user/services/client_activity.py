@@ -0,0 +1,164 @@
+import atexit
+import functools
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+from user.models import Client
+
+
+logger = logging.getLogger(__name__)
+
+
+class ClientActivityTracker:
+    """
+    Per-process buffer of client last_seen_at timestamps.
+
+    Activity is recorded in memory and written in one UPDATE for all
+    buffered clients, by a daemon thread every `flush_interval` seconds once
+    started, or by the recording request once `max_pending` clients are
+    buffered. Nothing is buffered, and no row is written, unless the stored
+    last_seen_at is more than `granularity` seconds older than the new one,
+    so a busy client costs at most one write per granularity.
+    A `flush_interval` of 0 writes on every recorded change.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float,
+        granularity: float,
+        max_pending: int,
+    ):
+        self.flush_interval = flush_interval
+        self.granularity = timedelta(seconds=granularity)
+        self.max_pending = max_pending if flush_interval else 1
+
+        self._pending: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def _is_stale(self, last_seen_at: datetime, when: datetime) -> bool:
+        return last_seen_at < when - self.granularity
+
+    def record(self, client: Client, *, when: datetime | None = None) -> bool:
+        """
+        Note that `client` was seen at `when` (default: now).
+
+        Updates client.last_seen_at in memory when it is stale. Returns True
+        if the timestamp was buffered for the next flush.
+        """
+        when = when or timezone.now()
+        if not self._is_stale(client.last_seen_at, when):
+            return False
+
+        client.last_seen_at = when
+        with self._lock:
+            previous = self._pending.get(client.install_id)
+            if previous is None or previous < when:
+                self._pending[client.install_id] = when
+            full = len(self._pending) >= self.max_pending
+
+        if full:
+            self.flush()
+        return True
+
+    def start(self) -> None:
+        """Start the flusher thread, unless running or writing through."""
+        with self._lock:
+            if not self.flush_interval or self._flusher is not None:
+                return
+            self._stopped.clear()
+            self._flusher = threading.Thread(
+                target=self._run,
+                name='client-activity-flusher',
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def stop(self) -> None:
+        """Stop the flusher thread and flush what is still buffered."""
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._stopped.set()
+            flusher.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Client activity flush failed')
+            finally:
+                # Connections are per thread; do not hold this one idle
+                connection.close()
+
+    def pending(self) -> dict[str, datetime]:
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write buffered timestamps in one statement.
+
+        Returns the number of client rows updated. On a database error the
+        timestamps are kept for the next flush.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        try:
+            return self._write(pending)
+        except DatabaseError:
+            logger.exception(
+                'Failed to flush last_seen_at for %d clients', len(pending)
+            )
+            with self._lock:
+                for install_id, when in pending.items():
+                    current = self._pending.get(install_id)
+                    if current is None or current < when:
+                        self._pending[install_id] = when
+            return 0
+
+    def _write(self, pending: dict[str, datetime]) -> int:
+        table = connection.ops.quote_name(Client._meta.db_table)
+        values = ', '.join(['(%s, %s::timestamptz)'] * len(pending))
+        params: list = []
+        for install_id, when in pending.items():
+            params.extend([install_id, when])
+        params.append(self.granularity)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} AS client '
+                'SET last_seen_at = seen.last_seen_at '
+                f'FROM (VALUES {values}) AS seen(install_id, last_seen_at) '
+                'WHERE client.install_id = seen.install_id '
+                'AND client.last_seen_at < seen.last_seen_at - %s',
+                params,
+            )
+            return cursor.rowcount
+
+
+@functools.cache
+def get_client_activity_tracker() -> ClientActivityTracker:
+    """Process-wide tracker configured from settings."""
+    tracker = ClientActivityTracker(
+        flush_interval=settings.CLIENT_ACTIVITY_FLUSH_INTERVAL,
+        granularity=settings.CLIENT_ACTIVITY_GRANULARITY,
+        max_pending=settings.CLIENT_ACTIVITY_MAX_PENDING,
+    )
+    # Flushes every interval from a daemon thread, and once more at exit
+    tracker.start()
+    atexit.register(tracker.stop)
+    return tracker
@@ -0,0 +1,116 @@
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from user.models import Client
+
+
+@dataclass(frozen=True)
+class CachedClient:
+    client: Client
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class ClientCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class ClientCache:
+    """
+    Per-process LRU of known clients keyed by install_id.
+
+    Entries live for `ttl` seconds, so a client deleted or changed by another
+    process is seen at most `ttl` seconds late. Unknown install_ids are never
+    cached, so a client is usable as soon as it identifies. A `ttl` of 0
+    disables the cache.
+
+    Callers get their own copy of the cached Client, so changes made while
+    handling one request never leak into another.
+    """
+
+    def __init__(self, *, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[str, CachedClient] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def _get_local(self, install_id: str, now: float) -> Client | None:
+        with self._lock:
+            entry = self._entries.get(install_id)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                del self._entries[install_id]
+                return None
+            self._entries.move_to_end(install_id)
+            return copy.copy(entry.client)
+
+    def _set_local(self, client: Client, now: float) -> None:
+        entry = CachedClient(
+            client=copy.copy(client),
+            expires_at=now + self.ttl,
+        )
+        with self._lock:
+            self._entries[client.install_id] = entry
+            self._entries.move_to_end(client.install_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, install_id: str) -> Client | None:
+        """Return the client for install_id, or None if it does not exist."""
+        if not self.enabled:
+            return Client.objects.filter(install_id=install_id).first()
+
+        now = time.monotonic()
+        client = self._get_local(install_id, now)
+        if client is not None:
+            self.hits += 1
+            return client
+
+        self.misses += 1
+        client = Client.objects.filter(install_id=install_id).first()
+        if client is not None:
+            self._set_local(client, now)
+        return client
+
+    def invalidate(self, install_id: str) -> None:
+        with self._lock:
+            self._entries.pop(install_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> ClientCacheStats:
+        return ClientCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+        )
+
+
+@functools.cache
+def get_client_cache() -> ClientCache:
+    """Process-wide cache configured from settings."""
+    return ClientCache(
+        ttl=settings.CLIENT_CACHE_TTL,
+        max_entries=settings.CLIENT_CACHE_MAX_ENTRIES,
+    )
@@ -0,0 +1,331 @@
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from asset.models import Asset, AssetRef, UploadSession
+from asset.services.storage import delete_stored_objects
+from hand.models import (
+    DetectionTile,
+    Hand,
+    HandContext,
+    HandCorrection,
+    HandDetection,
+    HandTile,
+    HandWinModifier,
+)
+from rule.models import Ruleset
+from user.constants import (
+    CLIENT_DELETION_CHUNK_SIZE,
+    CLIENT_DELETION_STALE_MINUTES,
+    ClientDeletionStatus,
+)
+from user.models import Client, ClientDeletion
+from user.services.client_cache import get_client_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DeletionStep:
+    model: type[models.Model]
+    # SQL condition selecting the client's rows, with %s for the install_id
+    where: str
+    # Set this column to NULL instead of deleting the rows
+    nullify: str | None = None
+
+    @property
+    def table(self) -> str:
+        return self.model._meta.db_table
+
+    @property
+    def label(self) -> str:
+        if self.nullify:
+            return f'{self.table}.{self.nullify}'
+        return self.table
+
+
+def _deletion_steps() -> list[DeletionStep]:
+    """
+    The client's rows in dependency order: every row is deleted before the
+    rows it references, so no step relies on ORM or database cascades.
+    """
+    hand = Hand._meta.db_table
+    correction = HandCorrection._meta.db_table
+    detection = HandDetection._meta.db_table
+    asset = Asset._meta.db_table
+    session = UploadSession._meta.db_table
+    # Assets the client owns directly or through its upload sessions, whose
+    # client_id may be unset
+    client_assets = (
+        f'client_id = %s OR upload_session_id IN '
+        f'(SELECT id FROM {session} WHERE client_id = %s)'
+    )
+
+    return [
+        DeletionStep(
+            HandTile,
+            f'hand_correction_id IN '
+            f'(SELECT id FROM {correction} WHERE client_id = %s)',
+        ),
+        DeletionStep(
+            Hand,
+            'client_id = %s AND active_hand_correction_id IS NOT NULL',
+            nullify='active_hand_correction_id',
+        ),
+        DeletionStep(HandCorrection, 'client_id = %s'),
+        DeletionStep(
+            DetectionTile,
+            f'detection_id IN '
+            f'(SELECT id FROM {detection} WHERE client_id = %s)',
+        ),
+        DeletionStep(HandDetection, 'client_id = %s'),
+        DeletionStep(
+            HandWinModifier,
+            f'hand_context_id IN (SELECT id FROM {hand} WHERE client_id = %s)',
+        ),
+        DeletionStep(
+            HandContext,
+            f'hand_id IN (SELECT id FROM {hand} WHERE client_id = %s)',
+        ),
+        DeletionStep(
+            AssetRef,
+            f'asset_id IN (SELECT id FROM {asset} WHERE {client_assets})',
+        ),
+        DeletionStep(Hand, 'client_id = %s'),
+        # Stored objects are deleted together with their rows (_delete_assets)
+        DeletionStep(Asset, client_assets),
+        DeletionStep(UploadSession, 'client_id = %s'),
+        DeletionStep(Ruleset, 'client_id = %s', nullify='client_id'),
+    ]
+
+
+def _run_chunk(step: DeletionStep, install_id: str, chunk_size: int) -> int:
+    pk = step.model._meta.pk.column
+    params = [install_id] * step.where.count('%s') + [chunk_size]
+    selected = f'SELECT {pk} FROM {step.table} WHERE {step.where} LIMIT %s'
+    if step.nullify:
+        sql = (
+            f'UPDATE {step.table} SET {step.nullify} = NULL '
+            f'WHERE {pk} IN ({selected})'
+        )
+    else:
+        sql = f'DELETE FROM {step.table} WHERE {pk} IN ({selected})'
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def _delete_assets(
+    step: DeletionStep,
+    install_id: str,
+    chunk_size: int,
+) -> tuple[int, int]:
+    """
+    Delete a chunk of the client's assets, objects first so that a storage
+    failure leaves the rows behind for the retry. Returns (rows, objects).
+    """
+    params = [install_id] * step.where.count('%s') + [chunk_size]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT id, storage_provider, storage_key FROM {step.table} '
+            f'WHERE {step.where} LIMIT %s',
+            params,
+        )
+        assets = cursor.fetchall()
+    if not assets:
+        return 0, 0
+
+    objects = delete_stored_objects(
+        [(provider, key) for _, provider, key in assets],
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {step.table} WHERE id = ANY(%s::uuid[])',
+            [[asset_id for asset_id, _, _ in assets]],
+        )
+        return cursor.rowcount, objects
+
+
+def _delete_client_rows(deletion: ClientDeletion, chunk_size: int) -> None:
+    for step in _deletion_steps():
+        while True:
+            if step.model is Asset:
+                rows, objects = _delete_assets(
+                    step,
+                    deletion.install_id,
+                    chunk_size,
+                )
+                deletion.objects_deleted += objects
+            else:
+                rows = _run_chunk(step, deletion.install_id, chunk_size)
+
+            if rows:
+                deletion.deleted_counts[step.label] = (
+                    deletion.deleted_counts.get(step.label, 0) + rows
+                )
+                # Also refreshes updated_at, which marks the run as alive
+                deletion.save(
+                    update_fields=[
+                        'deleted_counts',
+                        'objects_deleted',
+                        'updated_at',
+                    ],
+                )
+            if rows < chunk_size:
+                break
+
+
+def _claimable(now: datetime) -> Q:
+    """Deletions not finished and not being worked on by a live run."""
+    stale_before = now - timedelta(minutes=CLIENT_DELETION_STALE_MINUTES)
+    return Q(
+        status__in=[
+            ClientDeletionStatus.PENDING.value,
+            ClientDeletionStatus.FAILED.value,
+        ],
+    ) | Q(
+        status=ClientDeletionStatus.RUNNING.value,
+        updated_at__lt=stale_before,
+    )
+
+
+def _claim(deletion_id: uuid.UUID) -> bool:
+    """Mark a deletion RUNNING unless another run is actively working on it."""
+    now = timezone.now()
+    return bool(
+        ClientDeletion.objects.filter(_claimable(now), id=deletion_id).update(
+            status=ClientDeletionStatus.RUNNING.value,
+            error_message='',
+            updated_at=now,
+        ),
+    )
+
+
+def run_client_deletion(
+    deletion_id: uuid.UUID,
+    *,
+    chunk_size: int = CLIENT_DELETION_CHUNK_SIZE,
+) -> ClientDeletion:
+    """
+    Delete the client of a ClientDeletion and everything it owns.
+
+    Rows are deleted table by table with set-based statements of at most
+    `chunk_size` rows, each committed on its own, so no long transaction or
+    large collection of model instances is needed. A final transaction
+    locks the client row, deletes anything created meanwhile and deletes
+    the client itself.
+
+    Safe to call again for a FAILED or abandoned deletion; a deletion that
+    is already running elsewhere is returned unchanged.
+    """
+    if not _claim(deletion_id):
+        return ClientDeletion.objects.get(id=deletion_id)
+
+    deletion = ClientDeletion.objects.get(id=deletion_id)
+    try:
+        _delete_client_rows(deletion, chunk_size)
+        with transaction.atomic():
+            list(
+                Client.objects.select_for_update().filter(
+                    install_id=deletion.install_id,
+                ),
+            )
+            _delete_client_rows(deletion, chunk_size)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM {Client._meta.db_table} '
+                    'WHERE install_id = %s',
+                    [deletion.install_id],
+                )
+    except Exception as e:
+        logger.exception('Client deletion %s failed', deletion.id)
+        deletion.status = ClientDeletionStatus.FAILED.value
+        deletion.error_message = str(e)
+    else:
+        deletion.status = ClientDeletionStatus.SUCCEEDED.value
+        deletion.completed_at = timezone.now()
+    finally:
+        get_client_cache().invalidate(deletion.install_id)
+
+    deletion.save(
+        update_fields=[
+            'status',
+            'error_message',
+            'completed_at',
+            'updated_at',
+        ],
+    )
+    return deletion
+
+
+def _run_in_background(deletion_id: uuid.UUID) -> None:
+    try:
+        run_client_deletion(deletion_id)
+    finally:
+        # Connections are per thread; do not leave this one open
+        connection.close()
+
+
+def request_client_deletion(client: Client) -> ClientDeletion:
+    """
+    Queue the deletion of a client and everything it owns.
+
+    With CLIENT_DELETION_ASYNC the deletion runs in a background thread
+    once the current transaction commits; otherwise it runs before this
+    returns. A deletion that is already queued or running is returned
+    instead of queueing another. Deletions interrupted by a restart are
+    picked up by the process_client_deletions command.
+    """
+    in_progress = ClientDeletion.objects.filter(
+        install_id=client.install_id,
+        status__in=[
+            ClientDeletionStatus.PENDING.value,
+            ClientDeletionStatus.RUNNING.value,
+        ],
+    ).first()
+    if in_progress is not None:
+        return in_progress
+
+    deletion = ClientDeletion.objects.create(install_id=client.install_id)
+    get_client_cache().invalidate(client.install_id)
+
+    if not settings.CLIENT_DELETION_ASYNC:
+        return run_client_deletion(deletion.id)
+
+    transaction.on_commit(
+        lambda: threading.Thread(
+            target=_run_in_background,
+            args=(deletion.id,),
+            name=f'client-deletion-{deletion.id}',
+            daemon=True,
+        ).start(),
+    )
+    return deletion
+
+
+def process_client_deletions(
+    *,
+    chunk_size: int = CLIENT_DELETION_CHUNK_SIZE,
+) -> list[ClientDeletion]:
+    """
+    Run every pending, failed or abandoned deletion.
+
+    Returns the deletions that were processed.
+    """
+    deletion_ids = list(
+        ClientDeletion.objects.filter(_claimable(timezone.now()))
+        .order_by('created_at')
+        .values_list('id', flat=True),
+    )
+    return [
+        run_client_deletion(deletion_id, chunk_size=chunk_size)
+        for deletion_id in deletion_ids
+    ]
@@ -0,0 +1,120 @@
+import json
+from collections.abc import Iterator
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from asset.models import Asset
+from asset.services.storage import get_storage_backend
+from hand.models import Hand, HandCorrection, HandDetection
+from hand.serializers.hand_correction_serializer import (
+    HandCorrectionSerializer,
+)
+from hand.serializers.hand_detection_serializer import HandDetectionSerializer
+from user.constants import (
+    CLIENT_EXPORT_CHUNK_SIZE,
+    CLIENT_EXPORT_IMAGE_URL_EXPIRY,
+)
+from user.models import Client
+
+
+def _line(record_type: str, data: dict) -> bytes:
+    record = {'type': record_type, **data}
+    return (
+        json.dumps(record, cls=DjangoJSONEncoder, separators=(',', ':')) + '\n'
+    ).encode()
+
+
+def _client_record(client: Client) -> dict:
+    return {
+        'install_id': client.install_id,
+        'label': client.label,
+        'created_at': client.created_at,
+        'last_seen_at': client.last_seen_at,
+    }
+
+
+def _hand_record(hand: Hand) -> dict:
+    record = {
+        'id': hand.id,
+        'source': hand.source,
+        'active_hand_correction_id': hand.active_hand_correction_id,
+        'context': None,
+        'created_at': hand.created_at,
+    }
+    # Reverse one-to-one: absent when the hand has no context
+    context = getattr(hand, 'context', None)
+    if context is not None:
+        record['context'] = {
+            'seat_wind': context.seat_wind,
+            'round_wind': context.round_wind,
+            'win_method': context.win_method,
+            'win_modifiers': [
+                modifier.modifier for modifier in context.win_modifiers.all()
+            ],
+        }
+    return record
+
+
+def _image_url(asset: Asset) -> str:
+    # Not cached: a reused URL could expire well before the export does
+    return get_storage_backend(
+        asset.storage_provider,
+    ).generate_presigned_get_url(
+        bucket_name=settings.STORAGE_BUCKET_IMAGES,
+        object_name=asset.storage_key,
+        expiration=CLIENT_EXPORT_IMAGE_URL_EXPIRY,
+        cached=False,
+    )
+
+
+def iter_client_export(
+    client: Client,
+    *,
+    chunk_size: int = CLIENT_EXPORT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    A client's history as NDJSON lines, oldest first within each type.
+
+    The first line is the client, followed by its hands, detections (with a
+    presigned link to the image) and corrections. Every line is an object
+    with a `type` key. Rows are read through server-side cursors in chunks
+    of `chunk_size`, so memory use does not grow with the history and the
+    first lines are produced before the later queries run.
+    """
+    yield _line('client', _client_record(client))
+
+    hands = (
+        Hand.objects.filter(client_id=client.install_id)
+        .select_related('context')
+        .prefetch_related('context__win_modifiers')
+        .order_by('created_at', 'id')
+    )
+    for hand in hands.iterator(chunk_size=chunk_size):
+        yield _line('hand', _hand_record(hand))
+
+    detections = (
+        HandDetection.objects.filter(client_id=client.install_id)
+        .select_related('asset_ref__asset')
+        # Only read for detections stored before tiles were packed
+        .prefetch_related('tiles')
+        .order_by('created_at', 'id')
+    )
+    for detection in detections.iterator(chunk_size=chunk_size):
+        data = HandDetectionSerializer(instance=detection).data
+        data['image_url'] = _image_url(detection.asset_ref.asset)
+        yield _line('detection', data)
+
+    corrections = (
+        HandCorrection.objects.filter(client_id=client.install_id)
+        .select_related('hand')
+        # Only read for corrections stored before snapshots were packed
+        .prefetch_related('tiles')
+        .order_by('created_at', 'id')
+    )
+    for correction in corrections.iterator(chunk_size=chunk_size):
+        data = HandCorrectionSerializer(instance=correction).data
+        # Write-only on the serializer
+        data['hand_id'] = correction.hand_id
+        data['detection_id'] = correction.detection_id
+        yield _line('correction', data)
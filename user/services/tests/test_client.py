@@ -1,8 +1,13 @@
+from datetime import timedelta
+from unittest.mock import patch
+
 from django.test import TestCase
+from django.utils import timezone
 
 from user.exceptions import ClientNotFound
 from user.models import Client
-from user.services import delete_client, get_client
+from user.services import delete_client, get_client, identify_client
+from user.services.client_cache import ClientCache
 
 
 class TestGetClient(TestCase):
@@ -18,6 +23,68 @@ class TestGetClient(TestCase):
             get_client(install_id='nonexistent')
 
 
+class TestIdentifyClient(TestCase):
+    def test_creates_client_in_one_query(self):
+        with self.assertNumQueries(1):
+            client, created = identify_client(
+                install_id='identify-new',
+                label='Phone',
+            )
+
+        self.assertTrue(created)
+        self.assertEqual(client.label, 'Phone')
+        self.assertEqual(Client.objects.get().install_id, 'identify-new')
+
+    def test_updates_existing_client_in_one_query(self):
+        old_time = timezone.now() - timedelta(hours=1)
+        Client.objects.create(
+            install_id='identify-existing',
+            label='Old',
+            last_seen_at=old_time,
+        )
+
+        with self.assertNumQueries(1):
+            client, created = identify_client(
+                install_id='identify-existing',
+                label='New',
+            )
+
+        self.assertFalse(created)
+        self.assertEqual(client.label, 'New')
+        self.assertGreater(client.last_seen_at, old_time)
+        client.refresh_from_db()
+        self.assertEqual(client.label, 'New')
+        self.assertGreater(client.last_seen_at, old_time)
+
+    def test_keeps_label_when_empty(self):
+        Client.objects.create(install_id='identify-label', label='Keep')
+
+        client, created = identify_client(install_id='identify-label')
+
+        self.assertFalse(created)
+        self.assertEqual(client.label, 'Keep')
+
+    def test_keeps_recent_last_seen_at(self):
+        existing = Client.objects.create(install_id='identify-recent')
+
+        client, _ = identify_client(install_id='identify-recent')
+
+        self.assertEqual(client.last_seen_at, existing.last_seen_at)
+
+    def test_invalidates_cached_client(self):
+        Client.objects.create(install_id='identify-cached', label='Old')
+        cache = ClientCache(ttl=30, max_entries=10)
+        cache.get('identify-cached')
+
+        with patch(
+            'user.services.client.get_client_cache',
+            return_value=cache,
+        ):
+            identify_client(install_id='identify-cached', label='New')
+
+        self.assertEqual(cache.get('identify-cached').label, 'New')
+
+
 class TestDeleteClient(TestCase):
     def test_deletes_client(self):
         Client.objects.create(install_id='delete-test-123')
@@ -29,3 +96,16 @@ class TestDeleteClient(TestCase):
     def test_raises_for_nonexistent_client(self):
         with self.assertRaises(ClientNotFound):
             delete_client(install_id='nonexistent')
+
+    def test_invalidates_cached_client(self):
+        Client.objects.create(install_id='delete-test-123')
+        cache = ClientCache(ttl=30, max_entries=10)
+        cache.get('delete-test-123')
+
+        with patch(
+            'user.services.client_deletion.get_client_cache',
+            return_value=cache,
+        ):
+            delete_client(install_id='delete-test-123')
+
+        self.assertIsNone(cache.get('delete-test-123'))
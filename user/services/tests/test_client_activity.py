@@ -0,0 +1,158 @@
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from user.factories import ClientFactory
+from user.models import Client
+from user.services.client_activity import ClientActivityTracker
+
+
+def make_tracker(**kwargs) -> ClientActivityTracker:
+    options = {'flush_interval': 30, 'granularity': 60, 'max_pending': 100}
+    options.update(kwargs)
+    return ClientActivityTracker(**options)
+
+
+class TestClientActivityTracker(TestCase):
+    def test_recent_activity_is_not_buffered(self):
+        client = ClientFactory()
+        tracker = make_tracker()
+
+        with self.assertNumQueries(0):
+            recorded = tracker.record(
+                client, when=client.last_seen_at + timedelta(seconds=30)
+            )
+
+        self.assertFalse(recorded)
+        self.assertEqual(tracker.pending(), {})
+
+    def test_stale_activity_is_buffered_until_flush(self):
+        now = timezone.now()
+        client = ClientFactory(last_seen_at=now - timedelta(hours=1))
+        tracker = make_tracker()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(tracker.record(client, when=now))
+
+        self.assertEqual(client.last_seen_at, now)
+        self.assertEqual(tracker.pending(), {client.install_id: now})
+        client.refresh_from_db()
+        self.assertEqual(client.last_seen_at, now - timedelta(hours=1))
+
+    def test_flush_writes_all_clients_in_one_query(self):
+        now = timezone.now()
+        clients = [
+            ClientFactory(last_seen_at=now - timedelta(hours=1))
+            for _ in range(3)
+        ]
+        tracker = make_tracker()
+        for client in clients:
+            tracker.record(client, when=now)
+
+        with self.assertNumQueries(1):
+            updated = tracker.flush()
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(tracker.pending(), {})
+        for client in clients:
+            client.refresh_from_db()
+            self.assertEqual(client.last_seen_at, now)
+
+    def test_flush_skips_rows_within_granularity(self):
+        now = timezone.now()
+        client = ClientFactory(last_seen_at=now - timedelta(hours=1))
+        tracker = make_tracker()
+        tracker.record(client, when=now)
+        # Another process already wrote a recent timestamp
+        Client.objects.filter(pk=client.pk).update(
+            last_seen_at=now - timedelta(seconds=10),
+        )
+
+        self.assertEqual(tracker.flush(), 0)
+
+        client.refresh_from_db()
+        self.assertEqual(client.last_seen_at, now - timedelta(seconds=10))
+
+    def test_flush_keeps_latest_timestamp_per_client(self):
+        now = timezone.now()
+        client = ClientFactory(last_seen_at=now - timedelta(hours=2))
+        tracker = make_tracker()
+
+        tracker.record(client, when=now)
+        tracker.record(
+            Client.objects.get(pk=client.pk),
+            when=now - timedelta(hours=1),
+        )
+        tracker.flush()
+
+        client.refresh_from_db()
+        self.assertEqual(client.last_seen_at, now)
+
+    def test_record_does_not_flush_before_max_pending(self):
+        now = timezone.now()
+        clients = ClientFactory.create_batch(
+            3, last_seen_at=now - timedelta(hours=1)
+        )
+        tracker = make_tracker(flush_interval=0.001)
+
+        with self.assertNumQueries(0):
+            for client in clients:
+                tracker.record(client, when=now)
+
+        self.assertEqual(len(tracker.pending()), 3)
+
+    def test_flusher_thread_flushes_every_interval(self):
+        tracker = make_tracker(flush_interval=0.01)
+        flushed = threading.Event()
+
+        with patch.object(tracker, 'flush', side_effect=flushed.set):
+            tracker.start()
+            try:
+                self.assertTrue(flushed.wait(timeout=5))
+            finally:
+                tracker.stop()
+
+    def test_stop_flushes_pending(self):
+        now = timezone.now()
+        client = ClientFactory(last_seen_at=now - timedelta(hours=1))
+        tracker = make_tracker()
+        tracker.start()
+        tracker.record(client, when=now)
+
+        tracker.stop()
+
+        self.assertEqual(tracker.pending(), {})
+        client.refresh_from_db()
+        self.assertEqual(client.last_seen_at, now)
+
+    def test_zero_interval_writes_through(self):
+        now = timezone.now()
+        client = ClientFactory(last_seen_at=now - timedelta(hours=1))
+        tracker = make_tracker(flush_interval=0)
+
+        with self.assertNumQueries(1):
+            tracker.record(client, when=now)
+
+        self.assertEqual(tracker.pending(), {})
+
+    def test_flushes_at_max_pending(self):
+        now = timezone.now()
+        first, second = ClientFactory.create_batch(
+            2, last_seen_at=now - timedelta(hours=1)
+        )
+        tracker = make_tracker(max_pending=2)
+
+        tracker.record(first, when=now)
+        with self.assertNumQueries(1):
+            tracker.record(second, when=now)
+
+        self.assertEqual(tracker.pending(), {})
+
+    def test_flush_without_pending_is_free(self):
+        tracker = make_tracker()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(tracker.flush(), 0)
@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from user.factories import ClientFactory
+from user.models import Client
+from user.services.client_cache import ClientCache
+
+
+class TestClientCache(TestCase):
+    def test_queries_once_within_ttl(self):
+        client = ClientFactory()
+        cache = ClientCache(ttl=30, max_entries=10)
+
+        cache.get(client.install_id)
+        with self.assertNumQueries(0):
+            cached = cache.get(client.install_id)
+
+        self.assertEqual(cached, client)
+        self.assertEqual(cache.stats().hits, 1)
+        self.assertEqual(cache.stats().misses, 1)
+
+    def test_reloads_after_ttl(self):
+        client = ClientFactory()
+        cache = ClientCache(ttl=30, max_entries=10)
+
+        with patch('user.services.client_cache.time.monotonic') as mock_time:
+            mock_time.return_value = 1000.0
+            cache.get(client.install_id)
+
+            mock_time.return_value = 1029.0
+            with self.assertNumQueries(0):
+                cache.get(client.install_id)
+
+            mock_time.return_value = 1030.0
+            with self.assertNumQueries(1):
+                cache.get(client.install_id)
+
+    def test_unknown_install_id_is_not_cached(self):
+        cache = ClientCache(ttl=30, max_entries=10)
+
+        self.assertIsNone(cache.get('unknown'))
+        Client.objects.create(install_id='unknown')
+
+        self.assertEqual(cache.get('unknown').install_id, 'unknown')
+
+    def test_returns_copies(self):
+        client = ClientFactory(label='phone')
+        cache = ClientCache(ttl=30, max_entries=10)
+
+        cache.get(client.install_id).label = 'changed'
+
+        self.assertEqual(cache.get(client.install_id).label, 'phone')
+
+    def test_evicts_least_recently_used(self):
+        first, second, third = ClientFactory.create_batch(3)
+        cache = ClientCache(ttl=30, max_entries=2)
+
+        cache.get(first.install_id)
+        cache.get(second.install_id)
+        cache.get(first.install_id)
+        cache.get(third.install_id)
+
+        self.assertEqual(cache.stats().size, 2)
+        with self.assertNumQueries(0):
+            cache.get(first.install_id)
+        with self.assertNumQueries(1):
+            cache.get(second.install_id)
+
+    def test_invalidate(self):
+        client = ClientFactory()
+        cache = ClientCache(ttl=30, max_entries=10)
+        cache.get(client.install_id)
+
+        cache.invalidate(client.install_id)
+
+        with self.assertNumQueries(1):
+            cache.get(client.install_id)
+
+    def test_disabled_with_zero_ttl(self):
+        client = ClientFactory()
+        cache = ClientCache(ttl=0, max_entries=10)
+
+        cache.get(client.install_id)
+        with self.assertNumQueries(1):
+            cache.get(client.install_id)
+        self.assertEqual(cache.stats().size, 0)
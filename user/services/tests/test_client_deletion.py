@@ -0,0 +1,266 @@
+import io
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from asset.factories import AssetFactory, UploadSessionFactory
+from asset.models import Asset, AssetRef, UploadSession
+from hand.factories import (
+    DetectionTileFactory,
+    HandDetectionFactory,
+    HandWinModifierFactory,
+)
+from hand.models import (
+    DetectionTile,
+    Hand,
+    HandContext,
+    HandCorrection,
+    HandDetection,
+    HandTile,
+    HandWinModifier,
+)
+from rule.models import Ruleset
+from user.constants import ClientDeletionStatus
+from user.factories import ClientFactory
+from user.models import Client, ClientDeletion
+from user.services import (
+    delete_client,
+    process_client_deletions,
+    request_client_deletion,
+    run_client_deletion,
+)
+
+
+def make_history(client, *, detections: int = 2):
+    """Detections with tiles, corrections, contexts and assets for client."""
+    for _ in range(detections):
+        detection = HandDetectionFactory(hand__client=client)
+        DetectionTileFactory(detection=detection)
+        correction = HandCorrection.objects.create(
+            hand=detection.hand,
+            detection=detection,
+            tile_indexes=[0, 1],
+        )
+        HandTile.objects.create(hand_correction=correction, tile_code='1B')
+        detection.hand.active_hand_correction = correction
+        detection.hand.save()
+        HandWinModifierFactory(hand_context__hand=detection.hand)
+    AssetFactory(upload_session=UploadSessionFactory(client=client))
+    Ruleset.objects.create(client=client, name='House', country_code='HK')
+
+
+def assert_client_data_deleted(test: TestCase, install_id: str) -> None:
+    test.assertFalse(Client.objects.filter(install_id=install_id).exists())
+    for model in [Hand, HandDetection, HandCorrection, UploadSession]:
+        test.assertFalse(
+            model.objects.filter(client_id=install_id).exists(),
+            model.__name__,
+        )
+    test.assertFalse(Asset.objects.filter(client_id=install_id).exists())
+    test.assertEqual(DetectionTile.objects.count(), 0)
+    test.assertEqual(HandTile.objects.count(), 0)
+    test.assertEqual(HandContext.objects.count(), 0)
+    test.assertEqual(HandWinModifier.objects.count(), 0)
+    test.assertEqual(AssetRef.objects.count(), 0)
+
+
+@patch('asset.services.storage.S3StorageBackend.delete_objects')
+class TestRunClientDeletion(TestCase):
+    def setUp(self):
+        self.client_obj = ClientFactory()
+        make_history(self.client_obj)
+        self.deletion = ClientDeletion.objects.create(
+            install_id=self.client_obj.install_id,
+        )
+
+    def test_deletes_everything_the_client_owns(self, mock_delete):
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+        other = ClientFactory()
+        make_history(other, detections=1)
+
+        deletion = run_client_deletion(self.deletion.id)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.SUCCEEDED.value)
+        self.assertIsNotNone(deletion.completed_at)
+        self.assertEqual(deletion.objects_deleted, 3)
+        self.assertEqual(deletion.deleted_counts['hand_hand'], 2)
+        self.assertEqual(deletion.deleted_counts['asset_asset'], 3)
+        self.assertFalse(
+            Client.objects.filter(
+                install_id=self.client_obj.install_id,
+            ).exists(),
+        )
+        self.assertFalse(
+            Hand.objects.filter(client=self.client_obj.install_id).exists(),
+        )
+        self.assertEqual(
+            Hand.objects.filter(client=other).count(),
+            1,
+        )
+        self.assertEqual(
+            Ruleset.objects.filter(client__isnull=True).count(),
+            1,
+        )
+
+    def test_deletes_refs_of_session_assets_without_client(
+        self,
+        mock_delete,
+    ):
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+        asset = AssetFactory(
+            upload_session=UploadSessionFactory(client=self.client_obj),
+        )
+        Asset.objects.filter(id=asset.id).update(client=None)
+        AssetRef.attach(
+            asset=asset,
+            owner=Hand.objects.filter(client=self.client_obj).first(),
+        )
+
+        deletion = run_client_deletion(self.deletion.id)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.SUCCEEDED.value)
+        self.assertFalse(Asset.objects.filter(id=asset.id).exists())
+        assert_client_data_deleted(self, self.client_obj.install_id)
+
+    def test_deletes_in_chunks(self, mock_delete):
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+
+        deletion = run_client_deletion(self.deletion.id, chunk_size=1)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.SUCCEEDED.value)
+        assert_client_data_deleted(self, self.client_obj.install_id)
+        # One DeleteObjects call per chunk of assets
+        self.assertEqual(mock_delete.call_count, 3)
+
+    def test_storage_failure_keeps_rows_for_retry(self, mock_delete):
+        mock_delete.side_effect = RuntimeError('storage down')
+
+        deletion = run_client_deletion(self.deletion.id)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.FAILED.value)
+        self.assertIn('storage down', deletion.error_message)
+        self.assertEqual(
+            Asset.objects.filter(client=self.client_obj).count(),
+            3,
+        )
+
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+        deletion = run_client_deletion(self.deletion.id)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.SUCCEEDED.value)
+        assert_client_data_deleted(self, self.client_obj.install_id)
+
+    def test_skips_deletion_running_elsewhere(self, mock_delete):
+        ClientDeletion.objects.filter(id=self.deletion.id).update(
+            status=ClientDeletionStatus.RUNNING.value,
+        )
+
+        deletion = run_client_deletion(self.deletion.id)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.RUNNING.value)
+        self.assertTrue(
+            Client.objects.filter(
+                install_id=self.client_obj.install_id,
+            ).exists(),
+        )
+        mock_delete.assert_not_called()
+
+    def test_resumes_abandoned_deletion(self, mock_delete):
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+        ClientDeletion.objects.filter(id=self.deletion.id).update(
+            status=ClientDeletionStatus.RUNNING.value,
+            updated_at=timezone.now() - timedelta(hours=1),
+        )
+
+        deletions = process_client_deletions()
+
+        self.assertEqual(
+            [deletion.status for deletion in deletions],
+            [ClientDeletionStatus.SUCCEEDED.value],
+        )
+        assert_client_data_deleted(self, self.client_obj.install_id)
+
+    def test_command_processes_pending_deletions(self, mock_delete):
+        mock_delete.side_effect = lambda bucket_name, object_names: len(
+            object_names,
+        )
+        stdout = io.StringIO()
+
+        call_command('process_client_deletions', stdout=stdout)
+
+        self.assertIn('Processed 1 client deletions', stdout.getvalue())
+        self.deletion.refresh_from_db()
+        self.assertEqual(
+            self.deletion.status,
+            ClientDeletionStatus.SUCCEEDED.value,
+        )
+
+
+@patch(
+    'asset.services.storage.S3StorageBackend.delete_objects',
+    return_value=0,
+)
+class TestRequestClientDeletion(TestCase):
+    def test_runs_inline_when_not_async(self, mock_delete):
+        client = ClientFactory()
+
+        deletion = request_client_deletion(client)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.SUCCEEDED.value)
+        self.assertFalse(
+            Client.objects.filter(install_id=client.install_id).exists(),
+        )
+
+    def test_queues_after_commit_when_async(self, mock_delete):
+        client = ClientFactory()
+
+        with (
+            self.settings(CLIENT_DELETION_ASYNC=True),
+            patch('user.services.client_deletion.threading.Thread') as thread,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            deletion = request_client_deletion(client)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.PENDING.value)
+        thread.assert_called_once()
+        thread.return_value.start.assert_called_once()
+        self.assertEqual(thread.call_args.kwargs['args'], (deletion.id,))
+
+    def test_returns_deletion_in_progress(self, mock_delete):
+        client = ClientFactory()
+        in_progress = ClientDeletion.objects.create(
+            install_id=client.install_id,
+        )
+
+        deletion = request_client_deletion(client)
+
+        self.assertEqual(deletion.id, in_progress.id)
+        self.assertEqual(ClientDeletion.objects.count(), 1)
+
+
+@patch(
+    'asset.services.storage.S3StorageBackend.delete_objects',
+    return_value=0,
+)
+class TestDeleteClientHistory(TestCase):
+    def test_deletes_client_with_history(self, mock_delete):
+        client = ClientFactory()
+        make_history(client)
+
+        deletion = delete_client(install_id=client.install_id)
+
+        self.assertEqual(deletion.status, ClientDeletionStatus.SUCCEEDED.value)
+        assert_client_data_deleted(self, client.install_id)
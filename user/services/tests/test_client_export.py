@@ -0,0 +1,145 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.test import TestCase
+
+from asset.services.presign_cache import get_presigned_url_cache
+from asset.services.storage import get_storage_backend
+from hand.factories import HandDetectionFactory, HandWinModifierFactory
+from hand.models import HandCorrection
+from hand.packing import pack_tile_codes
+from user.constants import CLIENT_EXPORT_IMAGE_URL_EXPIRY
+from user.factories import ClientFactory
+from user.services import iter_client_export
+
+
+def read_export(client, **kwargs) -> list[dict]:
+    return [
+        json.loads(line)
+        for line in b''.join(iter_client_export(client, **kwargs)).splitlines()
+    ]
+
+
+@patch(
+    'asset.services.storage.S3StorageBackend.generate_presigned_get_url',
+    return_value='https://images.example/photo.jpg',
+)
+class TestIterClientExport(TestCase):
+    def setUp(self):
+        self.client_obj = ClientFactory(label='Phone')
+        self.detection = HandDetectionFactory(hand__client=self.client_obj)
+        self.hand = self.detection.hand
+        HandWinModifierFactory(hand_context__hand=self.hand)
+        self.correction = HandCorrection.objects.create(
+            hand=self.hand,
+            detection=self.detection,
+            tile_indexes=pack_tile_codes(['1B', '2B']),
+        )
+        self.hand.active_hand_correction = self.correction
+        self.hand.save()
+
+    def test_exports_client_history(self, mock_url):
+        records = read_export(self.client_obj)
+
+        self.assertEqual(
+            [record['type'] for record in records],
+            ['client', 'hand', 'detection', 'correction'],
+        )
+        client, hand, detection, correction = records
+        self.assertEqual(client['install_id'], self.client_obj.install_id)
+        self.assertEqual(client['label'], 'Phone')
+        self.assertEqual(hand['id'], str(self.hand.id))
+        self.assertEqual(hand['context']['win_modifiers'], ['last_tile'])
+        self.assertEqual(
+            hand['active_hand_correction_id'],
+            str(self.correction.id),
+        )
+        self.assertEqual(detection['id'], str(self.detection.id))
+        self.assertEqual(
+            detection['image_url'],
+            'https://images.example/photo.jpg',
+        )
+        self.assertEqual(correction['hand_id'], str(self.hand.id))
+        self.assertEqual(correction['detection_id'], str(self.detection.id))
+        self.assertTrue(correction['is_active'])
+        self.assertEqual(
+            [tile['tile_code'] for tile in correction['tiles']],
+            ['1B', '2B'],
+        )
+
+    def test_excludes_other_clients(self, mock_url):
+        HandDetectionFactory()
+
+        records = read_export(self.client_obj)
+
+        self.assertEqual(len(records), 4)
+
+    def test_hand_without_context(self, mock_url):
+        other = HandDetectionFactory()
+
+        records = read_export(other.hand.client)
+
+        self.assertIsNone(records[1]['context'])
+
+    def test_queries_do_not_grow_with_history(self, mock_url):
+        for _ in range(5):
+            HandDetectionFactory(hand__client=self.client_obj)
+
+        # Detection lookups do not depend on the number of rows per chunk
+        with self.assertNumQueries(6):
+            records = read_export(self.client_obj, chunk_size=100)
+
+        self.assertEqual(len(records), 14)
+
+    def test_starts_before_querying_history(self, mock_url):
+        lines = iter_client_export(self.client_obj)
+
+        with self.assertNumQueries(0):
+            first = json.loads(next(lines))
+
+        self.assertEqual(first['type'], 'client')
+
+
+class TestClientExportImageUrls(TestCase):
+    def setUp(self):
+        get_presigned_url_cache().clear()
+        s3_client = MagicMock()
+        s3_client.generate_presigned_url.side_effect = (
+            lambda operation, Params, ExpiresIn: (
+                f'https://images.example/{Params["Key"]}?expires={ExpiresIn}'
+            )
+        )
+        self.s3_client = s3_client
+        patcher = patch(
+            'asset.services.s3.get_s3_client',
+            return_value=s3_client,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_export_is_not_served_a_cached_short_url(self):
+        detection = HandDetectionFactory()
+        asset = detection.asset_ref.asset
+        # As dispatch_detection does, caching a URL for the default expiry
+        get_storage_backend(asset.storage_provider).generate_presigned_get_url(
+            bucket_name=settings.STORAGE_BUCKET_IMAGES,
+            object_name=asset.storage_key,
+        )
+
+        records = read_export(detection.hand.client)
+
+        self.assertEqual(
+            records[2]['image_url'],
+            f'https://images.example/{asset.storage_key}'
+            f'?expires={CLIENT_EXPORT_IMAGE_URL_EXPIRY}',
+        )
+
+    def test_each_export_signs_its_own_urls(self):
+        detection = HandDetectionFactory()
+
+        read_export(detection.hand.client)
+        read_export(detection.hand.client)
+
+        # A cached URL from the first export would have less than a day left
+        self.assertEqual(self.s3_client.generate_presigned_url.call_count, 2)
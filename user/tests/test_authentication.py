@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from user.authentication import InstallIdAuthentication
+from user.exceptions import ClientNotFound, MissingInstallIdHeader
+from user.factories import ClientFactory
+from user.services.client_cache import ClientCache
+from user.views import get_request_client
+
+
+def make_request(**headers) -> Request:
+    return Request(
+        APIRequestFactory().get('/', **headers),
+        authenticators=[InstallIdAuthentication()],
+    )
+
+
+class TestInstallIdAuthentication(TestCase):
+    def test_resolves_client(self):
+        client = ClientFactory()
+
+        request = make_request(HTTP_X_INSTALL_ID=client.install_id)
+
+        self.assertEqual(request.user, client)
+        self.assertEqual(request.auth, client.install_id)
+        self.assertEqual(get_request_client(request), client)
+
+    def test_resolves_once_per_request(self):
+        client = ClientFactory()
+        request = make_request(HTTP_X_INSTALL_ID=client.install_id)
+
+        with self.assertNumQueries(1):
+            get_request_client(request)
+            get_request_client(request)
+
+    def test_unknown_client_is_anonymous(self):
+        request = make_request(HTTP_X_INSTALL_ID='unknown')
+
+        self.assertFalse(request.user.is_authenticated)
+        with self.assertRaises(ClientNotFound):
+            get_request_client(request)
+
+    def test_missing_header(self):
+        request = make_request()
+
+        with self.assertRaises(MissingInstallIdHeader):
+            get_request_client(request)
+
+    def test_cached_across_requests(self):
+        client = ClientFactory()
+        api_client = APIClient()
+
+        with patch(
+            'user.services.client_cache.get_client_cache',
+            return_value=ClientCache(ttl=30, max_entries=10),
+        ):
+            api_client.get(
+                '/user/client/me/',
+                HTTP_X_INSTALL_ID=client.install_id,
+            )
+            with self.assertNumQueries(0):
+                response = api_client.get(
+                    '/user/client/me/',
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+
+        self.assertEqual(response.data['install_id'], client.install_id)
@@ -1,3 +1,7 @@
-from user.views.client_view import ClientViewSet, get_install_id
+from user.views.client_view import (
+    ClientViewSet,
+    get_install_id,
+    get_request_client,
+)
 
-__all__ = ['ClientViewSet', 'get_install_id']
+__all__ = ['ClientViewSet', 'get_install_id', 'get_request_client']
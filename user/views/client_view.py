@@ -1,15 +1,20 @@
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from user.exceptions import MissingInstallIdHeader
-from user.models import Client
-from user.serializers import ClientSerializer
-from user.services import delete_client, get_client
+from user.authentication import INSTALL_ID_HEADER
+from user.exceptions import (
+    ClientDeletionNotFound,
+    ClientNotFound,
+    MissingInstallIdHeader,
+)
+from user.models import Client, ClientDeletion
+from user.serializers import ClientDeletionSerializer, ClientSerializer
+from user.services import iter_client_export, request_client_deletion
 
-
-INSTALL_ID_HEADER = 'HTTP_X_INSTALL_ID'
+UUID_PATTERN = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
 
 
 def get_install_id(request: Request) -> str:
@@ -21,6 +26,23 @@ def get_install_id(request: Request) -> str:
     return install_id
 
 
+def get_request_client(request: Request) -> Client:
+    """
+    The Client resolved for this request by InstallIdAuthentication.
+
+    Raises:
+        MissingInstallIdHeader: If the request has no X-Install-Id header.
+        ClientNotFound: If no client exists with the given install_id.
+    """
+    if isinstance(request.user, Client):
+        return request.user
+
+    install_id = get_install_id(request)
+    raise ClientNotFound(
+        message=f"Client with install_id '{install_id}' not found",
+    )
+
+
 class ClientViewSet(viewsets.GenericViewSet):
     """
     ViewSet for client identity management.
@@ -29,6 +51,8 @@ class ClientViewSet(viewsets.GenericViewSet):
         PUT /user/client/
         GET /user/client/me/
         DELETE /user/client/me/
+        GET /user/client/me/export/
+        GET /user/client/deletion/{id}/
     """
 
     serializer_class = ClientSerializer
@@ -53,11 +77,13 @@ class ClientViewSet(viewsets.GenericViewSet):
     def me(self, request: Request) -> Response:
         """
         Get or delete the current client identified by X-Install-Id header.
-        """
-        install_id = get_install_id(request)
 
+        DELETE queues the deletion of the client and everything it owns and
+        returns 202 with the deletion, whose progress can be polled at
+        /user/client/deletion/{id}/.
+        """
         if request.method == 'GET':
-            client = get_client(install_id=install_id)
+            client = get_request_client(request)
             response_serializer = self.get_serializer(instance=client)
             return Response(
                 response_serializer.data,
@@ -65,5 +91,47 @@ class ClientViewSet(viewsets.GenericViewSet):
             )
 
         elif request.method == 'DELETE':
-            delete_client(install_id=install_id)
-            return Response(status=status.HTTP_204_NO_CONTENT)
+            deletion = request_client_deletion(get_request_client(request))
+            return Response(
+                ClientDeletionSerializer(instance=deletion).data,
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+    @action(detail=False, methods=['get'], url_path='me/export')
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """
+        Stream the current client's hands, detections and corrections as
+        NDJSON (see user.services.iter_client_export).
+        """
+        client = get_request_client(request)
+        response = StreamingHttpResponse(
+            iter_client_export(client),
+            content_type='application/x-ndjson',
+        )
+        response['Content-Disposition'] = (
+            'attachment; filename="mahjong-export.ndjson"'
+        )
+        return response
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=rf'deletion/(?P<deletion_id>{UUID_PATTERN})',
+    )
+    def deletion(self, request: Request, deletion_id: str) -> Response:
+        """
+        Get the status of a client deletion.
+
+        The X-Install-Id header must name the deleted client.
+        """
+        deletion = ClientDeletion.objects.filter(
+            id=deletion_id,
+            install_id=get_install_id(request),
+        ).first()
+        if deletion is None:
+            raise ClientDeletionNotFound()
+
+        return Response(
+            ClientDeletionSerializer(instance=deletion).data,
+            status=status.HTTP_200_OK,
+        )
@@ -1,8 +1,11 @@
+import json
+
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from user.models import Client
+from user.constants import ClientDeletionStatus
+from user.models import Client, ClientDeletion
 
 
 class TestUpdateEndpoint(TestCase):
@@ -101,7 +104,11 @@ class TestMeEndpoint(TestCase):
             HTTP_X_INSTALL_ID='delete-me',
         )
 
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(
+            response.data['status'],
+            ClientDeletionStatus.SUCCEEDED.value,
+        )
         self.assertEqual(Client.objects.count(), 0)
 
     def test_delete_requires_header(self):
@@ -117,3 +124,62 @@ class TestMeEndpoint(TestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestExportEndpoint(TestCase):
+    def setUp(self):
+        self.api_client = APIClient()
+        self.url = '/user/client/me/export/'
+
+    def test_streams_ndjson(self):
+        Client.objects.create(install_id='export-me', label='Phone')
+
+        response = self.api_client.get(self.url, HTTP_X_INSTALL_ID='export-me')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        records = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual(records[0]['type'], 'client')
+        self.assertEqual(records[0]['install_id'], 'export-me')
+
+    def test_returns_404_for_nonexistent(self):
+        response = self.api_client.get(
+            self.url,
+            HTTP_X_INSTALL_ID='nonexistent',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestDeletionEndpoint(TestCase):
+    def setUp(self):
+        self.api_client = APIClient()
+        self.deletion = ClientDeletion.objects.create(install_id='deleted')
+        self.url = f'/user/client/deletion/{self.deletion.id}/'
+
+    def test_returns_deletion_status(self):
+        response = self.api_client.get(self.url, HTTP_X_INSTALL_ID='deleted')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], str(self.deletion.id))
+        self.assertEqual(
+            response.data['status'],
+            ClientDeletionStatus.PENDING.value,
+        )
+        self.assertNotIn('install_id', response.data)
+
+    def test_requires_header(self):
+        response = self.api_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['code'], 'missing_install_id_header')
+
+    def test_returns_404_for_other_install_id(self):
+        response = self.api_client.get(self.url, HTTP_X_INSTALL_ID='other')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['code'], 'client_deletion_not_found')
@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.testing import QueryCountTestMixin
+from hand.factories import HandDetectionFactory, HandWinModifierFactory
+from hand.models import HandCorrection
+from hand.packing import pack_tile_codes
+from rule.factories import RulesetFactory
+from user.factories import ClientFactory
+from user.models import ClientDeletion
+
+
+def make_history(client, rows: int) -> None:
+    """Detections with corrections, contexts and win modifiers."""
+    for _ in range(rows):
+        detection = HandDetectionFactory(hand__client=client)
+        correction = HandCorrection.objects.create(
+            hand=detection.hand,
+            detection=detection,
+            tile_indexes=pack_tile_codes(['1B', '2B', '3B']),
+        )
+        detection.hand.active_hand_correction = correction
+        detection.hand.save()
+        HandWinModifierFactory(hand_context__hand=detection.hand)
+    RulesetFactory(client=client)
+
+
+class TestClientQueryCounts(QueryCountTestMixin, APITestCase):
+    def test_identify(self):
+        def make_request(rows):
+            client = ClientFactory()
+            make_history(client, rows)
+
+            def request():
+                response = self.client.put(
+                    '/user/client/',
+                    {'install_id': client.install_id},
+                    format='json',
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            return request
+
+        # The upsert
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=1)
+
+    def test_me(self):
+        def make_request(rows):
+            client = ClientFactory()
+            make_history(client, rows)
+
+            def request():
+                response = self.client.get(
+                    '/user/client/me/',
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            return request
+
+        # Client
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=1)
+
+    @patch(
+        'asset.services.storage.S3StorageBackend.generate_presigned_get_url',
+        return_value='https://images.example/photo.jpg',
+    )
+    def test_export(self, mock_url):
+        def make_request(rows):
+            client = ClientFactory()
+            make_history(client, rows)
+
+            def request():
+                response = self.client.get(
+                    '/user/client/me/export/',
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                b''.join(response.streaming_content)
+
+            return request
+
+        # Client, then per chunk: hands with contexts, win modifiers,
+        # detections with assets, their tiles, corrections, their tiles
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=7)
+
+    @patch(
+        'asset.services.storage.S3StorageBackend.delete_objects',
+        side_effect=lambda bucket_name, object_names: len(object_names),
+    )
+    def test_delete(self, mock_delete):
+        def make_request(rows):
+            client = ClientFactory()
+            make_history(client, rows)
+
+            def request():
+                response = self.client.delete(
+                    '/user/client/me/',
+                    HTTP_X_INSTALL_ID=client.install_id,
+                )
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_202_ACCEPTED,
+                )
+
+            return request
+
+        # Chunks are larger than the fixture. Client, in-progress check,
+        # deletion insert, claim and reload (5); one chunk per table, plus a
+        # progress save per non-empty table and the asset lookup (23); the
+        # locked final pass (16); the final status save
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=45)
+
+    def test_deletion_status(self):
+        def make_request(rows):
+            deletion = ClientDeletion.objects.create(
+                install_id=f'deleted-{rows}',
+                deleted_counts={'hand_hand': rows},
+            )
+
+            def request():
+                response = self.client.get(
+                    f'/user/client/deletion/{deletion.id}/',
+                    HTTP_X_INSTALL_ID=deletion.install_id,
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            return request
+
+        # Client (not found), deletion
+        self.assertQueryCountIndependentOfRows(make_request, max_queries=2)